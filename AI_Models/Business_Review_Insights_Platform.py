@@ -1,45 +1,70 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import urllib.parse
-from textblob import TextBlob
 import plotly.express as px
 
+from nanofin.reviews import (
+    conditional_headers,
+    extract_review_texts,
+    find_review_link,
+    get_review_cache,
+    polarity_label,
+    score_reviews,
+    scrape_many,
+    search_url,
+)
+from nanofin.reviews.sentiment import polarity
+from nanofin.reviews.parsing import REQUEST_HEADERS
+from nanofin.reviews.scraper import DEFAULT_TIMEOUT
+
 class ReviewScraper:
-    def __init__(self):
-        pass
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, cache=None):
+        # One pooled session for every request this scraper makes
+        self.session = requests.Session()
+        self.session.headers.update(REQUEST_HEADERS)
+        self.timeout = timeout
+        # Searches, pages and scored reviews are reused across clicks and sessions;
+        # None when the cache file can't be opened, and everything is fetched live
+        self.cache = cache if cache is not None else get_review_cache()
 
     def search_business(self, query: str) -> dict:
         """
         Enhanced search for a business using Bing Search Engine.
         """
-        encoded_query = urllib.parse.quote(f"{query} reviews")
-        search_url = f"https://www.bing.com/search?q={encoded_query}"
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        if self.cache is not None:
+            hit, url = self.cache.get_search(query)
+            if hit:
+                return {"name": query, "url": url}
 
         try:
-            response = requests.get(search_url, headers=headers)
+            response = self.session.get(search_url(query), timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Extract all relevant links
-            links = soup.find_all('a', href=True)
-            for link in links:
-                href = link['href']
-                if "review" in href or "rating" in href:
-                    # Ensure the URL has a scheme
-                    full_url = urllib.parse.urljoin("https://www.bing.com", href)
-                    return {"name": query, "url": full_url}
-
-            return {"name": query, "url": None}
+            url = find_review_link(response.text)
+            if self.cache is not None:
+                self.cache.put_search(query, url)
+            return {"name": query, "url": url}
         except requests.exceptions.RequestException as e:
             st.error(f"Error searching for business: {e}")
             return None
 
+    def fetch_page(self, url: str) -> str:
+        """
+        Page HTML from the cache, revalidating stale copies with ETag/Last-Modified
+        """
+        page = self.cache.get_page(url) if self.cache is not None else None
+        if page and page['fresh']:
+            return page['body']
+
+        response = self.session.get(url, headers=conditional_headers(page), timeout=self.timeout)
+        if response.status_code == 304 and page:
+            self.cache.touch_page(url)
+            return page['body']
+        response.raise_for_status()
+        if self.cache is not None:
+            self.cache.put_page(url, response.text,
+                                response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.text
+
     def scrape_reviews(self, search_result: dict) -> list:
         """
         Enhanced scraping for reviews
@@ -47,55 +72,41 @@ class ReviewScraper:
         if not search_result or not search_result.get('url'):
             return []
 
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            response = requests.get(search_result['url'], headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Attempt to locate review elements
-            review_elements = soup.find_all('p')  # Adjust tag based on website structure
-            reviews = []
-
-            for element in review_elements[:10]:  # Limit to 10 reviews
-                review_text = element.get_text(strip=True)
-                if len(review_text) > 30:  # Filter irrelevant/short texts
-                    sentiment = self.advanced_sentiment_analysis(review_text)
-                    reviews.append({
-                        "text": review_text,
-                        "sentiment_score": sentiment['score'],
-                        "sentiment_label": sentiment['label']
-                    })
+        url = search_result['url']
+        cached = self.cache.get_reviews(url) if self.cache is not None else None
+        if cached is not None:
+            return cached
 
+        try:
+            reviews = self.score_reviews(extract_review_texts(self.fetch_page(url)))
+            if self.cache is not None:
+                self.cache.put_reviews(url, reviews)
             return reviews
         except requests.exceptions.RequestException as e:
             st.error(f"Error scraping reviews: {e}")
             return []
 
+    def scrape_many(self, business_names: list) -> list:
+        """
+        Search and scrape many businesses concurrently (requires aiohttp)
+        """
+        return scrape_many(business_names, timeout=self.timeout,
+                           cache=self.cache, score_reviews=self.score_reviews)
+
+    def score_reviews(self, review_texts: list) -> list:
+        """
+        Score a whole batch of reviews at once (deduplicated, parallel for large batches)
+        """
+        return score_reviews(review_texts)
+
     def advanced_sentiment_analysis(self, text: str) -> dict:
         """
         Perform advanced sentiment analysis using TextBlob
         """
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-
-        # Categorize sentiment
-        if polarity > 0.5:
-            label = "Very Positive"
-        elif polarity > 0:
-            label = "Positive"
-        elif polarity == 0:
-            label = "Neutral"
-        elif polarity > -0.5:
-            label = "Negative"
-        else:
-            label = "Very Negative"
-
+        score = polarity(text)
         return {
-            "score": polarity,
-            "label": label
+            "score": score,
+            "label": polarity_label(score)
         }
 
 def main():
@@ -143,6 +154,35 @@ def main():
             else:
                 st.error("Could not find business information. Please check the name and try again.")
 
+    # Bulk enrichment, e.g. for a lender's applicant list
+    st.sidebar.markdown("---")
+    st.sidebar.header("📋 Bulk Review Enrichment")
+    bulk_names = st.sidebar.text_area("Business names (one per line)")
+
+    if st.sidebar.button("Enrich All"):
+        names = [name.strip() for name in bulk_names.splitlines() if name.strip()]
+        if not names:
+            st.error("Please provide at least one business name")
+        else:
+            with st.spinner(f"Fetching reviews for {len(names)} businesses..."):
+                results = ReviewScraper().scrape_many(names)
+
+            st.header("Bulk Review Summary")
+            summary_df = pd.DataFrame([
+                {
+                    "Business": result['name'],
+                    "Review Page": result['url'],
+                    "Reviews": len(result['reviews']),
+                    "Avg Sentiment": (
+                        sum(r['sentiment_score'] for r in result['reviews']) / len(result['reviews'])
+                        if result['reviews'] else None
+                    ),
+                    "Error": result['error'],
+                }
+                for result in results
+            ])
+            st.dataframe(summary_df)
+
 if __name__ == "__main__":
     main()
 
@@ -1,13 +1,32 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import json
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import re
-import google.generativeai as genai
-from youtube_search import YoutubeSearch
+from concurrent.futures import Future
+
+from nanofin.core import (
+    calculate_financial_metrics,
+    calculate_nano_entrepreneur_score,
+    categorize_descriptions,
+    load_statement,
+)
+from nanofin.insights import get_insight_service, get_video_recommendations
+from nanofin.insights.tips import (
+    LANGUAGES,
+    fallback_tips,
+    get_tip_store,
+    government_resources,
+    score_band,
+    tips_prompt,
+)
+
+TIPS_MODEL = 'gemini-2.0-flash-exp'
+INSIGHTS_MODEL = 'gemini-pro'
+VIDEO_QUERY = "credit score improvement financial literacy"
+# How often a section waiting on Gemini or YouTube re-checks, without blocking the page
+AI_POLL_SECONDS = 2
 
 # Gemini API Configuration
 try:
@@ -15,108 +34,84 @@ try:
     if GOOGLE_API_KEY == "your_gemini_api_key_here":
         GOOGLE_API_KEY = None
         st.sidebar.warning("⚠️ Gemini API key not configured. Some AI features will be limited.")
-    else:
-        genai.configure(api_key=GOOGLE_API_KEY)
 except Exception as e:
     GOOGLE_API_KEY = None
     st.sidebar.info("ℹ️ Running in offline mode. AI features are disabled.")
 
+# Warm the video cache for every language; a no-op once the results are cached
+get_video_recommendations().prefetch(VIDEO_QUERY, LANGUAGES)
+
 class CreditScoreEnhancer:
     def __init__(self, api_key):
-        genai.configure(api_key=api_key)
-        self.languages = {
-            'English': 'en',
-            'Hindi': 'hi',
-            'Kannada': 'kn',
-            'Tamil': 'ta',
-            'Telugu': 'te',
-            'Malayalam': 'ml'
-        }
+        self.api_key = api_key
+        self.insights = get_insight_service(api_key)
+        # Pre-generated tips per language x score band (python -m nanofin.insights.tips)
+        self.tips = get_tip_store()
+        self.languages = LANGUAGES
+
+    def fallback_credit_improvement_tips(self, language='English'):
+        """
+        Offline credit score improvement tips
+        """
+        return fallback_tips(language)
+
+    def credit_improvement_prompt(self, language='English', score=None):
+        """
+        Gemini prompt for localized credit improvement tips
+        """
+        return tips_prompt(language, score_band(score))
+
+    def _store_tips(self, language, band, future):
+        if future.exception() is None and self.tips.get(language, band) is None:
+            self.tips.put(language, band, future.result())
+            self.tips.save()
+
+    def submit_localized_credit_improvement_tips(self, language='English', score=None):
+        """
+        Future for tips in the specified language, or None when offline
+
+        Served from the pre-generated bundles when present. Otherwise Gemini is
+        asked once and its answer is added to the bundles.
+        """
+        band = score_band(score)
+        tips = self.tips.get(language, band)
+        if tips is not None:
+            if self.insights is not None and self.tips.is_stale():
+                self.tips.refresh(self.insights.generator(), wait=False, model=TIPS_MODEL)
+            future = Future()
+            future.set_result(tips)
+            return future
+        if self.insights is None:
+            return None
+        future = self.insights.submit(tips_prompt(language, band), model=TIPS_MODEL)
+        future.add_done_callback(lambda done: self._store_tips(language, band, done))
+        return future
 
     def generate_localized_credit_improvement_tips(self, language='English', score=None):
         """
         Generate credit score improvement tips in the specified language
         """
+        future = self.submit_localized_credit_improvement_tips(language, score)
         # Fallback tips if API is not available
-        if not self.api_key or self.api_key == "your_gemini_api_key_here":
-            fallback_tips = {
-                'English': """
-### Credit Score Improvement Tips
-
-#### 1. Maintain Regular Income
-- Ensure consistent monthly deposits
-- Diversify income sources when possible
-- Keep income documentation updated
-
-#### 2. Manage Expenses Wisely
-- Track all business expenses
-- Avoid unnecessary expenditures
-- Maintain expense-to-income ratio below 70%
-
-#### 3. Build Transaction History
-- Use your bank account regularly
-- Maintain minimum balance requirements
-- Avoid frequent overdrafts
-
-#### 4. Improve Payment Discipline
-- Pay all bills on time
-- Clear any outstanding dues
-- Maintain good relationships with suppliers
-
-#### 5. Plan for Growth
-- Reinvest profits back into business
-- Build emergency fund (3-6 months expenses)
-- Consider business expansion opportunities
-                """,
-                'Hindi': """
-### क्रेडिट स्कोर सुधार के उपाय
-
-#### 1. नियमित आय बनाए रखें
-- मासिक जमा राशि नियमित रखें
-- आय के विभिन्न स्रोत बनाएं
-
-#### 2. खर्च का बेहतर प्रबंधन
-- व्यापारिक खर्चों का हिसाब रखें
-- अनावश्यक खर्चों से बचें
-                """
-            }
-            return fallback_tips.get(language, fallback_tips['English'])
-        
-        prompt = f"""
-        Generate comprehensive, actionable credit score improvement tips 
-        in {language} language. Provide:
-        - 5-7 specific strategies
-        - Detailed explanation for each strategy
-        - Potential impact on credit score
-        - Practical implementation steps
-        
-        Context:
-        - Current language: {language}
-        - Current credit score: {score or 'Not specified'}
-        """
-
+        if future is None:
+            return self.fallback_credit_improvement_tips(language)
         try:
-            model = genai.GenerativeModel('gemini-2.0-flash-exp')
-            response = model.generate_content(prompt)
-            return response.text
+            return future.result()
         except Exception as e:
             return f"Error generating tips: {str(e)}"
 
+    def submit_youtube_recommendations(self, query, language='English'):
+        """
+        Future for YouTube video recommendations; resolved at once when cached
+        """
+        return get_video_recommendations().submit(query, language)
+
     def fetch_youtube_recommendations(self, query, language='English', max_results=5):
         """
         Fetch YouTube video recommendations for credit score improvement
         """
-        localized_query = f"{query} in {language}"
         try:
-            yt_results = YoutubeSearch(localized_query, max_results=max_results).to_dict()
-            return [
-                {
-                    'title': video['title'],
-                    'channel': video['channel'],
-                    'thumbnail': video['thumbnails'][0],
-                    'link': f"https://youtube.com/watch?v={video['id']}"
-                } for video in yt_results
-            ]
+            return self.submit_youtube_recommendations(query, language).result()[:max_results]
         except Exception as e:
             st.error(f"Error fetching YouTube videos: {str(e)}")
             return []
@@ -125,170 +120,51 @@ class CreditScoreEnhancer:
         """
         Fetch government and official financial literacy resources
         """
-        resources = {
-            'English': [
-                {'name': 'RBI Financial Literacy', 'url': 'https://www.rbi.org.in/Scripts/Financial_Literacy.aspx'},
-                {'name': 'SEBI Investor Education', 'url': 'https://www.sebi.gov.in/investor-education.html'}
-            ],
-            'Hindi': [
-                {'name': 'RBI वित्तीय साक्षरता', 'url': 'https://www.rbi.org.in/Scripts/Financial_Literacy.aspx'},
-                {'name': 'SEBI निवेशक शिक्षा', 'url': 'https://www.sebi.gov.in/investor-education.html'}
-            ]
-            # Add more language-specific resources
-        }
-        return resources.get(language, resources['English'])
-
-def clean_date(date_str):
-    """Clean date string by removing INB suffix if present"""
-    return re.sub(r'INB$', '', date_str)
-
-def prepare_transaction_data(transactions):
-    df = pd.DataFrame(transactions)
-    
-    # Clean date strings and convert to datetime
-    df['date'] = df['date'].apply(clean_date)
-    df['date'] = pd.to_datetime(df['date'], format='%d-%m-%y')
-    df['month'] = df['date'].dt.month
-    df['day_of_week'] = df['date'].dt.dayofweek
-    
-    # Convert amount columns to float
-    df['credit'] = pd.to_numeric(df['credit'], errors='coerce').fillna(0)
-    df['debit'] = pd.to_numeric(df['debit'], errors='coerce').fillna(0)
-    df['balance'] = pd.to_numeric(df['balance'], errors='coerce').fillna(0)
-    
-    return df
-
-def categorize_nano_entrepreneur_transactions(description):
-    """Enhanced transaction categorization for nano-entrepreneurs"""
-    categories = {
-        'BUSINESS_INCOME': ['SALARY', 'INVESTMENT', 'BONUS', 'RETURNS', 'CREDIT'],
-        'BUSINESS_EXPENSE': ['UTILITY', 'BILL', 'SHOPPING', 'STORE'],
-        'PERSONAL_EXPENSE': ['COFFEE', 'FOOD', 'BEVERAGES'],
-        'TRANSFER': ['RENT', 'TRANSFER', 'REFUND'],
-        'OTHERS': []
-    }
-    
-    description = str(description).upper()
-    for category, keywords in categories.items():
-        if any(keyword in description for keyword in keywords):
-            return category
-    return 'OTHERS'
-
-def calculate_financial_metrics(df, summary_data):
-    metrics = {}
-    
-    # Basic transaction metrics
-    metrics['total_transactions'] = len(df)
-    metrics['total_credits'] = df['credit'].sum()
-    metrics['total_debits'] = df['debit'].sum()
-    metrics['net_cashflow'] = metrics['total_credits'] - metrics['total_debits']
-    
-    # Balance metrics
-    metrics['opening_balance'] = float(summary_data.get('opening_balance', 0))
-    metrics['closing_balance'] = float(summary_data.get('closing_balance', 0))
-    metrics['avg_balance'] = df['balance'].mean()
-    metrics['balance_volatility'] = df['balance'].std()
-    
-    # Transaction patterns
-    metrics['avg_transaction_size'] = df['debit'][df['debit'] > 0].mean()
-    metrics['transaction_frequency'] = len(df) / 30  # transactions per day
-    
-    # Credit patterns
-    credit_txns = len(df[df['credit'] > 0])
-    metrics['credit_frequency'] = credit_txns / max(len(df), 1)
-    metrics['avg_credit_amount'] = df[df['credit'] > 0]['credit'].mean() if credit_txns > 0 else 0
-    
-    return metrics
+        return government_resources(language)
 
-def calculate_nano_entrepreneur_score(metrics):
+def build_insights_prompt(df, metrics, nano_score):
     """
-    Custom scoring for nano-entrepreneurs considering unique financial patterns
+    Gemini prompt describing the entrepreneur's statement
     """
-    # Income Stability (40 points)
-    income_stability = min(
-        metrics['credit_frequency'] * 20 +  # Frequency of income
-        (metrics['avg_credit_amount'] > 10000) * 20  # Consistent income threshold
-    , 40)
+    top_credit_transaction = df[df['credit'] > 0].sort_values('credit', ascending=False).iloc[0]
+    worst_transaction = df[df['debit'] > 0].sort_values('debit', ascending=False).iloc[0]
     
-    # Business Resilience (30 points)
-    business_resilience = min(
-        (metrics['net_cashflow'] > 0) * 20 +  # Positive cash flow
-        (metrics['balance_volatility'] < metrics['avg_balance'] * 0.3) * 10  # Low balance fluctuation
-    , 30)
+    prompt = f"""
+    Analyze the financial data for a nano entrepreneur with the following details:
     
-    # Transaction Discipline (20 points)
-    transaction_discipline = min(
-        (metrics['transaction_frequency'] > 0.5) * 10 +  # Regular transactions
-        (metrics['avg_transaction_size'] < metrics['avg_credit_amount'] * 0.5) * 10  # Controlled spending
-    , 20)
+    Financial Metrics:
+    - Total Transactions: {metrics['total_transactions']}
+    - Total Credits: ₹{metrics['total_credits']:.2f}
+    - Total Debits: ₹{metrics['total_debits']:.2f}
+    - Net Cashflow: ₹{metrics['net_cashflow']:.2f}
     
-    # Growth Potential (10 points)
-    growth_potential = min(
-        (metrics['closing_balance'] > metrics['opening_balance']) * 5 +
-        (metrics['total_credits'] > metrics['total_debits']) * 5
-    , 10)
+    Nano Entrepreneur Score: {nano_score['score']}/100
+    Score Breakdown:
+    - Income Stability: {nano_score['breakdown']['Income Stability']}
+    - Business Resilience: {nano_score['breakdown']['Business Resilience']}
+    - Transaction Discipline: {nano_score['breakdown']['Transaction Discipline']}
+    - Growth Potential: {nano_score['breakdown']['Growth Potential']}
     
-    # Total Nano-Entrepreneur Score
-    nano_score = income_stability + business_resilience + transaction_discipline + growth_potential
+    Top Credit Transaction:
+    - Date: {top_credit_transaction['date']}
+    - Amount: ₹{top_credit_transaction['credit']}
+    - Description: {top_credit_transaction['description']}
     
-    return {
-        'score': min(max(nano_score, 0), 100),
-        'breakdown': {
-            'Income Stability': income_stability,
-            'Business Resilience': business_resilience,
-            'Transaction Discipline': transaction_discipline,
-            'Growth Potential': growth_potential
-        }
-    }
-
-# 
+    Worst Transaction:
+    - Date: {worst_transaction['date']}
+    - Amount: ₹{worst_transaction['debit']}
+    - Description: {worst_transaction['description']}
+    """
+    return prompt
 
-def generate_ai_insights(df, metrics, nano_score):
+def local_insights(metrics, nano_score):
     """
-    Generate AI-powered insights with fallback for API failures
+    Insights computed from the metrics alone, shown while or instead of AI insights
     """
-    try:
-        # Existing Gemini API logic
-        top_credit_transaction = df[df['credit'] > 0].sort_values('credit', ascending=False).iloc[0]
-        worst_transaction = df[df['debit'] > 0].sort_values('debit', ascending=False).iloc[0]
-        
-        prompt = f"""
-        Analyze the financial data for a nano entrepreneur with the following details:
-        
-        Financial Metrics:
-        - Total Transactions: {metrics['total_transactions']}
-        - Total Credits: ₹{metrics['total_credits']:.2f}
-        - Total Debits: ₹{metrics['total_debits']:.2f}
-        - Net Cashflow: ₹{metrics['net_cashflow']:.2f}
-        
-        Nano Entrepreneur Score: {nano_score['score']}/100
-        Score Breakdown:
-        - Income Stability: {nano_score['breakdown']['Income Stability']}
-        - Business Resilience: {nano_score['breakdown']['Business Resilience']}
-        - Transaction Discipline: {nano_score['breakdown']['Transaction Discipline']}
-        - Growth Potential: {nano_score['breakdown']['Growth Potential']}
-        
-        Top Credit Transaction:
-        - Date: {top_credit_transaction['date']}
-        - Amount: ₹{top_credit_transaction['credit']}
-        - Description: {top_credit_transaction['description']}
-        
-        Worst Transaction:
-        - Date: {worst_transaction['date']}
-        - Amount: ₹{worst_transaction['debit']}
-        - Description: {worst_transaction['description']}
-        """
-        
-        model = genai.GenerativeModel('gemini-pro')
-        response = model.generate_content(prompt)
-        return response.text
+    income_ratio = metrics['total_credits'] / max(metrics['total_debits'], 1)
+    avg_transaction = metrics['total_debits'] / max(metrics['total_transactions'], 1)
     
-    except Exception as e:
-        # Fallback insights based on financial metrics
-        income_ratio = metrics['total_credits'] / max(metrics['total_debits'], 1)
-        avg_transaction = metrics['total_debits'] / max(metrics['total_transactions'], 1)
-        
-        insights = f"""
+    insights = f"""
 ### Financial Health Analysis
 
 #### Income and Expense Analysis
@@ -310,39 +186,118 @@ def generate_ai_insights(df, metrics, nano_score):
 3. {'Review and optimize expenses' if income_ratio < 1.5 else 'Maintain current expense management'}
 4. {'Focus on consistent transactions' if nano_score['breakdown']['Transaction Discipline'] < 15 else 'Keep up disciplined transaction patterns'}
 """
-        return insights
+    return insights
+
+def submit_ai_insights(df, metrics, nano_score):
+    """
+    Future for AI insights, or None when Gemini is unavailable
+    """
+    service = get_insight_service(GOOGLE_API_KEY)
+    if service is None:
+        return None
+    try:
+        prompt = build_insights_prompt(df, metrics, nano_score)
+    except (IndexError, KeyError):
+        # No credit or debit transactions to describe
+        return None
+    return service.submit(prompt, model=INSIGHTS_MODEL)
+
+def generate_ai_insights(df, metrics, nano_score):
+    """
+    Generate AI-powered insights with fallback for API failures
+    """
+    future = submit_ai_insights(df, metrics, nano_score)
+    try:
+        if future is not None:
+            return future.result()
+    except Exception:
+        pass
+    return local_insights(metrics, nano_score)
+
+def draw_result(future, show, fallback, on_error=None):
+    """
+    Draw ``future``'s result if it has arrived, ``on_error`` if it failed, else ``fallback``
+    """
+    if future is not None and future.done():
+        if future.exception() is None:
+            show(future.result())
+            return
+        if on_error is not None:
+            on_error(future.exception())
+            return
+    fallback()
+
+def poll_result(future, show, fallback, on_error=None):
+    """
+    Fragment body: redraw, and rerun the page once the future is done
+    """
+    if future.done():
+        # Results and recent failures are both cached, so the rerun gets a
+        # finished future, draws it without a fragment and stops this polling
+        st.rerun(scope="app")
+    draw_result(future, show, fallback, on_error)
+
+def render_ai_result(future, show, fallback, on_error=None):
+    """
+    Draw a background result here, with ``fallback`` shown until it arrives
+
+    A pending future is polled every ``AI_POLL_SECONDS`` in a fragment, so the
+    script thread never waits on Gemini or YouTube and widgets stay live.
+    Without ``st.fragment`` (Streamlit < 1.37) the result shows on the next rerun.
+    """
+    fragment = getattr(st, 'fragment', None)
+    if future is None or future.done() or fragment is None:
+        draw_result(future, show, fallback, on_error)
+        return
+    fragment(run_every=AI_POLL_SECONDS)(poll_result)(future, show, fallback, on_error)
+
+def render_with_ai(fallback_text, future):
+    """
+    Show AI text once it arrives, and ``fallback_text`` until then or if it fails
+    """
+    show_fallback = lambda *_: st.markdown(fallback_text)
+    render_ai_result(future, st.markdown, show_fallback, on_error=show_fallback)
+
+def show_videos(videos):
+    """
+    Video recommendation cards
+    """
+    if not videos:
+        st.caption("No videos available right now.")
+        return
+    cols = st.columns(len(videos))
+    for i, video in enumerate(videos):
+        with cols[i]:
+            st.image(video['thumbnail'], use_container_width=True)
+            st.write(video['title'])
+            st.link_button("Watch Video", video['link'])
 
 def display_credit_score_improvement_section(credit_score, selected_language):
     """
     Display credit score improvement strategies section
+
+    Tips and videos still being fetched fill in as they arrive.
     """
     st.header("💡 Credit Score Improvement Strategies")
     
     # Initialize Credit Score Enhancer
     enhancer = CreditScoreEnhancer(GOOGLE_API_KEY)
 
-    # Generate Localized Tips
+    # Localized Tips: offline tips now, AI tips once they arrive
     st.subheader(f"Credit Improvement Tips in {selected_language}")
-    tips = enhancer.generate_localized_credit_improvement_tips(
-        language=selected_language, 
-        score=credit_score
+    render_with_ai(
+        enhancer.fallback_credit_improvement_tips(selected_language),
+        enhancer.submit_localized_credit_improvement_tips(language=selected_language, score=credit_score)
     )
-    st.markdown(tips)
 
-    # YouTube Recommendations
+    # YouTube Recommendations: from cache, or filled in once the search returns
     st.subheader("📹 Recommended Learning Videos")
-    videos = enhancer.fetch_youtube_recommendations(
-        "credit score improvement financial literacy", 
-        language=selected_language
+    render_ai_result(
+        enhancer.submit_youtube_recommendations(VIDEO_QUERY, language=selected_language),
+        show_videos,
+        lambda: st.caption("Finding videos..."),
+        on_error=lambda e: st.error(f"Error fetching YouTube videos: {str(e)}"),
     )
-    
-    # Display Video Recommendations
-    cols = st.columns(len(videos))
-    for i, video in enumerate(videos):
-        with cols[i]:
-            st.image(video['thumbnail'], use_container_width=True)
-            st.write(video['title'])
-            st.link_button("Watch Video", video['link'])
 
     # Government Resources
     st.subheader("🏛️ Official Financial Resources")
@@ -375,11 +330,9 @@ def main():
     
     if uploaded_file is not None:
         try:
-            bank_data = json.load(uploaded_file)
-            
-            # Process transactions
-            df = prepare_transaction_data(bank_data['transactions'])
-            df['category'] = df['description'].apply(categorize_nano_entrepreneur_transactions)
+            # Parsed once per statement, then served from the local store
+            bank_data, df = load_statement(uploaded_file)
+            df['category'] = categorize_descriptions(df['description'])
             
             # Calculate financial metrics
             metrics = calculate_financial_metrics(df, bank_data['summary'])
@@ -387,8 +340,8 @@ def main():
             # Nano Entrepreneur Score
             nano_score = calculate_nano_entrepreneur_score(metrics)
             
-            # Generate AI Insights
-            ai_insights = generate_ai_insights(df, metrics, nano_score)
+            # Start AI insights now; the page renders with local insights meanwhile
+            insights_future = submit_ai_insights(df, metrics, nano_score)
             
             # Entrepreneur Profile Section
             st.header("📊 Entrepreneur Profile")
@@ -407,7 +360,7 @@ def main():
             
             # AI-Powered Insights Section
             st.header("🤖 AI-Powered Financial Insights")
-            st.write(ai_insights)
+            render_with_ai(local_insights(metrics, nano_score), insights_future)
             
             # Account Summary
             st.header("💰 Account Summary")
@@ -438,6 +391,7 @@ def main():
                     'BUSINESS_EXPENSE': 'red',
                     'PERSONAL_EXPENSE': 'blue',
                     'TRANSFER': 'orange',
+                    'LOAN_TRANSACTION': 'purple',
                     'OTHERS': 'gray'
                 }
             )
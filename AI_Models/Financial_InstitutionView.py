@@ -1,114 +1,17 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import json
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import re
 
-def clean_date(date_str):
-    """Clean date string by removing INB suffix if present"""
-    return re.sub(r'INB$', '', date_str)
+from nanofin.core import (
+    calculate_financial_metrics,
+    calculate_nano_entrepreneur_score,
+    categorize_descriptions,
+    load_statement,
+)
 
-def prepare_transaction_data(transactions):
-    df = pd.DataFrame(transactions)
-    
-    # Clean date strings and convert to datetime
-    df['date'] = df['date'].apply(clean_date)
-    df['date'] = pd.to_datetime(df['date'], format='%d-%m-%y')
-    df['month'] = df['date'].dt.month
-    df['day_of_week'] = df['date'].dt.dayofweek
-    
-    # Convert amount columns to float
-    df['credit'] = pd.to_numeric(df['credit'], errors='coerce').fillna(0)
-    df['debit'] = pd.to_numeric(df['debit'], errors='coerce').fillna(0)
-    df['balance'] = pd.to_numeric(df['balance'], errors='coerce').fillna(0)
-    
-    return df
-
-def categorize_nano_entrepreneur_transactions(description):
-    """Enhanced transaction categorization for nano-entrepreneurs"""
-    categories = {
-        'BUSINESS_INCOME': ['SALARY', 'INVESTMENT', 'BONUS', 'RETURNS', 'CREDIT'],
-        'BUSINESS_EXPENSE': ['UTILITY', 'BILL', 'SHOPPING', 'STORE'],
-        'PERSONAL_EXPENSE': ['COFFEE', 'FOOD', 'BEVERAGES'],
-        'TRANSFER': ['RENT', 'TRANSFER', 'REFUND'],
-        'OTHERS': []
-    }
-    
-    description = str(description).upper()
-    for category, keywords in categories.items():
-        if any(keyword in description for keyword in keywords):
-            return category
-    return 'OTHERS'
-
-def calculate_financial_metrics(df, summary_data):
-    metrics = {}
-    
-    # Basic transaction metrics
-    metrics['total_transactions'] = len(df)
-    metrics['total_credits'] = df['credit'].sum()
-    metrics['total_debits'] = df['debit'].sum()
-    metrics['net_cashflow'] = metrics['total_credits'] - metrics['total_debits']
-    
-    # Balance metrics
-    metrics['opening_balance'] = float(summary_data.get('opening_balance', 0))
-    metrics['closing_balance'] = float(summary_data.get('closing_balance', 0))
-    metrics['avg_balance'] = df['balance'].mean()
-    metrics['balance_volatility'] = df['balance'].std()
-    
-    # Transaction patterns
-    metrics['avg_transaction_size'] = df['debit'][df['debit'] > 0].mean()
-    metrics['transaction_frequency'] = len(df) / 30  # transactions per day
-    
-    # Credit patterns
-    credit_txns = len(df[df['credit'] > 0])
-    metrics['credit_frequency'] = credit_txns / max(len(df), 1)
-    metrics['avg_credit_amount'] = df[df['credit'] > 0]['credit'].mean() if credit_txns > 0 else 0
-    
-    return metrics
-
-def calculate_nano_entrepreneur_score(metrics):
-    """
-    Custom scoring for nano-entrepreneurs considering unique financial patterns
-    """
-    # Income Stability (40 points)
-    income_stability = min(
-        metrics['credit_frequency'] * 20 +  # Frequency of income
-        (metrics['avg_credit_amount'] > 10000) * 20  # Consistent income threshold
-    , 40)
-    
-    # Business Resilience (30 points)
-    business_resilience = min(
-        (metrics['net_cashflow'] > 0) * 20 +  # Positive cash flow
-        (metrics['balance_volatility'] < metrics['avg_balance'] * 0.3) * 10  # Low balance fluctuation
-    , 30)
-    
-    # Transaction Discipline (20 points)
-    transaction_discipline = min(
-        (metrics['transaction_frequency'] > 0.5) * 10 +  # Regular transactions
-        (metrics['avg_transaction_size'] < metrics['avg_credit_amount'] * 0.5) * 10  # Controlled spending
-    , 20)
-    
-    # Growth Potential (10 points)
-    growth_potential = min(
-        (metrics['closing_balance'] > metrics['opening_balance']) * 5 +
-        (metrics['total_credits'] > metrics['total_debits']) * 5
-    , 10)
-    
-    # Total Nano-Entrepreneur Score
-    nano_score = income_stability + business_resilience + transaction_discipline + growth_potential
-    
-    return {
-        'score': min(max(nano_score, 0), 100),
-        'breakdown': {
-            'Income Stability': income_stability,
-            'Business Resilience': business_resilience,
-            'Transaction Discipline': transaction_discipline,
-            'Growth Potential': growth_potential
-        }
-    }
 
 def main():
     st.set_page_config(page_title="Nano Entrepreneur Financial Analysis", layout="wide")
@@ -118,11 +21,9 @@ def main():
     
     if uploaded_file is not None:
         try:
-            bank_data = json.load(uploaded_file)
-            
-            # Process transactions
-            df = prepare_transaction_data(bank_data['transactions'])
-            df['category'] = df['description'].apply(categorize_nano_entrepreneur_transactions)
+            # Parsed once per statement, then served from the local store
+            bank_data, df = load_statement(uploaded_file)
+            df['category'] = categorize_descriptions(df['description'])
             
             # Customer Information
             st.header("Entrepreneur Profile")
@@ -205,6 +106,7 @@ def main():
                     'BUSINESS_EXPENSE': 'red',
                     'PERSONAL_EXPENSE': 'blue',
                     'TRANSFER': 'orange',
+                    'LOAN_TRANSACTION': 'purple',
                     'OTHERS': 'gray'
                 }
                 )
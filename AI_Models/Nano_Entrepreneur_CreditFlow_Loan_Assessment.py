@@ -1,77 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import json
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import re
 
-def clean_date(date_str):
-    """Clean date string by removing INB suffix if present"""
-    return re.sub(r'INB$', '', str(date_str))
+from nanofin.core import categorize_descriptions, load_statement, statement_digest
+from nanofin.loans import analyze_loans
 
-def prepare_transaction_data(transactions):
-    df = pd.DataFrame(transactions)
-    
-    # Clean date strings and convert to datetime
-    df['date'] = df['date'].apply(clean_date)
-    df['date'] = pd.to_datetime(df['date'], format='%d-%m-%y')
-    df['month'] = df['date'].dt.month
-    df['day_of_week'] = df['date'].dt.dayofweek
-    
-    # Convert amount columns to float
-    df['credit'] = pd.to_numeric(df['credit'], errors='coerce').fillna(0)
-    df['debit'] = pd.to_numeric(df['debit'], errors='coerce').fillna(0)
-    df['balance'] = pd.to_numeric(df['balance'], errors='coerce').fillna(0)
-    
-    return df
-
-def categorize_transactions(description):
-    """Enhanced transaction categorization"""
-    description = str(description).upper()
-    categories = {
-        'BUSINESS_INCOME': ['SALARY', 'INVESTMENT', 'BONUS', 'RETURNS', 'CREDIT'],
-        'BUSINESS_EXPENSE': ['UTILITY', 'BILL', 'SHOPPING', 'STORE'],
-        'PERSONAL_EXPENSE': ['COFFEE', 'FOOD', 'BEVERAGES'],
-        'TRANSFER': ['RENT', 'TRANSFER', 'REFUND'],
-        'LOAN_TRANSACTION': ['LOAN', 'REPAYMENT'],
-        'OTHERS': []
-    }
-    
-    for category, keywords in categories.items():
-        if any(keyword in description for keyword in keywords):
-            return category
-    return 'OTHERS'
-
-def detect_loan_transactions(df):
-    """
-    Detect and analyze potential loan transactions
-    
-    Returns:
-    dict: Comprehensive loan transaction insights
-    """
-    # Identify potential loan receipt and repayment transactions
-    loan_receipt_txns = df[df['description'].str.contains('Loan', case=False, na=False) & (df['credit'] > 0)]
-    loan_repayment_txns = df[df['description'].str.contains('Repayment', case=False, na=False) & (df['debit'] > 0)]
-    
-    # If no loan transactions found, return None
-    if loan_receipt_txns.empty or loan_repayment_txns.empty:
-        return None
-    
-    # Calculate loan details
-    loan_insights = {
-        'total_loan_amount': loan_receipt_txns['credit'].sum(),
-        'total_repaid': loan_repayment_txns['debit'].sum(),
-        'loan_receipt_dates': loan_receipt_txns['date'].tolist(),
-        'repayment_dates': loan_repayment_txns['date'].tolist(),
-        'repayment_count': len(loan_repayment_txns),
-        'repayment_amounts': loan_repayment_txns['debit'].tolist(),
-        'repayment_percentage': (loan_repayment_txns['debit'].sum() / loan_receipt_txns['credit'].sum()) * 100,
-        'interest_rate' : ((loan_repayment_txns['debit'].sum() / loan_receipt_txns['credit'].sum()) - 1) * 100
-    }
-    
-    return loan_insights
 
 def calculate_financial_metrics(df, summary_data):
     """Calculate comprehensive financial metrics"""
@@ -96,7 +32,7 @@ def calculate_loan_worthiness_score(metrics, loan_insights=None):
     
     Parameters:
     - metrics: Financial metrics dictionary
-    - loan_insights: Optional loan transaction insights
+    - loan_insights: Optional loan assessment from analyze_loans
     
     Returns:
     dict: Loan worthiness score with breakdown
@@ -115,9 +51,11 @@ def calculate_loan_worthiness_score(metrics, loan_insights=None):
     # Loan repayment history (if available)
     loan_reliability = 0
     if loan_insights:
+        behaviour = loan_insights['behaviour']
         loan_reliability = min(
-            (loan_insights['repayment_percentage'] > 80) * 0.15 +  # High repayment percentage
-            (loan_insights['repayment_count'] > 3) * 0.05  # Multiple repayments
+            (loan_insights['repayment_percentage'] > 80) * 0.1 +  # High repayment percentage
+            (behaviour['on_time_ratio'] >= 0.8) * 0.05 +  # Installments paid on schedule
+            (behaviour['days_past_due'] <= 30) * 0.05  # Never seriously behind
         , 0.2)
     
     # Growth potential
@@ -148,14 +86,13 @@ def main():
     if uploaded_file is not None:
         try:
             # Load and process bank data
-            bank_data = json.load(uploaded_file)
+            # Parsed once per statement, then served from the local store
+            digest = statement_digest(uploaded_file)
+            bank_data, df = load_statement(uploaded_file, digest=digest)
+            df['category'] = categorize_descriptions(df['description'])
             
-            # Prepare transaction data
-            df = prepare_transaction_data(bank_data['transactions'])
-            df['category'] = df['description'].apply(categorize_transactions)
-            
-            # Detect loan transactions
-            loan_insights = detect_loan_transactions(df)
+            # Detect loan transactions and fit their repayment schedules (cached per statement)
+            loan_insights = analyze_loans(df=df, digest=digest)
             
             # Calculate financial metrics
             metrics = calculate_financial_metrics(df, bank_data.get('summary', {}))
@@ -213,10 +150,17 @@ def main():
                     st.metric("Interest Rate", f"{loan_insights['interest_rate']:.2f}%")
                 
                 with col2:
-                    st.write("Loan Receipt Dates:")
-                    st.write(loan_insights['loan_receipt_dates'])
-                    st.write("Repayment Dates:")
-                    st.write(loan_insights['repayment_dates'])
+                    behaviour = loan_insights['behaviour']
+                    effective_rate = behaviour['effective_rate']
+                    st.metric("Effective Annual Rate", "N/A" if pd.isna(effective_rate) else f"{effective_rate:.2f}%")
+                    st.metric("On-Time Installments", f"{behaviour['on_time_ratio']:.0%}")
+                    st.metric("Days Past Due", f"{behaviour['days_past_due']:.0f}")
+                    st.metric("Open / Closed Loans", f"{behaviour['open_loans']} / {behaviour['closed_loans']}")
+                
+                st.subheader(f"Loans Received ({loan_insights['loan_count']})")
+                st.dataframe(loan_insights['amortization'], use_container_width=True)
+                with st.expander("Repayment Schedule"):
+                    st.dataframe(loan_insights['schedule'], use_container_width=True)
             
             # Transaction Analysis Section
             st.header("📊 Financial Transaction Analysis")
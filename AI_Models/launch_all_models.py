@@ -1,13 +1,57 @@
+import argparse
 import subprocess
 import time
 import webbrowser
 import os
 import sys
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Streamlit's health endpoint moved in 1.18; older releases only answer /healthz
+HEALTH_PATHS = ("/_stcore/health", "/healthz")
+PROBE_TIMEOUT = 1.0
+PROBE_INTERVAL = 0.25
+STARTUP_TIMEOUT = 60.0
+MONITOR_INTERVAL = 2.0
+# An app that misses this many health checks in a row is restarted
+MAX_HEALTH_FAILURES = 3
+RESTART_BACKOFF = 1.0
+MAX_RESTART_BACKOFF = 60.0
+# The backoff resets once a restarted app has stayed up this long
+STABLE_AFTER = 60.0
+MAX_RESTARTS = 5
+STOP_TIMEOUT = 5.0
+LOG_DIR_ENV_VAR = "NANOFIN_LOG_DIR"
+DEFAULT_LOG_DIR = Path.home() / ".cache" / "nanofin" / "logs"
+# Every model as pages of one app, in one process
+MULTIPAGE_APP = {
+    "NanoFin": {
+        "file": "nanofin_app.py",
+        "port": 8510,
+        "description": "All models as one multipage app (pages load on first visit)"
+    }
+}
+
+
+def probe_health(url, timeout=PROBE_TIMEOUT):
+    """True when the Streamlit server at ``url`` answers its health check"""
+    for path in HEALTH_PATHS:
+        try:
+            with urllib.request.urlopen(url + path, timeout=timeout) as response:
+                return response.status == 200
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                return False
+        except (urllib.error.URLError, OSError):
+            return False
+    return False
+
 class NanoFinLauncher:
-    def __init__(self):
-        self.models = {
+    def __init__(self, separate=False):
+        self.separate = separate
+        self.models = MULTIPAGE_APP if not separate else {
             "Local Credit Analysis": {
                 "file": "Local_Credit_Analysis.py",
                 "port": 8501,
@@ -34,7 +78,7 @@ class NanoFinLauncher:
                 "description": "Business insights and review platform"
             },
             "Enhanced Loan Marketplace": {
-                "file": "Enhanced_NanoFin_Loan_Marketplace.py", 
+                "file": "Enhanced_CreditWorthy_Loan_Marketplace.py",
                 "port": 8506,
                 "description": "Comprehensive loan marketplace"
             },
@@ -46,12 +90,17 @@ class NanoFinLauncher:
         }
         self.processes = {}
         self.ai_models_dir = Path(__file__).parent
+        self.log_dir = Path(os.environ.get(LOG_DIR_ENV_VAR) or DEFAULT_LOG_DIR)
+        self.stopping = False
 
     def print_banner(self):
         print("=" * 60)
         print("NANOFIN AI MODELS LAUNCHER")
         print("=" * 60)
-        print("Starting all AI models simultaneously...")
+        if self.separate:
+            print("Starting all AI models in parallel...")
+        else:
+            print("Starting all AI models as one multipage app...")
         print()
 
     def check_dependencies(self):
@@ -70,8 +119,44 @@ class NanoFinLauncher:
             print("[ERROR] Pandas not found. Installing...")
             subprocess.run([sys.executable, "-m", "pip", "install", "pandas"])
 
+    def command_for(self, file_path, port):
+        """Command line that serves one model"""
+        return [
+            sys.executable, "-m", "streamlit", "run",
+            str(file_path),
+            "--server.port", str(port),
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false"
+        ]
+
+    def spawn(self, name):
+        """(Re)start the process for an app already registered in ``self.processes``"""
+        info = self.processes[name]
+        # Output goes straight to a log file, so a chatty app can never block on a full pipe
+        log = open(info['log_path'], "ab")
+        log.write(f"\n===== {time.strftime('%Y-%m-%d %H:%M:%S')} starting {name} =====\n".encode())
+        log.flush()
+        try:
+            process = subprocess.Popen(
+                self.command_for(info['file_path'], info['port']),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                cwd=str(self.ai_models_dir)
+            )
+        finally:
+            # The child holds its own handle
+            log.close()
+        info.update({
+            'process': process,
+            'started_at': time.monotonic(),
+            'ready': False,
+            'ready_at': None,
+            'health_failures': 0,
+        })
+
     def start_model(self, name, model_info):
-        """Start a single Streamlit model"""
+        """Start a single Streamlit model without waiting for it to come up"""
         file_path = self.ai_models_dir / model_info["file"]
         
         if not file_path.exists():
@@ -81,34 +166,59 @@ class NanoFinLauncher:
         print(f"[STARTING] {name} on port {model_info['port']}...")
         
         try:
-            # Start Streamlit process
-            process = subprocess.Popen([
-                sys.executable, "-m", "streamlit", "run", 
-                str(file_path),
-                "--server.port", str(model_info['port']),
-                "--server.headless", "true",
-                "--browser.gatherUsageStats", "false"
-            ], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            cwd=str(self.ai_models_dir)
-            )
-            
             self.processes[name] = {
-                'process': process,
+                'file_path': file_path,
                 'port': model_info['port'],
-                'url': f"http://localhost:{model_info['port']}"
+                'url': f"http://localhost:{model_info['port']}",
+                'log_path': self.log_dir / f"{file_path.stem}.log",
+                'restarts': 0,
+                'next_restart': None,
             }
-            
-            print(f"[SUCCESS] {name} started successfully on port {model_info['port']}")
+            self.spawn(name)
             return True
             
         except Exception as e:
+            self.processes.pop(name, None)
             print(f"[ERROR] Failed to start {name}: {str(e)}")
             return False
 
+    def wait_until_ready(self, names, timeout=STARTUP_TIMEOUT):
+        """
+        Probe every app's health endpoint until it answers, exits or times out
+
+        Probes run concurrently, so the wait is as long as the slowest app,
+        not the sum of all of them. Returns the names that came up.
+        """
+        pending = set(names)
+        probes = {}
+        deadline = time.monotonic() + timeout
+        with ThreadPoolExecutor(max_workers=max(1, len(pending))) as pool:
+            while pending and time.monotonic() < deadline:
+                for name in list(pending):
+                    info = self.processes[name]
+                    if info['process'].poll() is not None:
+                        print(f"[ERROR] {name} exited with code {info['process'].returncode} "
+                              f"during startup (log: {info['log_path']})")
+                        pending.discard(name)
+                    elif name not in probes:
+                        probes[name] = pool.submit(probe_health, info['url'])
+                    elif probes[name].done():
+                        # A slow app only delays its own next probe, never the others'
+                        if probes.pop(name).result():
+                            info['ready'] = True
+                            info['ready_at'] = time.monotonic()
+                            print(f"[READY] {name:<30} {info['ready_at'] - info['started_at']:.1f}s")
+                            pending.discard(name)
+
+                if pending:
+                    time.sleep(PROBE_INTERVAL)
+
+        for name in pending:
+            print(f"[WARNING] {name} not ready after {timeout:.0f}s (log: {self.processes[name]['log_path']})")
+        return [name for name in names if self.processes[name]['ready']]
+
     def start_all_models(self):
-        """Start all AI models"""
+        """Start all AI models in parallel and wait for them to come up"""
         self.print_banner()
         self.check_dependencies()
         
@@ -116,75 +226,140 @@ class NanoFinLauncher:
         for i, (name, info) in enumerate(self.models.items(), 1):
             print(f"[{i}] {name} - {info['description']}")
         
-        print(f"\n[STARTING] {len(self.models)} AI models...")
+        print(f"\n[STARTING] {len(self.models)} Streamlit server(s)...")
+        print(f"[INFO] Logs: {self.log_dir}")
         print("-" * 60)
         
-        success_count = 0
-        for name, model_info in self.models.items():
-            if self.start_model(name, model_info):
-                success_count += 1
-            time.sleep(2)  # Wait between starts to avoid conflicts
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        started_at = time.monotonic()
+        started = [name for name, model_info in self.models.items() if self.start_model(name, model_info)]
+        ready = self.wait_until_ready(started)
         
         print("-" * 60)
-        print(f"[SUCCESS] Successfully started {success_count}/{len(self.models)} models")
+        print(f"[SUCCESS] {len(ready)}/{len(self.models)} apps ready "
+              f"in {time.monotonic() - started_at:.1f}s")
         
-        if success_count > 0:
+        if ready:
             self.show_access_info()
             self.open_browsers()
         
-        return success_count
+        return len(started)
 
     def show_access_info(self):
         """Display access information for all running models"""
         print("\n[INFO] Access URLs:")
         print("-" * 60)
         for name, process_info in self.processes.items():
-            print(f"[MODEL] {name:<30} {process_info['url']}")
+            status = "" if process_info['ready'] else "  (not ready)"
+            print(f"[MODEL] {name:<30} {process_info['url']}{status}")
         
         print("\n[TIPS]")
-        print("• Wait 30-60 seconds for all models to fully load")
-        print("• Each model runs independently on its own port")
-        print("• Use Ctrl+C to stop this launcher")
-        print("• Models will continue running in background")
+        print(f"• App output is written to {self.log_dir}")
+        if self.separate:
+            print("• Each model runs independently on its own port")
+        else:
+            print("• Every model is a page of this one app: pick it from the sidebar")
+            print("• Run with --separate to give each model its own port (8501-8507)")
+        print("• Crashed or unresponsive models are restarted automatically")
+        print("• Use Ctrl+C to stop this launcher and all models")
 
     def open_browsers(self):
-        """Open browser tabs for all running models"""
-        print(f"\n[BROWSER] Opening {len(self.processes)} browser tabs...")
+        """Open browser tabs for all models that are ready"""
+        ready = {name: info for name, info in self.processes.items() if info['ready']}
+        print(f"\n[BROWSER] Opening {len(ready)} browser tabs...")
         
-        for name, process_info in self.processes.items():
+        for name, process_info in ready.items():
             try:
                 webbrowser.open(process_info['url'])
-                time.sleep(1)  # Small delay between opens
             except Exception as e:
                 print(f"[WARNING] Could not open browser for {name}: {e}")
 
+    def restart_delay(self, restarts):
+        """Exponential backoff before the ``restarts``-th consecutive restart"""
+        return min(MAX_RESTART_BACKOFF, RESTART_BACKOFF * (2 ** restarts))
+
+    def schedule_restart(self, name, reason):
+        info = self.processes[name]
+        if info['restarts'] >= MAX_RESTARTS:
+            if info['next_restart'] != float("inf"):
+                print(f"[ERROR] {name} {reason}; giving up after {MAX_RESTARTS} restarts "
+                      f"(log: {info['log_path']})")
+                info['next_restart'] = float("inf")
+            return
+        delay = self.restart_delay(info['restarts'])
+        info['next_restart'] = time.monotonic() + delay
+        print(f"[WARNING] {name} {reason}; restarting in {delay:.0f}s")
+
+    def check_processes(self, pool):
+        """One supervision pass: health-check live apps and (re)start crashed ones"""
+        now = time.monotonic()
+        live = {}
+        for name, info in self.processes.items():
+            if info['next_restart'] is not None:
+                if now >= info['next_restart']:
+                    info['restarts'] += 1
+                    info['next_restart'] = None
+                    print(f"[RESTARTING] {name} (attempt {info['restarts']})")
+                    self.spawn(name)
+            elif info['process'].poll() is not None:
+                self.schedule_restart(name, f"exited with code {info['process'].returncode}")
+            else:
+                live[name] = pool.submit(probe_health, info['url'])
+
+        for name, check in live.items():
+            info = self.processes[name]
+            if check.result():
+                if not info['ready']:
+                    info['ready'] = True
+                    info['ready_at'] = time.monotonic()
+                    print(f"[READY] {name:<30} {info['ready_at'] - info['started_at']:.1f}s")
+                info['health_failures'] = 0
+                if info['restarts'] and time.monotonic() - info['ready_at'] >= STABLE_AFTER:
+                    info['restarts'] = 0
+            elif info['ready'] or time.monotonic() - info['started_at'] > STARTUP_TIMEOUT:
+                info['health_failures'] += 1
+                if info['health_failures'] >= MAX_HEALTH_FAILURES:
+                    self.terminate(info['process'])
+                    self.schedule_restart(name, "stopped answering health checks")
+
     def monitor_processes(self):
-        """Monitor running processes"""
-        print("\n[MONITOR] Monitoring processes... (Press Ctrl+C to stop)")
+        """Supervise running processes until interrupted"""
+        print("\n[MONITOR] Supervising processes... (Press Ctrl+C to stop)")
         try:
-            while True:
-                running_count = 0
-                for name, process_info in self.processes.items():
-                    if process_info['process'].poll() is None:
-                        running_count += 1
-                    else:
-                        print(f"[WARNING] {name} has stopped")
-                
-                if running_count == 0:
-                    print("[ERROR] All processes have stopped")
-                    break
-                    
-                time.sleep(10)  # Check every 10 seconds
+            with ThreadPoolExecutor(max_workers=max(1, len(self.processes))) as pool:
+                while True:
+                    self.check_processes(pool)
+                    if all(info['next_restart'] == float("inf") for info in self.processes.values()):
+                        print("[ERROR] All processes have stopped")
+                        break
+                    time.sleep(MONITOR_INTERVAL)
                 
         except KeyboardInterrupt:
             print("\n[STOP] Stopping all processes...")
             self.stop_all_processes()
 
+    def terminate(self, process, timeout=STOP_TIMEOUT):
+        """Terminate a process, killing it if it does not exit in time"""
+        if process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
     def stop_all_processes(self):
         """Stop all running processes"""
+        if self.stopping:
+            return
+        self.stopping = True
         for name, process_info in self.processes.items():
-            try:
+            if process_info['process'].poll() is None:
                 process_info['process'].terminate()
+        for name, process_info in self.processes.items():
+            try:
+                self.terminate(process_info['process'])
                 print(f"[STOPPED] {name}")
             except Exception as e:
                 print(f"[WARNING] Error stopping {name}: {e}")
@@ -203,7 +378,11 @@ class NanoFinLauncher:
             self.stop_all_processes()
 
 def main():
-    launcher = NanoFinLauncher()
+    parser = argparse.ArgumentParser(description="Launch the NanoFin AI models")
+    parser.add_argument("--separate", action="store_true",
+                        help="run every model as its own Streamlit server (ports 8501-8507)")
+    args = parser.parse_args()
+    launcher = NanoFinLauncher(separate=args.separate)
     launcher.run()
 
 if __name__ == "__main__":
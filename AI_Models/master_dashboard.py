@@ -1,15 +1,124 @@
 import streamlit as st
-import requests
 import time
 from pathlib import Path
 
+from nanofin.services import get_status_probe
+from nanofin_app import MULTIPAGE_PORT, PAGES, page_url_path
+
+# How often the model grid re-renders with fresh status (Streamlit >= 1.37)
+STATUS_REFRESH_SECONDS = 5
+
 def check_service_status(port):
     """Check if a service is running on the given port"""
-    try:
-        response = requests.get(f"http://localhost:{port}", timeout=2)
-        return True
-    except:
-        return False
+    return get_status_probe().is_running(port)
+
+MULTIPAGE_SCRIPTS = {script for pages in PAGES.values() for script, _, _ in pages}
+
+def status_ports(models):
+    """Every port a model can be served on: its own and the multipage app's"""
+    return [info['port'] for info in models.values()] + [MULTIPAGE_PORT]
+
+def check_all_services(models):
+    """
+    ``{name: {'running', 'port', 'url'}}`` for every model, probed concurrently
+
+    A model counts as running when its own server answers (``--separate``) or
+    when the multipage app is up and has it as a page (the launcher default).
+    """
+    statuses = get_status_probe().statuses(status_ports(models))
+    services = {}
+    for name, info in models.items():
+        if statuses[info['port']]:
+            services[name] = {'running': True, 'port': info['port'], 'url': f"http://localhost:{info['port']}"}
+        elif statuses[MULTIPAGE_PORT] and info['file'] in MULTIPAGE_SCRIPTS:
+            url = f"http://localhost:{MULTIPAGE_PORT}/{page_url_path(info['file'])}"
+            services[name] = {'running': True, 'port': MULTIPAGE_PORT, 'url': url}
+        else:
+            services[name] = {'running': False, 'port': info['port'], 'url': f"http://localhost:{info['port']}"}
+    return services
+
+def render_status(models):
+    """Model cards and system status, from one concurrent status check"""
+    # Models Grid
+    st.markdown("### 🎯 Available AI Models")
+    
+    # Create a 2-column layout for models
+    col1, col2 = st.columns(2)
+    
+    statuses = check_all_services(models)
+    model_items = list(models.items())
+    for i, (name, info) in enumerate(model_items):
+        # Alternate between columns
+        current_col = col1 if i % 2 == 0 else col2
+        
+        with current_col:
+            service = statuses[name]
+            is_running = service['running']
+            status_color = "🟢" if is_running else "🔴"
+            status_text = "Running" if is_running else "Stopped"
+            
+            # Create model card
+            with st.container():
+                st.markdown(f"""
+                <div style='padding: 20px; border: 2px solid {"#28a745" if is_running else "#dc3545"}; border-radius: 10px; margin-bottom: 20px; background: {"#f8fff8" if is_running else "#fff8f8"};'>
+                    <h4 style='margin: 0 0 10px 0; color: #333;'>{name}</h4>
+                    <p style='margin: 0 0 15px 0; color: #666; font-size: 0.9rem;'>{info['description']}</p>
+                    <div style='margin-bottom: 15px;'>
+                        <strong>Status:</strong> {status_color} {status_text} | <strong>Port:</strong> {service['port']}
+                    </div>
+                    <div style='margin-bottom: 15px;'>
+                        <strong>Features:</strong><br>
+                        {'<br>'.join([f"• {feature}" for feature in info['features']])}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Action buttons
+                button_col1, button_col2 = st.columns(2)
+                with button_col1:
+                    if is_running:
+                        if st.button(f"🌐 Open {name.split()[0]}", key=f"open_{i}", use_container_width=True):
+                            st.markdown(f'<meta http-equiv="refresh" content="0; url={service["url"]}" target="_blank">', unsafe_allow_html=True)
+                            st.success(f"Opening {name} in new tab...")
+                    else:
+                        st.button(f"❌ Not Running", key=f"disabled_{i}", disabled=True, use_container_width=True)
+                
+                with button_col2:
+                    if st.button(f"📋 Details", key=f"details_{i}", use_container_width=True):
+                        st.info(f"""
+                        **{name}**
+                        
+                        **URL:** {service['url']}
+                        
+                        **Description:** {info['description']}
+                        
+                        **Features:**
+                        {chr(10).join([f"• {feature}" for feature in info['features']])}
+                        """)
+    
+    # System Status
+    st.markdown("---")
+    st.markdown("### 📊 System Status")
+    
+    running_count = sum(service['running'] for service in statuses.values())
+    total_count = len(models)
+    
+    progress = running_count / total_count
+    st.progress(progress, text=f"Models Running: {running_count}/{total_count}")
+    checked_at = get_status_probe().checked_at(status_ports(models))
+    if checked_at is not None:
+        st.caption(f"Status checked {time.time() - checked_at:.0f}s ago")
+    
+    status_col1, status_col2, status_col3 = st.columns(3)
+    
+    with status_col1:
+        st.metric("Total Models", total_count)
+    
+    with status_col2:
+        st.metric("Running Models", running_count, delta=f"{running_count - (total_count - running_count)}")
+    
+    with status_col3:
+        st.metric("System Health", f"{progress*100:.0f}%", delta="Good" if progress > 0.5 else "Needs Attention")
 
 def main():
     st.set_page_config(
@@ -30,42 +139,49 @@ def main():
     models = {
         "🏠 Local Credit Analysis": {
             "port": 8501,
+            "file": "Local_Credit_Analysis.py",
             "description": "Offline credit analysis without external APIs",
             "features": ["No API required", "Fast processing", "Privacy focused"],
             "status": "primary"
         },
         "👤 Customer View": {
-            "port": 8502, 
+            "port": 8502,
+            "file": "Customer_View.py", 
             "description": "Customer-facing credit assessment dashboard",
             "features": ["User-friendly interface", "Personal insights", "Credit tips"],
             "status": "secondary"
         },
         "🤖 Customer View (Gemini AI)": {
             "port": 8503,
+            "file": "Customer_View_Goolge_Gemini_GoogleBNBMarathon.py",
             "description": "Enhanced customer view with Google Gemini AI",
             "features": ["AI-powered insights", "Multilingual support", "Advanced analytics"],
             "status": "success"
         },
         "🏦 Financial Institution View": {
             "port": 8504,
+            "file": "Financial_InstitutionView.py",
             "description": "Bank and lender perspective dashboard", 
             "features": ["Risk assessment", "Loan decisions", "Portfolio analysis"],
             "status": "info"
         },
         "📊 Business Review Platform": {
             "port": 8505,
+            "file": "Business_Review_Insights_Platform.py",
             "description": "Comprehensive business insights platform",
             "features": ["Business analytics", "Performance metrics", "Growth insights"],
             "status": "warning"
         },
         "🏪 Enhanced Loan Marketplace": {
             "port": 8506,
+            "file": "Enhanced_CreditWorthy_Loan_Marketplace.py",
             "description": "Complete loan marketplace solution",
             "features": ["Loan matching", "Rate comparison", "Application tracking"],
             "status": "danger"
         },
         "🚀 Nano Entrepreneur Assessment": {
             "port": 8507,
+            "file": "Nano_Entrepreneur_CreditFlow_Loan_Assessment.py",
             "description": "Specialized assessment for nano-entrepreneurs",
             "features": ["Micro-business focus", "Alternative scoring", "Growth potential"],
             "status": "dark"
@@ -78,7 +194,10 @@ def main():
     
     with col1:
         if st.button("🔄 Refresh Status", use_container_width=True):
-            st.rerun()
+            # Wait for fresh probes so the grid below never shows the old status
+            probe = get_status_probe()
+            probe.invalidate()
+            probe.statuses(status_ports(models), wait=True)
     
     with col2:
         if st.button("📖 View Documentation", use_container_width=True):
@@ -94,82 +213,12 @@ def main():
     
     st.markdown("---")
     
-    # Models Grid
-    st.markdown("### 🎯 Available AI Models")
-    
-    # Create a 2-column layout for models
-    col1, col2 = st.columns(2)
-    
-    model_items = list(models.items())
-    for i, (name, info) in enumerate(model_items):
-        # Alternate between columns
-        current_col = col1 if i % 2 == 0 else col2
-        
-        with current_col:
-            # Check if service is running
-            is_running = check_service_status(info['port'])
-            status_color = "🟢" if is_running else "🔴"
-            status_text = "Running" if is_running else "Stopped"
-            
-            # Create model card
-            with st.container():
-                st.markdown(f"""
-                <div style='padding: 20px; border: 2px solid {"#28a745" if is_running else "#dc3545"}; border-radius: 10px; margin-bottom: 20px; background: {"#f8fff8" if is_running else "#fff8f8"};'>
-                    <h4 style='margin: 0 0 10px 0; color: #333;'>{name}</h4>
-                    <p style='margin: 0 0 15px 0; color: #666; font-size: 0.9rem;'>{info['description']}</p>
-                    <div style='margin-bottom: 15px;'>
-                        <strong>Status:</strong> {status_color} {status_text} | <strong>Port:</strong> {info['port']}
-                    </div>
-                    <div style='margin-bottom: 15px;'>
-                        <strong>Features:</strong><br>
-                        {'<br>'.join([f"• {feature}" for feature in info['features']])}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Action buttons
-                button_col1, button_col2 = st.columns(2)
-                with button_col1:
-                    if is_running:
-                        if st.button(f"🌐 Open {name.split()[0]}", key=f"open_{i}", use_container_width=True):
-                            st.markdown(f'<meta http-equiv="refresh" content="0; url=http://localhost:{info["port"]}" target="_blank">', unsafe_allow_html=True)
-                            st.success(f"Opening {name} in new tab...")
-                    else:
-                        st.button(f"❌ Not Running", key=f"disabled_{i}", disabled=True, use_container_width=True)
-                
-                with button_col2:
-                    if st.button(f"📋 Details", key=f"details_{i}", use_container_width=True):
-                        st.info(f"""
-                        **{name}**
-                        
-                        **URL:** http://localhost:{info['port']}
-                        
-                        **Description:** {info['description']}
-                        
-                        **Features:**
-                        {chr(10).join([f"• {feature}" for feature in info['features']])}
-                        """)
-    
-    # System Status
-    st.markdown("---")
-    st.markdown("### 📊 System Status")
-    
-    running_count = sum(1 for info in models.values() if check_service_status(info['port']))
-    total_count = len(models)
-    
-    progress = running_count / total_count
-    st.progress(progress, text=f"Models Running: {running_count}/{total_count}")
-    
-    status_col1, status_col2, status_col3 = st.columns(3)
-    
-    with status_col1:
-        st.metric("Total Models", total_count)
-    
-    with status_col2:
-        st.metric("Running Models", running_count, delta=f"{running_count - (total_count - running_count)}")
-    
-    with status_col3:
-        st.metric("System Health", f"{progress*100:.0f}%", delta="Good" if progress > 0.5 else "Needs Attention")
+    # Re-render just the status sections on a timer where Streamlit supports it
+    fragment = getattr(st, 'fragment', None)
+    if fragment is not None:
+        fragment(run_every=STATUS_REFRESH_SECONDS)(render_status)(models)
+    else:
+        render_status(models)
     
     # Instructions
     st.markdown("---")
@@ -188,10 +237,10 @@ def main():
         """)
     
     with instructions_col2:
-        st.markdown("""
+        st.markdown(f"""
         **💡 Tips:**
-        - Each model runs on a different port
-        - Models can run independently
+        - By default all models are pages of one app on port {MULTIPAGE_PORT}
+        - With `--separate`, each model runs on its own port
         - Use this dashboard to monitor status
         - Green = Running, Red = Stopped
         - Click "Open" to access running models
@@ -0,0 +1,9 @@
+"""
+NanoFin shared library.
+
+Headless building blocks used by the Streamlit apps in ``AI_Models``. Nothing
+in this package imports Streamlit or Plotly, so it can be used from batch jobs
+and workers as well as from the UI.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,51 @@
+"""
+Scoring core shared by every NanoFin view.
+
+    from nanofin.core import prepare_transaction_data, calculate_financial_metrics
+
+Only pandas and NumPy are required; pyarrow enables the on-disk statement store.
+"""
+
+from .ingest import clean_date, parse_statement_dates, prepare_transaction_data
+from .categorize import (
+    DEFAULT_RULEBOOK,
+    categorize_descriptions,
+    categorize_nano_entrepreneur_transactions,
+    compile_rulebook,
+    get_categorizer,
+    load_rulebook,
+)
+from .incremental import MetricsAccumulator
+from .matcher import KeywordCategorizer
+from .reader import read_statement
+from .metrics import calculate_financial_metrics, metrics_kernel
+from .scoring import SCORE_COMPONENTS, calculate_nano_entrepreneur_score, score_batch
+from .cache import ResultCache, analyze_statement, get_result_cache
+from .store import StatementStore, get_statement_store, load_statement, statement_digest
+
+__all__ = [
+    'clean_date',
+    'parse_statement_dates',
+    'prepare_transaction_data',
+    'read_statement',
+    'StatementStore',
+    'get_statement_store',
+    'load_statement',
+    'statement_digest',
+    'DEFAULT_RULEBOOK',
+    'KeywordCategorizer',
+    'load_rulebook',
+    'compile_rulebook',
+    'get_categorizer',
+    'categorize_descriptions',
+    'categorize_nano_entrepreneur_transactions',
+    'calculate_financial_metrics',
+    'metrics_kernel',
+    'calculate_nano_entrepreneur_score',
+    'SCORE_COMPONENTS',
+    'score_batch',
+    'MetricsAccumulator',
+    'ResultCache',
+    'get_result_cache',
+    'analyze_statement',
+]
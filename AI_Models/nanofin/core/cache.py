@@ -0,0 +1,149 @@
+"""
+In-memory cache of fully analysed statements, shared across Streamlit reruns.
+
+    analysis = analyze_statement(uploaded_file)
+    analysis['df'], analysis['metrics'], analysis['nano_score']
+
+Every widget interaction reruns the page script. Results are keyed by the
+SHA-256 of the uploaded JSON plus the active rulebook digest, so a rerun only
+hashes the upload and returns the cached frame, metrics and score. Entries are
+evicted least-recently-used once their estimated size passes ``max_bytes``
+(``NANOFIN_RESULT_CACHE_MB``, 256 MB by default), which keeps memory bounded
+however many users upload statements to the same server process.
+
+Cached frames are shared between sessions and must be treated as read-only.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from .categorize import categorize_descriptions, get_categorizer
+from .metrics import calculate_financial_metrics
+from .scoring import calculate_nano_entrepreneur_score
+from .store import load_statement, statement_digest
+
+CACHE_SIZE_ENV_VAR = 'NANOFIN_RESULT_CACHE_MB'
+DEFAULT_MAX_MB = 256
+
+
+def estimate_nbytes(value):
+    """Rough deep size of a cached value, counting DataFrames by their buffers"""
+    if hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """Thread-safe LRU mapping bounded by total estimated bytes"""
+
+    def __init__(self, max_bytes=None, max_entries=None):
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(CACHE_SIZE_ENV_VAR, DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        """Insert a value, evicting the least recently used entries to make room"""
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            return False
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+
+            while self._entries and (
+                self.nbytes > self.max_bytes
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'nbytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """Process-wide cache shared by every session"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+        return _default_cache
+
+def analyze_statement(source, cache=None):
+    """
+    Ingest, categorize, and score a statement, reusing any cached result
+
+    Returns a dict with ``digest``, ``bank_data``, ``df`` (with ``category``),
+    ``metrics`` and ``nano_score``.
+    """
+    if cache is None:
+        cache = get_result_cache()
+    categorizer = get_categorizer()
+    digest = statement_digest(source)
+    key = (digest, categorizer.digest)
+
+    analysis = cache.get(key)
+    if analysis is not None:
+        return analysis
+
+    bank_data, df = load_statement(source, digest=digest)
+    df['category'] = categorize_descriptions(df['description'], categorizer)
+    metrics = calculate_financial_metrics(df, bank_data.get('summary', {}))
+    analysis = {
+        'digest': digest,
+        'bank_data': bank_data,
+        'df': df,
+        'metrics': metrics,
+        'nano_score': calculate_nano_entrepreneur_score(metrics),
+    }
+    cache.put(key, analysis)
+    return analysis
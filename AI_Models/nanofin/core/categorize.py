@@ -0,0 +1,90 @@
+"""
+Transaction categorization driven by a versioned rulebook.
+
+The category -> keyword table lives in ``nanofin/rulebooks/categories.json``
+(or any JSON/YAML file passed in, or named by ``NANOFIN_CATEGORY_RULEBOOK``).
+Rulebooks are compiled once and cached by the SHA-256 of their contents, so
+every view in the process shares the same matcher.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .matcher import KeywordCategorizer
+
+DEFAULT_RULEBOOK = Path(__file__).resolve().parent.parent / 'rulebooks' / 'categories.json'
+RULEBOOK_ENV_VAR = 'NANOFIN_CATEGORY_RULEBOOK'
+
+# rulebook digest -> compiled matcher
+_compiled_rulebooks = {}
+# (path, mtime, size) -> rulebook digest, so unchanged files aren't re-read
+_loaded_files = {}
+
+
+def _resolve_rulebook_path(path=None):
+    return Path(path or os.environ.get(RULEBOOK_ENV_VAR) or DEFAULT_RULEBOOK)
+
+def load_rulebook(path=None):
+    """Read and validate a rulebook file (JSON, or YAML if PyYAML is installed)"""
+    path = _resolve_rulebook_path(path)
+    text = path.read_text(encoding='utf-8')
+
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required for YAML rulebooks: pip install pyyaml")
+        rulebook = yaml.safe_load(text)
+    else:
+        rulebook = json.loads(text)
+
+    if not isinstance(rulebook, dict) or 'version' not in rulebook:
+        raise ValueError(f"Rulebook {path} must be a mapping with a 'version'")
+    categories = rulebook.get('categories')
+    if not isinstance(categories, list) or not all(
+        isinstance(c, dict) and 'name' in c and isinstance(c.get('keywords', []), list)
+        for c in categories
+    ):
+        raise ValueError(f"Rulebook {path} needs a 'categories' list of {{name, keywords}} entries")
+    return rulebook
+
+def rulebook_digest(rulebook):
+    """SHA-256 of the rulebook's canonical JSON form"""
+    canonical = json.dumps(rulebook, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def compile_rulebook(rulebook):
+    """Compile a rulebook into a KeywordCategorizer, reusing any cached compile"""
+    digest = rulebook_digest(rulebook)
+    categorizer = _compiled_rulebooks.get(digest)
+    if categorizer is None:
+        categorizer = KeywordCategorizer(
+            {c['name']: c.get('keywords', []) for c in rulebook['categories']},
+            default=rulebook.get('default', 'OTHERS'),
+            version=rulebook['version'],
+            digest=digest
+        )
+        _compiled_rulebooks[digest] = categorizer
+    return categorizer
+
+def get_categorizer(path=None):
+    """Shared compiled matcher for a rulebook file, recompiled only when it changes"""
+    path = _resolve_rulebook_path(path)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    digest = _loaded_files.get(key)
+    if digest is None or digest not in _compiled_rulebooks:
+        digest = compile_rulebook(load_rulebook(path)).digest
+        _loaded_files[key] = digest
+    return _compiled_rulebooks[digest]
+
+def categorize_nano_entrepreneur_transactions(description):
+    """Enhanced transaction categorization for nano-entrepreneurs"""
+    return get_categorizer().categorize(description)
+
+def categorize_descriptions(descriptions, categorizer=None):
+    """Vectorized categorization of a ``description`` column"""
+    return (categorizer or get_categorizer()).categorize_series(descriptions)
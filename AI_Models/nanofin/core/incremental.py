@@ -0,0 +1,144 @@
+"""
+Append-only metrics for continuously monitored customers.
+
+    acc = MetricsAccumulator.from_transactions(history_df, summary)
+    state = acc.to_state()                      # persist between runs
+    ...
+    acc = MetricsAccumulator.from_state(state)
+    acc.add_transactions(todays_rows)           # O(new rows)
+    acc.score()
+
+Running sums and counts are kept for credits and debits, and balance
+mean/variance use Welford's method (batches are merged with Chan's parallel
+update). ``metrics()`` returns the same dict as ``calculate_financial_metrics``
+on the full history.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from .scoring import calculate_nano_entrepreneur_score
+
+STATE_FIELDS = (
+    'total_transactions',
+    'total_credits',
+    'total_debits',
+    'credit_txns',
+    'positive_credit_sum',
+    'debit_txns',
+    'positive_debit_sum',
+    'balance_mean',
+    'balance_m2',
+    'opening_balance',
+    'closing_balance',
+)
+
+
+def _amounts(rows, column):
+    values = rows[column] if column in rows else np.zeros(len(rows))
+    return pd.to_numeric(pd.Series(values), errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+
+class MetricsAccumulator:
+    """Running financial metrics that can be updated with new transactions"""
+
+    def __init__(self, opening_balance=0.0, closing_balance=0.0):
+        self.total_transactions = 0
+        self.total_credits = 0.0
+        self.total_debits = 0.0
+        self.credit_txns = 0
+        self.positive_credit_sum = 0.0
+        self.debit_txns = 0
+        self.positive_debit_sum = 0.0
+        self.balance_mean = 0.0
+        self.balance_m2 = 0.0
+        self.opening_balance = float(opening_balance)
+        self.closing_balance = float(closing_balance)
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild an accumulator from a dict produced by ``to_state``"""
+        acc = cls()
+        for field in STATE_FIELDS:
+            setattr(acc, field, state[field])
+        return acc
+
+    @classmethod
+    def from_transactions(cls, transactions, summary_data=None):
+        """Seed an accumulator from a full transaction history"""
+        summary_data = summary_data or {}
+        acc = cls(opening_balance=summary_data.get('opening_balance', 0),
+                  closing_balance=summary_data.get('closing_balance', 0))
+        acc.add_transactions(transactions, summary_data=summary_data)
+        return acc
+
+    def to_state(self):
+        """Plain, JSON-serialisable snapshot of the accumulator"""
+        return {field: getattr(self, field) for field in STATE_FIELDS}
+
+    def add_transactions(self, new_rows, summary_data=None):
+        """
+        Fold new transactions into the running metrics
+
+        ``new_rows`` is a list of transaction dicts or a DataFrame with
+        ``credit``/``debit``/``balance`` columns. Opening and closing balances
+        only change when ``summary_data`` carries them, as in the batch path.
+        """
+        rows = new_rows if isinstance(new_rows, pd.DataFrame) else pd.DataFrame(list(new_rows))
+        n = len(rows)
+        if n:
+            credit = _amounts(rows, 'credit')
+            debit = _amounts(rows, 'debit')
+            balance = _amounts(rows, 'balance')
+
+            self.total_credits += float(credit.sum())
+            self.total_debits += float(debit.sum())
+
+            positive = credit > 0
+            self.credit_txns += int(np.count_nonzero(positive))
+            self.positive_credit_sum += float(np.sum(credit, where=positive))
+            positive = debit > 0
+            self.debit_txns += int(np.count_nonzero(positive))
+            self.positive_debit_sum += float(np.sum(debit, where=positive))
+
+            # Chan et al. parallel variance: merge the batch's mean/M2 into ours
+            batch_mean = float(balance.mean())
+            batch_m2 = float(np.square(balance - batch_mean).sum())
+            total = self.total_transactions + n
+            delta = batch_mean - self.balance_mean
+            self.balance_mean += delta * n / total
+            self.balance_m2 += batch_m2 + delta * delta * self.total_transactions * n / total
+            self.total_transactions = total
+
+        if summary_data:
+            if 'opening_balance' in summary_data:
+                self.opening_balance = float(summary_data['opening_balance'])
+            if 'closing_balance' in summary_data:
+                self.closing_balance = float(summary_data['closing_balance'])
+        return self
+
+    def metrics(self):
+        """Same dict as ``calculate_financial_metrics`` over every transaction seen"""
+        n = self.total_transactions
+        return {
+            'total_transactions': n,
+            'total_credits': self.total_credits,
+            'total_debits': self.total_debits,
+            'net_cashflow': self.total_credits - self.total_debits,
+            'opening_balance': self.opening_balance,
+            'closing_balance': self.closing_balance,
+            'avg_balance': self.balance_mean if n else float('nan'),
+            'balance_volatility': math.sqrt(self.balance_m2 / (n - 1)) if n > 1 else float('nan'),
+            'avg_transaction_size': (self.positive_debit_sum / self.debit_txns
+                                     if self.debit_txns else float('nan')),
+            'transaction_frequency': n / 30,  # transactions per day
+            'credit_frequency': self.credit_txns / max(n, 1),
+            'avg_credit_amount': (self.positive_credit_sum / self.credit_txns
+                                  if self.credit_txns else 0),
+        }
+
+    def score(self):
+        """Nano-entrepreneur score for the current metrics"""
+        return calculate_nano_entrepreneur_score(self.metrics())
@@ -0,0 +1,51 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Statements carry two-digit years (dd-mm-yy); some exports use four (dd-mm-yyyy).
+SHORT_DATE_FORMAT = '%d-%m-%y'
+LONG_DATE_FORMAT = '%d-%m-%Y'
+
+
+def clean_date(date_str):
+    """Clean date string by removing INB suffix if present"""
+    return re.sub(r'INB$', '', str(date_str))
+
+def parse_statement_dates(dates):
+    """
+    Vectorized equivalent of ``pd.to_datetime(dates.apply(clean_date), format='%d-%m-%y')``
+
+    The INB suffix is stripped with one string operation and each date format is
+    parsed in a single ``to_datetime`` call over its rows, so mixed dd-mm-yy /
+    dd-mm-yyyy statements never fall back to per-row Python.
+    """
+    cleaned = dates.astype(str).str.removesuffix('INB')
+    long_year = (cleaned.str.len() == 10).to_numpy()
+
+    if not long_year.any():
+        return pd.to_datetime(cleaned, format=SHORT_DATE_FORMAT, cache=True)
+
+    parsed = np.empty(len(cleaned), dtype='datetime64[ns]')
+    parsed[long_year] = pd.to_datetime(
+        cleaned[long_year], format=LONG_DATE_FORMAT, cache=True
+    ).to_numpy(dtype='datetime64[ns]')
+    parsed[~long_year] = pd.to_datetime(
+        cleaned[~long_year], format=SHORT_DATE_FORMAT, cache=True
+    ).to_numpy(dtype='datetime64[ns]')
+    return pd.Series(parsed, index=cleaned.index, name=dates.name)
+
+def prepare_transaction_data(transactions):
+    df = pd.DataFrame(transactions)
+
+    # Clean date strings and convert to datetime
+    df['date'] = parse_statement_dates(df['date'])
+    df['month'] = df['date'].dt.month
+    df['day_of_week'] = df['date'].dt.dayofweek
+
+    # Convert amount columns to float
+    df['credit'] = pd.to_numeric(df['credit'], errors='coerce').fillna(0)
+    df['debit'] = pd.to_numeric(df['debit'], errors='coerce').fillna(0)
+    df['balance'] = pd.to_numeric(df['balance'], errors='coerce').fillna(0)
+
+    return df
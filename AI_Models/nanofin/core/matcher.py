@@ -0,0 +1,123 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+def _trie_pattern(keywords):
+    """
+    Build a regex that matches the longest keyword starting at a position.
+
+    Keywords are folded into a prefix trie first, so the regex engine branches
+    on one character at a time instead of trying every keyword at every offset.
+    This keeps matching cost flat as the rulebook grows to thousands of entries.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional group: prefer the longer keyword, fall back to this one
+        return '(?:' + body + ')?' if '' in node else body
+
+    return emit(trie)
+
+
+class KeywordCategorizer:
+    """
+    Keyword table compiled once into a single regex.
+
+    Categories keep their first-match-wins precedence: a description gets the
+    earliest category (in table order) that has any keyword in it, regardless
+    of where in the description that keyword appears.
+    """
+
+    def __init__(self, categories, default='OTHERS', version=None, digest=None):
+        self.categories = dict(categories)
+        self.default = default
+        self.version = version
+        self.digest = digest
+
+        self._keyword_rank = {}
+        for rank, keywords in enumerate(self.categories.values()):
+            for keyword in keywords:
+                self._keyword_rank.setdefault(keyword.upper(), rank)
+
+        self._unmatched = len(self.categories)
+        self._labels = np.array(list(self.categories) + [default], dtype=object)
+
+        if not self._keyword_rank:
+            self._pattern = self._overlapping_pattern = None
+            return
+
+        trie = _trie_pattern(self._keyword_rank)
+        self._pattern = re.compile(trie)
+        # Zero-width lookahead variant that reports a match at every offset
+        self._overlapping_pattern = re.compile('(?=(' + trie + '))')
+
+        # Every keyword that matches at an offset is a prefix of the longest
+        # match there, so the rank of a match is the best rank of its prefixes.
+        prefix_rank = {}
+        for keyword, rank in self._keyword_rank.items():
+            for end in range(1, len(keyword) + 1):
+                prefix = keyword[:end]
+                if rank < prefix_rank.get(prefix, self._unmatched):
+                    prefix_rank[prefix] = rank
+
+        self._match_rank = {}
+        # A non-overlapping scan can hide a keyword that starts inside another
+        # match (e.g. RETURNS inside "STORETURNS"). For each keyword, record the
+        # best rank it could hide so the exact scan only runs when it matters.
+        self._shadow_rank = {}
+        for keyword in self._keyword_rank:
+            self._match_rank[keyword] = min(
+                self._keyword_rank.get(keyword[:end], self._unmatched)
+                for end in range(1, len(keyword) + 1)
+            )
+            hidden = self._unmatched
+            for start in range(1, len(keyword)):
+                # Keywords that start here and run to or past the end of the match
+                hidden = min(hidden, prefix_rank.get(keyword[start:], self._unmatched))
+                # Keywords that start and end strictly inside the match
+                for end in range(start + 1, len(keyword)):
+                    hidden = min(hidden, self._keyword_rank.get(keyword[start:end], self._unmatched))
+            if hidden < self._match_rank[keyword]:
+                self._shadow_rank[keyword] = hidden
+
+    def _rank(self, description):
+        if self._pattern is None:
+            return self._unmatched
+        found = self._pattern.findall(description)
+        if not found:
+            return self._unmatched
+
+        match_rank = self._match_rank
+        best = min(match_rank[keyword] for keyword in found)
+        if best and any(self._shadow_rank.get(keyword, best) < best for keyword in found):
+            best = min(match_rank[m.group(1)]
+                       for m in self._overlapping_pattern.finditer(description))
+        return best
+
+    def categorize(self, description):
+        """Categorize a single description"""
+        return self._labels[self._rank(str(description).upper())]
+
+    def categorize_series(self, descriptions):
+        """Categorize a whole description column"""
+        # Statements repeat the same merchants constantly, so each distinct
+        # description is scanned once and the labels are broadcast back.
+        codes, uniques = pd.factorize(descriptions, use_na_sentinel=False)
+        ranks = np.fromiter(
+            (self._rank(str(value).upper()) for value in uniques),
+            dtype=np.intp, count=len(uniques)
+        )
+        return pd.Series(self._labels[ranks[codes]], index=descriptions.index,
+                         name='category')
@@ -0,0 +1,57 @@
+import numpy as np
+
+
+def _as_float_array(column):
+    """Zero-copy view of a numeric column as contiguous float64"""
+    return np.ascontiguousarray(column.to_numpy(dtype=np.float64, copy=False))
+
+def _positive_sum_and_count(values):
+    """Sum and count of the strictly positive entries without building a filtered copy"""
+    positive = values > 0
+    return float(np.sum(values, where=positive)), int(np.count_nonzero(positive))
+
+def metrics_kernel(credit, debit, balance, opening_balance=0.0, closing_balance=0.0):
+    """
+    Compute every financial metric straight from float64 arrays.
+
+    Each array is streamed through a handful of reductions; boolean masks are
+    passed as ``where=`` so no filtered copy of the data is ever allocated.
+    Values match the original pandas implementation (sample std, NaN for the
+    mean of an empty selection).
+    """
+    n = len(credit)
+
+    total_credits = float(credit.sum())
+    total_debits = float(debit.sum())
+    positive_credit_sum, credit_txns = _positive_sum_and_count(credit)
+    positive_debit_sum, debit_txns = _positive_sum_and_count(debit)
+
+    if n:
+        avg_balance = float(balance.mean())
+        balance_volatility = float(balance.std(ddof=1)) if n > 1 else float('nan')
+    else:
+        avg_balance = balance_volatility = float('nan')
+
+    return {
+        'total_transactions': n,
+        'total_credits': total_credits,
+        'total_debits': total_debits,
+        'net_cashflow': total_credits - total_debits,
+        'opening_balance': float(opening_balance),
+        'closing_balance': float(closing_balance),
+        'avg_balance': avg_balance,
+        'balance_volatility': balance_volatility,
+        'avg_transaction_size': positive_debit_sum / debit_txns if debit_txns else float('nan'),
+        'transaction_frequency': n / 30,  # transactions per day
+        'credit_frequency': credit_txns / max(n, 1),
+        'avg_credit_amount': positive_credit_sum / credit_txns if credit_txns else 0,
+    }
+
+def calculate_financial_metrics(df, summary_data):
+    return metrics_kernel(
+        _as_float_array(df['credit']),
+        _as_float_array(df['debit']),
+        _as_float_array(df['balance']),
+        opening_balance=summary_data.get('opening_balance', 0),
+        closing_balance=summary_data.get('closing_balance', 0),
+    )
@@ -0,0 +1,239 @@
+"""
+Streaming reader for bank-statement JSON.
+
+    bank_data, df = read_statement(uploaded_file)
+
+``json.load`` followed by ``pd.DataFrame(bank_data['transactions'])`` keeps the
+raw text, the full dict tree and the DataFrame alive at the same time. This
+reader walks the top-level object incrementally instead: ``personal_info``,
+``account_info``, ``summary`` and any other small sections are decoded as they
+go past, while the ``transactions`` array is decoded one element at a time and
+packed into typed NumPy column buffers every ``chunk_size`` rows. Only the
+current read buffer and one chunk of dicts are ever held.
+
+The returned DataFrame is the same as ``prepare_transaction_data`` would give.
+"""
+
+import codecs
+import json
+import re
+from itertools import chain
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+from .ingest import parse_statement_dates
+
+AMOUNT_COLUMNS = ('credit', 'debit', 'balance')
+READ_SIZE = 1 << 16
+CHUNK_SIZE = 8192
+
+_WHITESPACE = ' \t\n\r'
+# Characters that can end a bare number/true/false/null
+_SCALAR_END = _WHITESPACE + ',]}:'
+_SKIP_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_ITEM_END = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+
+
+class _JsonStream:
+    """Minimal pull tokenizer over a text or binary file object"""
+
+    def __init__(self, source, read_size=READ_SIZE):
+        self._source = source
+        self._read_size = read_size
+        self._decoder = None
+        self._json = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        data = self._source.read(self._read_size)
+        if isinstance(data, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+            text = self._decoder.decode(data, final=not data)
+        else:
+            text = data
+        if not data:
+            self.eof = True
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos] if self.pos < len(self.buf) else ''
+            self._fill()
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid statement JSON: expected '{char}' but found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill()
+                continue
+            # A bare scalar is only complete once a delimiter follows it: "12." may
+            # be "12.5" cut off by the read buffer, decoded here as just 12
+            if (not self.eof and not isinstance(obj, (str, dict, list))
+                    and (end == len(self.buf) or self.buf[end] not in _SCALAR_END)):
+                self._fill()
+                continue
+            self.pos = end
+            return obj
+
+    def iter_array(self):
+        """Yield the elements of the array at the current position one at a time"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        scan = self._json.scan_once
+        while True:
+            try:
+                obj, end = scan(self.buf, self.pos)
+                separator = _ITEM_END.match(self.buf, end)
+            except (StopIteration, json.JSONDecodeError):
+                separator = None
+            if separator is None:
+                # Element or separator cut off by the read buffer: pull more and retry
+                if self.eof:
+                    raise ValueError("Invalid statement JSON: malformed transactions array")
+                self._fill()
+                self.pos = _SKIP_WHITESPACE.match(self.buf, self.pos).end()
+                continue
+            # The separator match also swallows the whitespace before the next element
+            self.pos = separator.end()
+            yield obj
+            if separator.group(1) == ']':
+                return
+
+
+def _missing_column(key, length):
+    # Same fill a chunk gets when only some of its rows lack the key
+    if key in AMOUNT_COLUMNS:
+        return np.zeros(length)
+    if key == 'date':
+        return np.full(length, np.datetime64('NaT'), dtype='datetime64[ns]')
+    return np.full(length, np.nan, dtype=object)
+
+
+class _ColumnBuffers:
+    """Accumulates transaction dicts into typed per-chunk column arrays"""
+
+    def __init__(self, chunk_size):
+        self.chunk_size = chunk_size
+        self.pending = []
+        self.chunks = []
+
+    def consume(self, rows):
+        pending = self.pending
+        chunk_size = self.chunk_size
+        for row in rows:
+            pending.append(row)
+            if len(pending) >= chunk_size:
+                self.flush()
+                pending = self.pending
+
+    def flush(self):
+        if not self.pending:
+            return
+        rows, self.pending = self.pending, []
+
+        chunk = {}
+        for key in dict.fromkeys(chain.from_iterable(rows)):
+            try:
+                values = list(map(itemgetter(key), rows))
+            except KeyError:
+                values = [row.get(key, np.nan) for row in rows]
+
+            if key in AMOUNT_COLUMNS:
+                values = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+                chunk[key] = values.fillna(0).to_numpy(dtype=np.float64)
+            elif key == 'date':
+                chunk[key] = parse_statement_dates(pd.Series(values, dtype=object)).to_numpy(dtype='datetime64[ns]')
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+                chunk[key] = column
+        self.chunks.append((len(rows), chunk))
+
+    def to_frame(self):
+        self.flush()
+        keys = {}
+        for _, chunk in self.chunks:
+            keys.update(dict.fromkeys(chunk))
+
+        columns = {}
+        for key in keys:
+            parts = []
+            for length, chunk in self.chunks:
+                # Pop as we go so each chunk's memory is released once concatenated
+                part = chunk.pop(key, None)
+                parts.append(_missing_column(key, length) if part is None else part)
+            columns[key] = np.concatenate(parts) if parts else np.array([])
+        self.chunks = []
+        return pd.DataFrame(columns)
+
+
+def read_statement(source, chunk_size=CHUNK_SIZE, read_size=READ_SIZE):
+    """
+    Stream a statement file into ``(bank_data, transactions_df)``
+
+    ``source`` is a path or an open text/binary file (e.g. a Streamlit upload).
+    ``bank_data`` holds every top-level section except ``transactions``.
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        with open(source, 'rb') as fh:
+            return read_statement(fh, chunk_size=chunk_size, read_size=read_size)
+
+    stream = _JsonStream(source, read_size)
+    buffers = _ColumnBuffers(chunk_size)
+    bank_data = {}
+    seen_transactions = False
+
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+    else:
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid statement JSON: object keys must be strings")
+            stream.expect(':')
+
+            if key == 'transactions':
+                seen_transactions = True
+                buffers.consume(stream.iter_array())
+            else:
+                bank_data[key] = stream.value()
+
+            if stream.peek() == ',':
+                stream.pos += 1
+                continue
+            stream.expect('}')
+            break
+
+    if not seen_transactions:
+        raise KeyError('transactions')
+
+    df = buffers.to_frame()
+    for column in ('date',) + AMOUNT_COLUMNS:
+        if column not in df:
+            raise KeyError(column)
+    df['month'] = df['date'].dt.month
+    df['day_of_week'] = df['date'].dt.dayofweek
+    return bank_data, df
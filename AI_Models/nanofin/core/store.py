@@ -0,0 +1,200 @@
+"""
+On-disk statement store keyed by the SHA-256 of the source JSON.
+
+    bank_data, df = load_statement(uploaded_file)
+
+The first time a statement is seen it is parsed with ``read_statement`` and
+written as an uncompressed Arrow IPC file, ``<sha256>.arrow``, with the
+non-transaction sections kept as JSON in the schema metadata. After that,
+every view and every session memory-maps that file instead of re-parsing the
+JSON, so numeric and date columns come back without a copy.
+
+Arrow IPC is used rather than Parquet because Parquet pages have to be
+decoded and cannot be memory-mapped. pyarrow is optional: without it,
+``load_statement`` simply parses the statement on each call.
+
+Stored statements hold customer names and account numbers, so the store can
+be moved (``NANOFIN_STATEMENT_STORE=<dir>``) or turned off
+(``NANOFIN_STATEMENT_STORE=off``). It is capped at ``NANOFIN_STATEMENT_STORE_MB``
+(512 MB by default); the least recently used files are deleted past that. A
+statement that can't be written, e.g. over a file another process has mapped
+on Windows, is served from the parsed frame as if the store were off.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from .reader import read_statement
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+STORE_ENV_VAR = 'NANOFIN_STATEMENT_STORE'
+STORE_SIZE_ENV_VAR = 'NANOFIN_STATEMENT_STORE_MB'
+DEFAULT_STORE_DIR = Path.home() / '.cache' / 'nanofin' / 'statements'
+DEFAULT_STORE_MB = 512
+# Values of NANOFIN_STATEMENT_STORE that turn the store off
+DISABLED_VALUES = ('off', '0', 'false', 'no', 'none')
+# Bump when the stored layout or the parsed columns change
+STORE_FORMAT_VERSION = 1
+HASH_BLOCK_SIZE = 1 << 20
+
+_METADATA_KEY = b'nanofin.bank_data'
+_VERSION_KEY = b'nanofin.format_version'
+
+
+def statement_digest(source):
+    """SHA-256 of a statement file or file-like object, leaving it rewound"""
+    sha = hashlib.sha256()
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        with open(source, 'rb') as fh:
+            for block in iter(lambda: fh.read(HASH_BLOCK_SIZE), b''):
+                sha.update(block)
+        return sha.hexdigest()
+
+    start = source.tell()
+    while True:
+        block = source.read(HASH_BLOCK_SIZE)
+        if not block:
+            break
+        sha.update(block.encode('utf-8') if isinstance(block, str) else block)
+    source.seek(start)
+    return sha.hexdigest()
+
+
+class StatementStore:
+    """Directory of parsed statements stored as memory-mappable Arrow files"""
+
+    def __init__(self, root=None, max_bytes=None, disabled=False):
+        self.root = Path(root or DEFAULT_STORE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(STORE_SIZE_ENV_VAR, DEFAULT_STORE_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.disabled = disabled
+
+    @property
+    def enabled(self):
+        return pa is not None and not self.disabled
+
+    def path_for(self, digest):
+        return self.root / f"{digest}.arrow"
+
+    def __contains__(self, digest):
+        return self.enabled and self.path_for(digest).exists()
+
+    def get(self, digest):
+        """Memory-map a stored statement, or return None if it is missing or stale"""
+        if digest not in self:
+            return None
+        try:
+            with pa.memory_map(str(self.path_for(digest)), 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (OSError, pa.ArrowInvalid):
+            return None
+        self._touch(digest)
+
+        metadata = table.schema.metadata or {}
+        if metadata.get(_VERSION_KEY) != str(STORE_FORMAT_VERSION).encode():
+            return None
+        bank_data = json.loads(metadata[_METADATA_KEY])
+        # split_blocks keeps each numeric column as its own zero-copy block
+        df = table.to_pandas(split_blocks=True)
+        return bank_data, df
+
+    def put(self, digest, bank_data, df):
+        """Write a parsed statement atomically; returns False if it can't be stored"""
+        if not self.enabled:
+            return False
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type columns have no Arrow equivalent; keep serving the parsed frame
+            return False
+        table = table.replace_schema_metadata({
+            _METADATA_KEY: json.dumps(bank_data, ensure_ascii=False).encode('utf-8'),
+            _VERSION_KEY: str(STORE_FORMAT_VERSION).encode(),
+        })
+
+        if table.nbytes > self.max_bytes:
+            return False
+
+        tmp_path = None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, self.path_for(digest))
+            tmp_path = None
+        except OSError:
+            # Full disk, read-only home, or a target mapped by another process
+            # (Windows refuses to replace those): serve this upload unstored
+            return False
+        finally:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+        self.evict()
+        return True
+
+    def _touch(self, digest):
+        # mtime doubles as last-used time for eviction
+        with contextlib.suppress(OSError):
+            os.utime(self.path_for(digest))
+
+    def evict(self):
+        """Delete least recently used statements until the store fits ``max_bytes``"""
+        entries = []
+        for path in self.root.glob('*.arrow'):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                # Still mapped by a reader on Windows; try again after the next write
+                continue
+            total -= size
+
+    def load(self, source, digest=None):
+        """``(bank_data, df)`` for a statement, parsing it only on a store miss"""
+        if not self.enabled:
+            return read_statement(source)
+
+        digest = digest or statement_digest(source)
+        cached = self.get(digest)
+        if cached is not None:
+            return cached
+
+        bank_data, df = read_statement(source)
+        self.put(digest, bank_data, df)
+        return bank_data, df
+
+
+_default_store = None
+
+
+def get_statement_store():
+    """Process-wide store rooted at ``NANOFIN_STATEMENT_STORE`` (or ~/.cache/nanofin)"""
+    global _default_store
+    setting = os.environ.get(STORE_ENV_VAR, '').strip()
+    disabled = setting.lower() in DISABLED_VALUES
+    root = Path(DEFAULT_STORE_DIR if disabled or not setting else setting)
+    if _default_store is None or _default_store.root != root or _default_store.disabled != disabled:
+        _default_store = StatementStore(root, disabled=disabled)
+    return _default_store
+
+def load_statement(source, store=None, digest=None):
+    """Load a statement through the content-addressed store"""
+    return (store or get_statement_store()).load(source, digest=digest)
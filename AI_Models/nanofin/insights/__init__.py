@@ -0,0 +1,20 @@
+"""
+AI-generated financial insights, cached and shared across sessions.
+
+    from nanofin.insights import get_insight_service
+
+google-generativeai and youtube-search-python are optional; without them
+(or an API key) callers fall back to their local insights.
+"""
+
+from .service import InsightService, gemini_generator, get_insight_service, prompt_key
+from .videos import VideoRecommendations, get_video_recommendations
+
+__all__ = [
+    'InsightService',
+    'get_insight_service',
+    'gemini_generator',
+    'prompt_key',
+    'VideoRecommendations',
+    'get_video_recommendations',
+]
@@ -0,0 +1,192 @@
+"""
+Non-blocking LLM insight generation, shared across Streamlit sessions.
+
+    service = get_insight_service(api_key)
+    future = service.submit(prompt, model='gemini-2.0-flash-exp')
+    text = service.cached(prompt, model) or fallback_text
+
+Generation runs on a small thread pool, never on the script thread. Responses
+are cached by SHA-256 of (model, prompt) for ``ttl`` seconds, LRU-evicted past
+``max_entries``. A prompt already in flight is coalesced: every caller, from
+any session, gets the same future and the model is called once. A failure is
+remembered for ``retry_after`` seconds: submits in that window get a future
+already resolved with the error instead of calling the model again.
+
+The model is any ``generate(model, prompt) -> str`` callable, so a local stub
+can stand in for Gemini; ``gemini_generator`` adapts google-generativeai,
+which is optional.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import google.generativeai as genai
+except ImportError:  # pragma: no cover - optional dependency
+    genai = None
+
+DEFAULT_MODEL = 'gemini-2.0-flash-exp'
+DEFAULT_TTL = 6 * 60 * 60
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_WORKERS = 4
+DEFAULT_RETRY_AFTER = 60
+
+
+def prompt_key(prompt, model=DEFAULT_MODEL):
+    """Cache key for a prompt sent to ``model``"""
+    return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+
+def gemini_generator(api_key):
+    """``generate(model, prompt)`` backed by google-generativeai"""
+    if genai is None:
+        raise ImportError("google-generativeai is required for Gemini insights: pip install google-generativeai")
+    genai.configure(api_key=api_key)
+
+    def generate(model, prompt):
+        return genai.GenerativeModel(model).generate_content(prompt).text
+    return generate
+
+
+class InsightService:
+    """Coalescing, TTL/LRU-cached front for a text generation model"""
+
+    def __init__(self, generate, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_workers=DEFAULT_WORKERS, retry_after=DEFAULT_RETRY_AFTER):
+        self.generate = generate
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.retry_after = retry_after
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._responses = OrderedDict()
+        self._failures = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='insights')
+
+    def _lookup(self, key):
+        # Called with the lock held
+        entry = self._responses.get(key)
+        if entry is None:
+            return None
+        text, created_at = entry
+        if time.time() - created_at > self.ttl:
+            del self._responses[key]
+            return None
+        self._responses.move_to_end(key)
+        return text
+
+    def _recent_failure(self, key):
+        # Called with the lock held
+        entry = self._failures.get(key)
+        if entry is None:
+            return None
+        error, failed_at = entry
+        if time.time() - failed_at > self.retry_after:
+            del self._failures[key]
+            return None
+        return error
+
+    def cached(self, prompt, model=DEFAULT_MODEL):
+        """The cached response, or None; never calls the model"""
+        with self._lock:
+            return self._lookup(prompt_key(prompt, model))
+
+    def submit(self, prompt, model=DEFAULT_MODEL):
+        """Future for the response; resolved at once on a cache hit"""
+        key = prompt_key(prompt, model)
+        with self._lock:
+            text = self._lookup(key)
+            if text is not None:
+                self.hits += 1
+                future = Future()
+                future.set_result(text)
+                return future
+            error = self._recent_failure(key)
+            if error is not None:
+                future = Future()
+                future.set_exception(error)
+                return future
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            self.misses += 1
+            future = self._executor.submit(self._run, key, model, prompt)
+            self._in_flight[key] = future
+            return future
+
+    def _run(self, key, model, prompt):
+        try:
+            text = self.generate(model, prompt)
+        except Exception as e:
+            with self._lock:
+                self._failures[key] = (e, time.time())
+                self._failures.move_to_end(key)
+                while len(self._failures) > self.max_entries:
+                    self._failures.popitem(last=False)
+            raise
+        else:
+            with self._lock:
+                self._responses[key] = (text, time.time())
+                self._responses.move_to_end(key)
+                while len(self._responses) > self.max_entries:
+                    self._responses.popitem(last=False)
+                self._failures.pop(key, None)
+            return text
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def get(self, prompt, model=DEFAULT_MODEL, timeout=None):
+        """Blocking response; raises whatever the model raised"""
+        return self.submit(prompt, model).result(timeout=timeout)
+
+    def generator(self):
+        """``generate(model, prompt)`` served through this service's cache and coalescing"""
+        return lambda model, prompt: self.get(prompt, model)
+
+    async def agenerate(self, prompt, model=DEFAULT_MODEL):
+        """Awaitable response for asyncio callers"""
+        return await asyncio.wrap_future(self.submit(prompt, model))
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+            self._failures.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._responses),
+                'failures': len(self._failures),
+                'in_flight': len(self._in_flight),
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+            }
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_insight_service(api_key):
+    """
+    Process-wide Gemini service for ``api_key``, or None without a usable key
+
+    One service per key, so the cache and in-flight requests are shared by
+    every session and page in the process.
+    """
+    if not api_key or api_key == "your_gemini_api_key_here" or genai is None:
+        return None
+    key = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    with _services_lock:
+        if key not in _services:
+            _services[key] = InsightService(gemini_generator(api_key))
+        return _services[key]
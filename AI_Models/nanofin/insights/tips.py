@@ -0,0 +1,307 @@
+"""
+Precomputed credit improvement tip bundles, one per language x score band.
+
+    python -m nanofin.insights.tips --api-key $GEMINI_API_KEY   # offline build
+
+    store = get_tip_store()
+    store.get('Hindi', score_band(67))   # O(1), no network
+
+Tips depend only on the language and a coarse score band, so every
+combination is generated once by the build step and stored in one JSON file
+(``~/.cache/nanofin/tip_bundles.json`` or ``NANOFIN_TIP_BUNDLES``). At
+runtime a tip lookup is a dict access. A built store older than ``max_age``
+can be refreshed on a background thread while the old bundles stay in
+service; a refresh that fails is not retried for ``RETRY_AFTER`` seconds.
+Missing bundles fall back to ``FALLBACK_TIPS``.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .service import DEFAULT_MODEL
+
+TIPS_ENV_VAR = 'NANOFIN_TIP_BUNDLES'
+DEFAULT_TIPS_PATH = Path.home() / '.cache' / 'nanofin' / 'tip_bundles.json'
+# Bump when the bundle file layout changes; older files are ignored
+TIPS_FORMAT_VERSION = 1
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+# After a failed refresh, wait this long before trying again
+RETRY_AFTER = 5 * 60
+
+LANGUAGES = {
+    'English': 'en',
+    'Hindi': 'hi',
+    'Kannada': 'kn',
+    'Tamil': 'ta',
+    'Telugu': 'te',
+    'Malayalam': 'ml'
+}
+
+# (band, lowest score in band), highest first
+SCORE_BANDS = (
+    ('excellent', 80),
+    ('good', 60),
+    ('fair', 40),
+    ('low', 0),
+)
+UNKNOWN_BAND = 'unknown'
+
+FALLBACK_TIPS = {
+    'English': """
+### Credit Score Improvement Tips
+
+#### 1. Maintain Regular Income
+- Ensure consistent monthly deposits
+- Diversify income sources when possible
+- Keep income documentation updated
+
+#### 2. Manage Expenses Wisely
+- Track all business expenses
+- Avoid unnecessary expenditures
+- Maintain expense-to-income ratio below 70%
+
+#### 3. Build Transaction History
+- Use your bank account regularly
+- Maintain minimum balance requirements
+- Avoid frequent overdrafts
+
+#### 4. Improve Payment Discipline
+- Pay all bills on time
+- Clear any outstanding dues
+- Maintain good relationships with suppliers
+
+#### 5. Plan for Growth
+- Reinvest profits back into business
+- Build emergency fund (3-6 months expenses)
+- Consider business expansion opportunities
+    """,
+    'Hindi': """
+### क्रेडिट स्कोर सुधार के उपाय
+
+#### 1. नियमित आय बनाए रखें
+- मासिक जमा राशि नियमित रखें
+- आय के विभिन्न स्रोत बनाएं
+
+#### 2. खर्च का बेहतर प्रबंधन
+- व्यापारिक खर्चों का हिसाब रखें
+- अनावश्यक खर्चों से बचें
+    """
+}
+
+GOVERNMENT_RESOURCES = {
+    'English': [
+        {'name': 'RBI Financial Literacy', 'url': 'https://www.rbi.org.in/Scripts/Financial_Literacy.aspx'},
+        {'name': 'SEBI Investor Education', 'url': 'https://www.sebi.gov.in/investor-education.html'}
+    ],
+    'Hindi': [
+        {'name': 'RBI वित्तीय साक्षरता', 'url': 'https://www.rbi.org.in/Scripts/Financial_Literacy.aspx'},
+        {'name': 'SEBI निवेशक शिक्षा', 'url': 'https://www.sebi.gov.in/investor-education.html'}
+    ]
+    # Add more language-specific resources
+}
+
+
+def score_band(score):
+    """Band name for a 0-100 score; ``UNKNOWN_BAND`` when there is no score"""
+    if score is None:
+        return UNKNOWN_BAND
+    for band, lowest in SCORE_BANDS:
+        if score >= lowest:
+            return band
+    return SCORE_BANDS[-1][0]
+
+def band_description(band):
+    """Human-readable score range for a band, as used in prompts"""
+    upper = 100
+    for name, lowest in SCORE_BANDS:
+        if name == band:
+            return f"{band} ({lowest}-{upper} out of 100)"
+        upper = lowest - 1
+    return 'Not specified'
+
+def tips_prompt(language='English', band=UNKNOWN_BAND):
+    """Gemini prompt for one bundle"""
+    return f"""
+        Generate comprehensive, actionable credit score improvement tips 
+        in {language} language. Provide:
+        - 5-7 specific strategies
+        - Detailed explanation for each strategy
+        - Potential impact on credit score
+        - Practical implementation steps
+        
+        Context:
+        - Current language: {language}
+        - Current credit score band: {band_description(band)}
+        """
+
+def fallback_tips(language='English'):
+    return FALLBACK_TIPS.get(language, FALLBACK_TIPS['English'])
+
+def government_resources(language='English'):
+    return GOVERNMENT_RESOURCES.get(language, GOVERNMENT_RESOURCES['English'])
+
+def bundle_keys(languages=LANGUAGES):
+    """Every (language, band) combination the build step generates"""
+    bands = [band for band, _ in SCORE_BANDS] + [UNKNOWN_BAND]
+    return [(language, band) for language in languages for band in bands]
+
+
+class TipBundleStore:
+    """All tip bundles in memory, persisted as one versioned JSON file"""
+
+    def __init__(self, path=None, max_age=DEFAULT_MAX_AGE):
+        self.path = Path(path or os.environ.get(TIPS_ENV_VAR) or DEFAULT_TIPS_PATH)
+        self.max_age = max_age
+        self.bundles = {}
+        self.generated_at = 0.0
+        self.last_error = None
+        self._last_attempt = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if not isinstance(stored, dict) or stored.get('format_version') != TIPS_FORMAT_VERSION:
+            return
+        self.bundles = stored.get('bundles') or {}
+        self.generated_at = float(stored.get('generated_at', 0))
+
+    def save(self):
+        with self._lock:
+            payload = {
+                'format_version': TIPS_FORMAT_VERSION,
+                'generated_at': self.generated_at,
+                'bundles': self.bundles,
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                json.dump(payload, fh, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, language, band):
+        """Stored tips for ``language`` and ``band``, or None"""
+        return self.bundles.get(language, {}).get(band)
+
+    def put(self, language, band, tips):
+        with self._lock:
+            # Copy-on-write so readers never see a half-updated language
+            self.bundles = {**self.bundles, language: {**self.bundles.get(language, {}), band: tips}}
+
+    def is_stale(self, now=None):
+        """
+        True when a built store has outlived ``max_age`` and no build was tried lately
+
+        A store that was never built (only bundles stored lazily) is never
+        stale: rebuilding it would regenerate every bundle at once.
+        """
+        now = time.time() if now is None else now
+        if not self.generated_at:
+            return False
+        return now - self.generated_at > self.max_age and now - self._last_attempt > RETRY_AFTER
+
+    def build(self, generate, languages=LANGUAGES, model=DEFAULT_MODEL, workers=4):
+        """
+        Generate every bundle with ``generate(model, prompt)`` and save
+
+        Bundles that fail keep their previous text. Returns the number of
+        bundles generated. Pass ``InsightService.generator()`` to share its
+        cache and in-flight requests.
+        """
+        # Recorded even if every bundle fails, so a failing model is backed off
+        self._last_attempt = time.time()
+        keys = bundle_keys(languages)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {key: pool.submit(generate, model, tips_prompt(*key)) for key in keys}
+        built = 0
+        for (language, band), future in futures.items():
+            try:
+                self.put(language, band, future.result())
+                built += 1
+            except Exception as e:
+                self.last_error = f"{language}/{band}: {type(e).__name__}: {e}"
+        if built:
+            self.generated_at = time.time()
+            self.save()
+        return built
+
+    def refresh(self, generate, wait=True, **kwargs):
+        """Rebuild every bundle; with ``wait=False`` this runs on a background thread"""
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+
+        def run():
+            try:
+                return self.build(generate, **kwargs)
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        if wait:
+            return run()
+        threading.Thread(target=run, name='tip-bundle-refresh', daemon=True).start()
+        return True
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_tip_store():
+    """Process-wide bundle store at ``NANOFIN_TIP_BUNDLES`` (or ~/.cache/nanofin)"""
+    global _default_store
+    path = Path(os.environ.get(TIPS_ENV_VAR) or DEFAULT_TIPS_PATH)
+    with _default_store_lock:
+        if _default_store is None or _default_store.path != path:
+            _default_store = TipBundleStore(path)
+        return _default_store
+
+def main(argv=None):
+    from .service import gemini_generator
+
+    parser = argparse.ArgumentParser(
+        prog='nanofin-tips',
+        description='Pre-generate credit improvement tips for every language and score band.'
+    )
+    parser.add_argument('--api-key', default=os.environ.get('GEMINI_API_KEY'),
+                        help='Gemini API key (default: $GEMINI_API_KEY)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='Bundle file (default: $NANOFIN_TIP_BUNDLES or ~/.cache/nanofin/tip_bundles.json)')
+    parser.add_argument('--model', default=DEFAULT_MODEL, help='Gemini model name')
+    parser.add_argument('-w', '--workers', type=int, default=4,
+                        help='Concurrent Gemini requests')
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        print("[ERROR] No Gemini API key: pass --api-key or set GEMINI_API_KEY", file=sys.stderr)
+        return 1
+
+    store = TipBundleStore(args.output)
+    start = time.perf_counter()
+    built = store.build(gemini_generator(args.api_key), model=args.model, workers=args.workers)
+    total = len(bundle_keys())
+    print(f"[SUCCESS] Generated {built}/{total} tip bundles "
+          f"in {time.perf_counter() - start:.1f}s -> {store.path}")
+    if built < total:
+        print(f"[WARNING] Last error: {store.last_error}")
+    return 0 if built else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Cached YouTube learning-video recommendations.
+
+    videos = get_video_recommendations()
+    videos.prefetch("credit score improvement financial literacy", LANGUAGES)
+    future = videos.submit(query, 'Hindi')   # resolved at once when cached
+
+The query shown for each language barely changes, so results are cached per
+(query, language) for ``ttl`` seconds. Searches run on a thread pool, never
+on the Streamlit script thread. A stale entry is served as-is while it is
+re-fetched in the background, and concurrent requests for the same entry share
+one search. A failed search keeps the previous results and is retried after
+``RETRY_AFTER`` seconds.
+
+The search is any ``search(query, max_results)`` callable returning
+youtube-search-python style dicts, so a local stub can stand in for YouTube.
+youtube-search-python is optional.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    from youtube_search import YoutubeSearch
+except ImportError:  # pragma: no cover - optional dependency
+    YoutubeSearch = None
+
+DEFAULT_TTL = 12 * 60 * 60
+DEFAULT_MAX_RESULTS = 5
+DEFAULT_WORKERS = 6
+# After a failed search, wait this long before trying again
+RETRY_AFTER = 5 * 60
+
+
+def youtube_search(query, max_results=DEFAULT_MAX_RESULTS):
+    """Raw results from youtube-search-python"""
+    if YoutubeSearch is None:
+        raise ImportError("youtube-search-python is required for video recommendations: "
+                          "pip install youtube-search-python")
+    return YoutubeSearch(query, max_results=max_results).to_dict()
+
+def localized_query(query, language='English'):
+    return f"{query} in {language}"
+
+def video_from_result(video):
+    """The fields the pages display, from one raw search result"""
+    return {
+        'title': video['title'],
+        'channel': video['channel'],
+        'thumbnail': video['thumbnails'][0],
+        'link': f"https://youtube.com/watch?v={video['id']}"
+    }
+
+
+class VideoRecommendations:
+    """TTL cache of video searches keyed by (query, language)"""
+
+    def __init__(self, search=youtube_search, ttl=DEFAULT_TTL, max_results=DEFAULT_MAX_RESULTS,
+                 max_workers=DEFAULT_WORKERS):
+        self.search = search
+        self.ttl = ttl
+        self.max_results = max_results
+        self.last_error = None
+        self._entries = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='videos')
+
+    def _fetch(self, key):
+        query, language = key
+        try:
+            videos = [video_from_result(video)
+                      for video in self.search(localized_query(query, language), self.max_results)]
+            with self._lock:
+                self._entries[key] = (videos, time.time())
+            return videos
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            with self._lock:
+                videos = self._entries.get(key, ([], 0.0))[0]
+                # Keep what we had, and retry after RETRY_AFTER rather than on every render
+                self._entries[key] = (videos, time.time() - self.ttl + RETRY_AFTER)
+            if not videos:
+                raise
+            return videos
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _schedule(self, key):
+        # Called with the lock held; one search per key at a time
+        future = self._in_flight.get(key)
+        if future is None:
+            future = self._executor.submit(self._fetch, key)
+            self._in_flight[key] = future
+        return future
+
+    def _lookup(self, key):
+        # Called with the lock held: (cached videos or None, fetch future or None)
+        entry = self._entries.get(key)
+        future = None
+        if entry is None or time.time() - entry[1] > self.ttl:
+            future = self._schedule(key)
+        return (None if entry is None else entry[0]), future
+
+    def get(self, query, language='English'):
+        """Cached videos, or None; never waits, but schedules a fetch when missing or stale"""
+        with self._lock:
+            return self._lookup((query, language))[0]
+
+    def submit(self, query, language='English'):
+        """Future for the videos; already resolved when anything is cached"""
+        # One lock for lookup and schedule, so a fetch finishing in between
+        # can't be followed by a second search
+        with self._lock:
+            videos, future = self._lookup((query, language))
+        if videos is None:
+            return future
+        future = Future()
+        future.set_result(videos)
+        return future
+
+    def prefetch(self, query, languages):
+        """Start searches for every language that is not cached yet"""
+        for language in languages:
+            self.get(query, language)
+
+
+_default_recommendations = None
+_default_recommendations_lock = threading.Lock()
+
+
+def get_video_recommendations():
+    """Process-wide recommendation cache shared by every session"""
+    global _default_recommendations
+    with _default_recommendations_lock:
+        if _default_recommendations is None:
+            _default_recommendations = VideoRecommendations()
+        return _default_recommendations
@@ -0,0 +1,43 @@
+"""
+Loan products shared by the marketplace views.
+
+    from nanofin.loans import get_loan_catalogue, customer_profile
+"""
+
+from .eligibility import (
+    calculate_credit_score,
+    customer_profile,
+    is_eligible,
+    upgrade_eligibility,
+)
+from .catalogue import (
+    LoanCatalogue,
+    get_loan_catalogue,
+    normalize_loan,
+    normalize_loans,
+)
+from .matcher import LoanIndex
+from .bulk import eligibility_matrix, eligibility_pairs
+from .flows import LoanFlowDetector, detect_loan_flows, get_loan_flow_detector
+from .amortization import amortize_loans, analyze_loans, assess_loans, repayment_behaviour
+
+__all__ = [
+    'LoanCatalogue',
+    'get_loan_catalogue',
+    'normalize_loan',
+    'normalize_loans',
+    'LoanIndex',
+    'eligibility_matrix',
+    'eligibility_pairs',
+    'LoanFlowDetector',
+    'detect_loan_flows',
+    'get_loan_flow_detector',
+    'amortize_loans',
+    'assess_loans',
+    'analyze_loans',
+    'repayment_behaviour',
+    'calculate_credit_score',
+    'customer_profile',
+    'is_eligible',
+    'upgrade_eligibility',
+]
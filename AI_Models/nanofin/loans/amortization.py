@@ -0,0 +1,210 @@
+"""
+Amortization schedules fitted to the loans found in a statement.
+
+    assessment = analyze_loans(uploaded_file)
+    assessment['amortization']   # one row per loan: effective_rate, tenure_days, on_time_ratio, ...
+    assessment['behaviour']      # statement-level figures the worthiness score uses
+
+Informal loans carry no contract terms, so the schedule is inferred from the
+repayments themselves. The installment cadence is the median gap between
+consecutive payments on a loan (receipt to first payment included), and the
+k-th installment falls due ``k * cadence`` days after the receipt. A payment
+more than ``GRACE_DAYS`` after its due date is late. An open loan whose next
+installment has passed by the end of the statement is overdue by that much.
+
+The effective rate is the annual IRR of receipt and repayments, so it reflects
+when money came back and not just how much. It is solved by Newton's method
+for every repaid loan at once, with the per-loan sums done by ``np.bincount``.
+Open loans have no rate yet.
+
+``analyze_loans`` caches the whole assessment in the process-wide result
+cache, keyed by the statement's SHA-256 and the detector's keywords. Reruns of
+the page therefore only hash the upload; on a miss, the page's already-loaded
+frame is assessed rather than reading the upload again.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..core.cache import get_result_cache
+from ..core.store import load_statement, statement_digest
+from .flows import detect_loan_flows, get_loan_flow_detector
+
+GRACE_DAYS = 3
+# Cadence assumed for a loan that has no repayments to infer one from
+DEFAULT_CADENCE_DAYS = 30
+NEWTON_ITERATIONS = 50
+NEWTON_TOLERANCE = 1e-10
+DAYS_PER_YEAR = 365.0
+
+AMORTIZATION_COLUMNS = [
+    'loan_id', 'date', 'counterparty', 'amount', 'repaid', 'outstanding',
+    'installments', 'cadence_days', 'installment', 'effective_rate',
+    'tenure_days', 'on_time_ratio', 'days_past_due',
+]
+
+
+def effective_rates(loan_ids, years, amounts, principal):
+    """
+    Annual IRR per loan, solved for all loans together
+
+    ``loan_ids``, ``years`` (since receipt) and ``amounts`` describe the
+    repayments; ``principal`` is indexed by loan_id. Loans not yet repaid in
+    full, or repaid the same day they were received, come back NaN.
+    """
+    n = len(principal)
+    timed = np.bincount(loan_ids, weights=years, minlength=n) > 0
+    solvable = timed & (np.bincount(loan_ids, weights=amounts, minlength=n) >= principal)
+
+    # Solve for x = log(1 + rate): f(x) = sum(a * e^(-x t)) - P is convex and
+    # decreasing with f(0) >= 0, so Newton from x = 0 climbs monotonically onto the root
+    x = np.zeros(n)
+    active = solvable.copy()
+    for _ in range(NEWTON_ITERATIONS):
+        discounted = amounts * np.exp(-x[loan_ids] * years)
+        f = np.bincount(loan_ids, weights=discounted, minlength=n) - principal
+        slope = -np.bincount(loan_ids, weights=years * discounted, minlength=n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(active, f / slope, 0.0)
+        x -= step
+        active &= np.abs(step) > NEWTON_TOLERANCE
+        if not active.any():
+            break
+
+    return np.where(solvable, np.expm1(x), np.nan)
+
+
+def amortize_loans(loans, schedule, as_of=None):
+    """
+    Fitted schedule and repayment behaviour for every loan
+
+    ``loans`` and ``schedule`` are the frames from ``detect_loan_flows``;
+    ``as_of`` (default: the latest repayment) is when open loans are checked
+    for overdue installments. Rates are percentages. ``installment`` is the
+    level payment that amortizes a repaid loan at its rate, and the average
+    payment so far on an open one. ``on_time_ratio`` is NaN for a loan with no
+    repayments.
+    """
+    n = len(loans)
+    paid = schedule[(schedule['loan_id'] >= 0) & schedule['date'].notna()]
+    paid = paid.sort_values(['loan_id', 'date'], kind='stable')
+    loan_ids = paid['loan_id'].to_numpy(dtype=np.int64)
+    amounts = paid['amount'].to_numpy(dtype=np.float64)
+
+    received = loans['date'].to_numpy(dtype='datetime64[ns]')
+    days = (paid['date'].to_numpy(dtype='datetime64[ns]') - received[loan_ids]) / np.timedelta64(1, 'D')
+
+    # Gap to the previous payment on the same loan, or to the receipt for the first
+    first = np.r_[True, loan_ids[1:] != loan_ids[:-1]] if len(loan_ids) else np.empty(0, dtype=bool)
+    gaps = np.where(first, days, np.diff(days, prepend=0.0))
+    cadence = pd.Series(gaps).groupby(loan_ids).median().reindex(range(n)).to_numpy()
+    cadence = np.where(np.isnan(cadence), DEFAULT_CADENCE_DAYS, np.maximum(np.round(cadence), 1.0))
+
+    # k-th payment against the k-th installment
+    position = np.arange(len(loan_ids))
+    k = position - np.maximum.accumulate(np.where(first, position, 0)) + 1
+    lateness = np.maximum(days - k * cadence[loan_ids], 0.0)
+    count = np.bincount(loan_ids, minlength=n)
+    on_time = np.bincount(loan_ids, weights=lateness <= GRACE_DAYS, minlength=n)
+    days_past_due = np.zeros(n)
+    np.maximum.at(days_past_due, loan_ids, lateness)
+
+    principal = loans['amount'].to_numpy(dtype=np.float64)
+    repaid = loans['repaid'].to_numpy(dtype=np.float64)
+    outstanding = loans['outstanding'].to_numpy(dtype=np.float64)
+    last_day = np.zeros(n)
+    np.maximum.at(last_day, loan_ids, days)
+
+    # Open loans are also behind by however long their next installment is overdue
+    if as_of is None:
+        as_of = paid['date'].max() if len(paid) else loans['date'].max()
+    elapsed = (pd.Timestamp(as_of).to_datetime64() - received) / np.timedelta64(1, 'D')
+    overdue = np.where(outstanding > 0, elapsed - (count + 1) * cadence, 0.0)
+    days_past_due = np.maximum(days_past_due, np.nan_to_num(overdue))
+
+    rate = effective_rates(loan_ids, days / DAYS_PER_YEAR, amounts, principal)
+
+    period_rate = np.power(1 + np.nan_to_num(rate), cadence / DAYS_PER_YEAR) - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        level = principal * period_rate / -np.expm1(-count * np.log1p(period_rate))
+        level = np.where(period_rate > 0, level, principal / count)
+        installment = np.where(np.isnan(rate), repaid / count, level)
+        on_time_ratio = on_time / count
+
+    return pd.DataFrame({
+        'loan_id': loans['loan_id'].to_numpy(),
+        'date': loans['date'].to_numpy(),
+        'counterparty': loans['counterparty'].to_numpy(),
+        'amount': principal,
+        'repaid': repaid,
+        'outstanding': outstanding,
+        'installments': count,
+        'cadence_days': cadence.astype(np.int64),
+        'installment': installment,
+        'effective_rate': rate * 100,
+        'tenure_days': np.where(count > 0, last_day, np.nan),
+        'on_time_ratio': on_time_ratio,
+        'days_past_due': days_past_due,
+    }, columns=AMORTIZATION_COLUMNS)
+
+
+def repayment_behaviour(amortization):
+    """Statement-level repayment figures across all loans"""
+    installments = amortization['installments'].sum()
+    on_time = (amortization['on_time_ratio'].fillna(0) * amortization['installments']).sum()
+    closed = amortization[amortization['outstanding'] <= 0]
+    rated = closed[closed['effective_rate'].notna()]
+    return {
+        'on_time_ratio': on_time / installments if installments else np.nan,
+        'days_past_due': float(amortization['days_past_due'].max()),
+        'effective_rate': np.average(rated['effective_rate'], weights=rated['amount']) if len(rated) else np.nan,
+        'open_loans': int((amortization['outstanding'] > 0).sum()),
+        'closed_loans': len(closed),
+    }
+
+
+def assess_loans(df, detector=None, as_of=None):
+    """``detect_loan_flows`` plus ``amortization`` and ``behaviour``, or None without loans"""
+    flows = detect_loan_flows(df, detector)
+    if flows is None:
+        return None
+    if as_of is None:
+        as_of = df['date'].max()
+    amortization = amortize_loans(flows['loans'], flows['schedule'], as_of=as_of)
+    return {
+        **flows,
+        'amortization': amortization,
+        'behaviour': repayment_behaviour(amortization),
+    }
+
+
+def analyze_loans(source=None, cache=None, detector=None, digest=None, df=None):
+    """
+    ``assess_loans`` for a statement, served from the result cache when seen before
+
+    ``digest`` skips re-hashing ``source`` when the caller already has it.
+    A caller that has already loaded the statement passes ``df`` and
+    ``digest`` instead of ``source``: an upload stream can only be read once.
+    """
+    if df is None and source is None:
+        raise ValueError("analyze_loans needs a statement source or a loaded frame")
+    if digest is None:
+        if source is None:
+            raise ValueError("analyze_loans needs the statement digest to cache a loaded frame")
+        digest = statement_digest(source)
+    if cache is None:
+        cache = get_result_cache()
+    detector = detector or get_loan_flow_detector()
+    key = ('loans', digest, detector.receipt_keywords, detector.repayment_keywords,
+           detector.counterparty_pattern)
+
+    # Wrapped in a tuple so statements without loans are cached too
+    cached = cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    if df is None:
+        _, df = load_statement(source, digest=digest)
+    assessment = assess_loans(df, detector)
+    cache.put(key, (assessment,))
+    return assessment
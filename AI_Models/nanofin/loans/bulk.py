@@ -0,0 +1,120 @@
+"""
+Customer x product eligibility for whole applicant books.
+
+    profiles = pd.DataFrame({'customer_id': [...], 'credit_score': [...], 'monthly_income': [...]})
+    matrix = eligibility_matrix(profiles, load_loan_database())
+
+The marketplace rules from ``nanofin.loans.eligibility`` are evaluated with
+NumPy over every customer and product at once. The result is sparse: one row
+per eligible (customer, product) pair, never a dense n x m grid. Loans are
+sorted by income threshold, so a customer's eligible set is a prefix of that
+order found with one ``searchsorted``. The pairs are expanded with
+``repeat``/``arange``, so memory grows with the number of matches.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .eligibility import (
+    ELIGIBILITY_MIN_CREDIT_SCORE,
+    INCOME_TO_MIN_AMOUNT_RATIO,
+    MIN_UPGRADE_RATE,
+    UPGRADE_MONTHS,
+)
+
+MATRIX_COLUMNS = [
+    'customer_id',
+    'customer',
+    'product',
+    'category',
+    'loan_name',
+    'interest_rate',
+    'upgrade_eligible',
+    'new_interest_rate',
+    'max_amount_increase',
+]
+
+
+def _profile_arrays(profiles):
+    frame = profiles if isinstance(profiles, pd.DataFrame) else pd.DataFrame(list(profiles))
+    if frame.empty:
+        return np.array([], dtype=object), np.array([]), np.array([])
+    if 'customer_id' in frame:
+        customer_ids = frame['customer_id'].to_numpy()
+    else:
+        customer_ids = np.arange(len(frame))
+    credit_score = pd.to_numeric(frame['credit_score'], errors='coerce').to_numpy(dtype=np.float64)
+    monthly_income = pd.to_numeric(frame['monthly_income'], errors='coerce').to_numpy(dtype=np.float64)
+    return customer_ids, credit_score, monthly_income
+
+def _product_arrays(loan_database):
+    entries = [(category, loan) for category, loans in loan_database.items() for loan in loans]
+    loans = [loan for _, loan in entries]
+    return entries, {
+        'interest_rate': np.array([loan['interest_rate'] for loan in loans], dtype=np.float64),
+        'threshold': np.array([loan['min_amount'] for loan in loans], dtype=np.float64) * INCOME_TO_MIN_AMOUNT_RATIO,
+        'upgrade_score': np.array([loan['upgrade_criteria']['min_credit_score'] for loan in loans], dtype=np.float64),
+        'interest_reduction': np.array([loan['upgrade_criteria']['interest_reduction'] for loan in loans], dtype=np.float64),
+    }
+
+def eligibility_pairs(credit_score, monthly_income, threshold):
+    """
+    Sparse (customer, product) index pairs where the eligibility rule holds
+
+    A customer with score >= 60 qualifies for every product whose income
+    threshold is strictly below their mean credit.
+    """
+    order = np.argsort(threshold, kind='stable')
+    counts = np.searchsorted(threshold[order], monthly_income, side='left')
+    counts[~(credit_score >= ELIGIBILITY_MIN_CREDIT_SCORE) | np.isnan(monthly_income)] = 0
+
+    customers = np.repeat(np.arange(len(counts)), counts)
+    # Position of each pair within its customer's prefix of the sorted products
+    offsets = np.arange(len(customers)) - np.repeat(np.cumsum(counts) - counts, counts)
+    products = order[offsets]
+
+    # Customer-major, catalogue order within a customer; sorting one packed
+    # int64 key is several times faster than a two-key lexsort
+    n_products = len(threshold)
+    key = np.sort(customers.astype(np.int64) * n_products + products)
+    return key // n_products, key % n_products
+
+def eligibility_matrix(profiles, loan_database):
+    """
+    Every eligible (customer, product) pair with its upgrade terms
+
+    ``profiles`` is a DataFrame or list of dicts with ``credit_score`` and
+    ``monthly_income`` (as from ``customer_profile``), plus an optional
+    ``customer_id``. Returns a long DataFrame with one row per eligible pair:
+    ``customer`` and ``product`` are row/column indices into the implied
+    matrix, and the upgrade columns match ``calculate_loan_upgrade_eligibility``.
+    """
+    customer_ids, credit_score, monthly_income = _profile_arrays(profiles)
+    entries, products = _product_arrays(loan_database)
+    if not entries or not len(credit_score):
+        return pd.DataFrame({column: [] for column in MATRIX_COLUMNS})
+
+    customers, product_idx = eligibility_pairs(credit_score, monthly_income, products['threshold'])
+
+    # Eligible pairs already satisfy the income rule; upgrades add the score criterion
+    upgrade = credit_score[customers] >= products['upgrade_score'][product_idx]
+    new_rate = np.maximum(
+        MIN_UPGRADE_RATE,
+        products['interest_rate'][product_idx] - products['interest_reduction'][product_idx]
+    )
+    increase = np.where(upgrade, monthly_income[customers] * UPGRADE_MONTHS, 0.0)
+
+    # Categoricals keep millions of pairs to one small code per row
+    category_codes, category_values = pd.factorize(pd.Series([category for category, _ in entries]))
+    name_codes, name_values = pd.factorize(pd.Series([loan['name'] for _, loan in entries]))
+    return pd.DataFrame({
+        'customer_id': customer_ids[customers],
+        'customer': customers,
+        'product': product_idx,
+        'category': pd.Categorical.from_codes(category_codes[product_idx], category_values),
+        'loan_name': pd.Categorical.from_codes(name_codes[product_idx], name_values),
+        'interest_rate': products['interest_rate'][product_idx],
+        'upgrade_eligible': upgrade,
+        'new_interest_rate': new_rate,
+        'max_amount_increase': increase,
+    })
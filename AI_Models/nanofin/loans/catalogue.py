@@ -0,0 +1,237 @@
+"""
+Offline-first loan catalogue.
+
+    catalogue = get_loan_catalogue('marketplace', BASE_LOANS,
+                                   fetch_additional=get_loan_types_from_gemini,
+                                   fallback_additional=OFFLINE_ADDITIONAL_LOANS)
+    loan_database = catalogue.loans()
+
+``loans()`` never waits on the network. It serves the last good catalogue from
+memory, or from the versioned JSON cache on disk
+(``~/.cache/nanofin/loan_catalogue.json`` or ``NANOFIN_LOAN_CATALOGUE``), or
+the offline fallback. When that copy is older than ``ttl`` seconds, a single
+background thread calls ``fetch_additional``. If the result validates, the
+thread publishes it and writes it to disk; if not, it is discarded and the
+previous catalogue stays in service.
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from .matcher import LoanIndex
+
+CATALOGUE_ENV_VAR = 'NANOFIN_LOAN_CATALOGUE'
+DEFAULT_CATALOGUE_PATH = Path.home() / '.cache' / 'nanofin' / 'loan_catalogue.json'
+# Bump when the cached catalogue layout changes; older files are ignored
+CATALOGUE_FORMAT_VERSION = 1
+DEFAULT_TTL = 6 * 60 * 60
+# After a failed refresh, wait this long before trying again
+RETRY_AFTER = 5 * 60
+
+REQUIRED_LOAN_FIELDS = (
+    'name', 'provider', 'interest_rate', 'min_amount', 'max_amount',
+    'processing_time', 'processing_fee', 'required_documents', 'features',
+    'suitable_for', 'upgrade_criteria',
+)
+REQUIRED_UPGRADE_FIELDS = ('min_credit_score', 'interest_reduction')
+NUMERIC_LOAN_FIELDS = ('interest_rate', 'min_amount', 'max_amount')
+
+
+def _number(value):
+    # Generated loans often quote numbers as strings ("100000"); amounts that
+    # are whole stay ints so they format the same as the built-in loans
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"not a finite number: {value!r}")
+    return int(number) if number.is_integer() and not isinstance(value, float) else number
+
+def normalize_loan(loan):
+    """
+    Validate one loan dict and coerce its numeric fields; None if unusable
+
+    Rates, amounts and upgrade criteria are stored as numbers, and tuple
+    fields lost in JSON are restored.
+    """
+    if not isinstance(loan, dict) or any(field not in loan for field in REQUIRED_LOAN_FIELDS):
+        return None
+    criteria = loan['upgrade_criteria']
+    if not isinstance(criteria, dict) or any(field not in criteria for field in REQUIRED_UPGRADE_FIELDS):
+        return None
+    try:
+        numbers = {field: _number(loan[field]) for field in NUMERIC_LOAN_FIELDS}
+        criteria = {**criteria, **{field: _number(criteria[field]) for field in REQUIRED_UPGRADE_FIELDS}}
+    except (TypeError, ValueError):
+        return None
+
+    loan = {**loan, **numbers, 'upgrade_criteria': criteria}
+    if isinstance(loan.get('tenure_range'), list):
+        loan['tenure_range'] = tuple(loan['tenure_range'])
+    return loan
+
+def normalize_loans(loans):
+    """Keep only the loans that pass ``normalize_loan``"""
+    return [loan for loan in map(normalize_loan, loans or []) if loan is not None]
+
+
+class LoanCatalogue:
+    """Base loans plus a refreshable set of generated loans, served from cache"""
+
+    def __init__(self, base_loans, fetch_additional=None, fallback_additional=(),
+                 path=None, ttl=DEFAULT_TTL):
+        self.base_loans = base_loans
+        self.fetch_additional = fetch_additional
+        self.fallback_additional = normalize_loans(fallback_additional)
+        self.path = Path(path or os.environ.get(CATALOGUE_ENV_VAR) or DEFAULT_CATALOGUE_PATH)
+        self.ttl = ttl
+
+        self.additional = None
+        self.revision = 0
+        self.fetched_at = 0.0
+        self.source = None
+        self.last_error = None
+        self.save_error = None
+        self._last_attempt = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._index = None
+        self._index_key = None
+
+    def _load_from_disk(self):
+        try:
+            cached = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(cached, dict) or cached.get('format_version') != CATALOGUE_FORMAT_VERSION:
+            return False
+        additional = normalize_loans(cached.get('additional_loans'))
+        if not additional:
+            return False
+        self.additional = additional
+        self.revision = int(cached.get('revision', 0))
+        self.fetched_at = float(cached.get('fetched_at', 0))
+        self.source = 'disk'
+        return True
+
+    def _save_to_disk(self):
+        payload = {
+            'format_version': CATALOGUE_FORMAT_VERSION,
+            'revision': self.revision,
+            'fetched_at': self.fetched_at,
+            'additional_loans': self.additional,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                json.dump(payload, fh, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self.additional is None and not self._load_from_disk():
+                self.additional = self.fallback_additional
+                self.source = 'fallback'
+
+    def is_stale(self, now=None):
+        now = time.time() if now is None else now
+        return self.source == 'fallback' or now - self.fetched_at > self.ttl
+
+    def loans(self):
+        """The current catalogue, scheduling a background refresh if it is stale"""
+        self._ensure_loaded()
+        if self.fetch_additional is not None and self.is_stale():
+            self.refresh(wait=False)
+        return {**self.base_loans, 'additional_loans': self.additional}
+
+    def index(self):
+        """``LoanIndex`` over ``loans()``, rebuilt only when the catalogue changes"""
+        loan_database = self.loans()
+        # Key on the snapshot just returned; a background refresh may swap ``additional``
+        key = (id(self.base_loans), id(loan_database['additional_loans']))
+        if self._index is None or self._index_key != key:
+            self._index = LoanIndex(loan_database)
+            self._index_key = key
+        return self._index
+
+    def refresh(self, wait=True):
+        """Fetch new generated loans; with ``wait=False`` this returns immediately"""
+        with self._lock:
+            if self._refreshing or self.fetch_additional is None:
+                return False
+            if not wait and time.time() - self._last_attempt < RETRY_AFTER:
+                return False
+            self._refreshing = True
+            self._last_attempt = time.time()
+
+        if wait:
+            return self._run_refresh()
+        threading.Thread(target=self._run_refresh, name='loan-catalogue-refresh', daemon=True).start()
+        return True
+
+    def _run_refresh(self):
+        try:
+            additional = normalize_loans(self.fetch_additional())
+            if not additional:
+                raise ValueError("catalogue refresh returned no valid loans")
+            with self._lock:
+                self.additional = additional
+                self.revision += 1
+                self.fetched_at = time.time()
+                self.source = 'remote'
+                self.last_error = None
+            # The refresh succeeded even if saving it fails; that only costs the next cold start
+            try:
+                self._save_to_disk()
+                self.save_error = None
+            except OSError as e:
+                self.save_error = f"{type(e).__name__}: {e}"
+            return True
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def status(self):
+        return {
+            'revision': self.revision,
+            'source': self.source,
+            'fetched_at': self.fetched_at,
+            'refreshing': self._refreshing,
+            'last_error': self.last_error,
+            'save_error': self.save_error,
+        }
+
+
+_catalogues = {}
+_catalogues_lock = threading.Lock()
+
+
+def get_loan_catalogue(name, base_loans, fetch_additional=None, fallback_additional=(), **kwargs):
+    """
+    Process-wide catalogue for ``name``
+
+    Streamlit re-executes the page script on every rerun, so the catalogue has
+    to live in an imported module to survive between renders. The base loans
+    and fetcher are updated on every call so edits to the page take effect.
+    """
+    with _catalogues_lock:
+        catalogue = _catalogues.get(name)
+        if catalogue is None:
+            catalogue = LoanCatalogue(base_loans, fetch_additional, fallback_additional, **kwargs)
+            _catalogues[name] = catalogue
+        else:
+            # Keep the existing object when unchanged so the cached index stays valid
+            if catalogue.base_loans != base_loans:
+                catalogue.base_loans = base_loans
+            catalogue.fetch_additional = fetch_additional
+        return catalogue
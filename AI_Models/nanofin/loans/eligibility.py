@@ -0,0 +1,68 @@
+"""
+Credit profile and eligibility rules for marketplace loans.
+
+The rules are the ones the marketplace has always shown:
+
+* a customer is eligible for a loan when their credit score is at least 60
+  and their average credit exceeds 10% of the loan's minimum amount;
+* an upgrade is available when the same income condition holds and the score
+  meets the loan's ``upgrade_criteria.min_credit_score``; the upgraded rate is
+  the loan rate minus ``interest_reduction``, floored at 5%.
+"""
+
+ELIGIBILITY_MIN_CREDIT_SCORE = 60
+INCOME_TO_MIN_AMOUNT_RATIO = 0.1
+MIN_UPGRADE_RATE = 5.0
+UPGRADE_MONTHS = 12
+
+
+def calculate_credit_score(transactions_df):
+    """Enhanced credit score calculation with detailed metrics"""
+    credit_sum = transactions_df['credit'].sum()
+    debit_sum = transactions_df['debit'].sum()
+    balance_trend = transactions_df['balance'].diff().mean()
+    transaction_consistency = len(transactions_df) / 30  # Normalized by month
+
+    # Detailed scoring components
+    components = {
+        'income_stability': min(30, (credit_sum / debit_sum) * 15) if debit_sum > 0 else 30,
+        'balance_growth': 25 if balance_trend > 0 else 10,
+        'transaction_history': min(25, transaction_consistency * 5),
+        'payment_regularity': 20 if (transactions_df['debit'] > 0).all() else 10
+    }
+
+    total_score = sum(components.values())
+    return int(total_score), components
+
+def customer_profile(transactions_df):
+    """Everything the loan rules need about a customer, computed once"""
+    credit_score, components = calculate_credit_score(transactions_df)
+    return {
+        'credit_score': credit_score,
+        'credit_components': components,
+        'monthly_income': float(transactions_df['credit'].mean()),
+    }
+
+def income_threshold(loan):
+    """Average credit a customer must exceed to qualify for ``loan``"""
+    return loan['min_amount'] * INCOME_TO_MIN_AMOUNT_RATIO
+
+def is_eligible(profile, loan):
+    return (
+        profile['credit_score'] >= ELIGIBILITY_MIN_CREDIT_SCORE and
+        profile['monthly_income'] > income_threshold(loan)
+    )
+
+def upgrade_eligibility(profile, loan):
+    """Upgrade terms for ``loan``, same dict as ``calculate_loan_upgrade_eligibility``"""
+    criteria = loan['upgrade_criteria']
+    monthly_income = profile['monthly_income']
+    eligible = (
+        profile['credit_score'] >= criteria['min_credit_score'] and
+        monthly_income > income_threshold(loan)
+    )
+    return {
+        'eligible': eligible,
+        'new_interest_rate': max(MIN_UPGRADE_RATE, loan['interest_rate'] - criteria['interest_reduction']),
+        'max_amount_increase': monthly_income * UPGRADE_MONTHS if eligible else 0
+    }
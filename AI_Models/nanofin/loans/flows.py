@@ -0,0 +1,183 @@
+"""
+Loan receipts and repayments found in a statement, paired into per-loan schedules.
+
+    flows = detect_loan_flows(df)
+    flows['loans']      # one row per loan received
+    flows['schedule']   # one row per repayment, with the loan_id it pays down
+
+A row is a loan receipt when its description contains a receipt keyword and
+it is a credit, and a repayment when it contains a repayment keyword and is a
+debit (the rules the CreditFlow view has always used). Both keyword lists and
+the counterparty pattern are compiled into one regex, which runs once per
+distinct description.
+
+Each repayment is paid against the latest receipt on or before its date from
+the same counterparty, or from anyone if that counterparty never lent. The
+pairing is a sorted ``merge_asof``, so a customer with many informal loans
+gets one schedule per loan in O(n log n).
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+RECEIPT_KEYWORDS = ('LOAN',)
+REPAYMENT_KEYWORDS = ('REPAYMENT',)
+# "Loan Received from Friend", "Loan Repayment to Friend - Part 2"
+COUNTERPARTY_PATTERN = r'\b(?:FROM|TO)\s+(?P<counterparty>.+?)(?:\s+-\s+|$)'
+
+LOAN_COLUMNS = [
+    'loan_id', 'date', 'counterparty', 'amount', 'repaid', 'repayment_count',
+    'last_repayment', 'outstanding', 'repayment_percentage',
+]
+SCHEDULE_COLUMNS = ['loan_id', 'date', 'counterparty', 'amount']
+
+
+def _alternation(keywords):
+    # Longest first so a keyword never hides a longer one it prefixes
+    return '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+
+
+class LoanFlowDetector:
+    """
+    Receipt/repayment keywords and counterparty pattern, compiled once
+
+    ``counterparty_pattern`` must capture the lender's name in a group named
+    ``counterparty``; pass None to pair on dates alone.
+    """
+
+    def __init__(self, receipt_keywords=RECEIPT_KEYWORDS, repayment_keywords=REPAYMENT_KEYWORDS,
+                 counterparty_pattern=COUNTERPARTY_PATTERN):
+        if not receipt_keywords or not repayment_keywords:
+            raise ValueError("LoanFlowDetector needs receipt and repayment keywords")
+        self.receipt_keywords = tuple(receipt_keywords)
+        self.repayment_keywords = tuple(repayment_keywords)
+        self.counterparty_pattern = counterparty_pattern
+
+        # Independent lookaheads: one match reports every feature of a description
+        parts = [
+            f'(?=.*?(?P<receipt>{_alternation(self.receipt_keywords)}))?',
+            f'(?=.*?(?P<repayment>{_alternation(self.repayment_keywords)}))?',
+        ]
+        if counterparty_pattern:
+            parts.append(f'(?=.*?{counterparty_pattern})?')
+        self._pattern = re.compile(''.join(parts), re.IGNORECASE | re.DOTALL)
+
+    def classify(self, df):
+        """``is_receipt``, ``is_repayment`` and ``counterparty`` for every row of ``df``"""
+        codes, descriptions = pd.factorize(df['description'].fillna('').astype(str))
+        receipt = np.zeros(len(descriptions), dtype=bool)
+        repayment = np.zeros(len(descriptions), dtype=bool)
+        counterparty = np.full(len(descriptions), '', dtype=object)
+        for i, description in enumerate(descriptions):
+            match = self._pattern.match(description)
+            receipt[i] = match['receipt'] is not None
+            repayment[i] = match['repayment'] is not None
+            if self.counterparty_pattern and match['counterparty']:
+                counterparty[i] = ' '.join(match['counterparty'].split()).upper()
+
+        return pd.DataFrame({
+            'is_receipt': receipt[codes] & (df['credit'].to_numpy() > 0),
+            'is_repayment': repayment[codes] & (df['debit'].to_numpy() > 0),
+            'counterparty': counterparty[codes],
+        }, index=df.index)
+
+    def detect(self, df):
+        """
+        Loan flows in ``df``, or None when it has no receipts or no repayments
+
+        Returns the aggregate figures the CreditFlow view shows
+        (``total_loan_amount``, ``repayment_percentage``, ...) plus ``loans``
+        and ``schedule`` frames. Repayments dated before every receipt have
+        ``loan_id`` -1.
+        """
+        flags = self.classify(df)
+        receipts = pd.DataFrame({
+            'date': df['date'][flags['is_receipt']],
+            'counterparty': flags['counterparty'][flags['is_receipt']],
+            'amount': df['credit'][flags['is_receipt']],
+        })
+        repayments = pd.DataFrame({
+            'date': df['date'][flags['is_repayment']],
+            'counterparty': flags['counterparty'][flags['is_repayment']],
+            'amount': df['debit'][flags['is_repayment']],
+        })
+        if receipts.empty or repayments.empty:
+            return None
+
+        receipts = receipts.sort_values('date', kind='stable').reset_index(drop=True)
+        receipts.insert(0, 'loan_id', np.arange(len(receipts)))
+        schedule = pair_repayments(receipts, repayments)
+        loans = summarize_loans(receipts, schedule)
+
+        total_loan_amount = receipts['amount'].sum()
+        total_repaid = repayments['amount'].sum()
+        return {
+            'total_loan_amount': total_loan_amount,
+            'total_repaid': total_repaid,
+            'loan_receipt_dates': df['date'][flags['is_receipt']].tolist(),
+            'repayment_dates': df['date'][flags['is_repayment']].tolist(),
+            'repayment_count': len(repayments),
+            'repayment_amounts': repayments['amount'].tolist(),
+            'repayment_percentage': (total_repaid / total_loan_amount) * 100,
+            'interest_rate': ((total_repaid / total_loan_amount) - 1) * 100,
+            'loan_count': len(loans),
+            'loans': loans,
+            'schedule': schedule,
+        }
+
+
+def pair_repayments(receipts, repayments):
+    """
+    ``loan_id`` for every repayment: the latest receipt on or before it
+
+    Same-counterparty receipts win; repayments whose counterparty never lent
+    fall back to the latest receipt from anyone.
+    """
+    schedule = repayments.sort_values('date', kind='stable', na_position='last').reset_index(drop=True)
+    lenders = receipts.loc[receipts['date'].notna(), ['date', 'counterparty', 'loan_id']]
+    # merge_asof needs non-null keys; undated repayments stay unpaired
+    dated = schedule[schedule['date'].notna()]
+
+    loan_id = pd.merge_asof(dated, lenders, on='date', by='counterparty', direction='backward')['loan_id']
+    unmatched = loan_id.isna().to_numpy()
+    if unmatched.any():
+        anyone = pd.merge_asof(dated[['date']], lenders[['date', 'loan_id']], on='date', direction='backward')
+        loan_id = loan_id.where(~unmatched, anyone['loan_id'])
+
+    ids = np.full(len(schedule), -1, dtype=np.int64)
+    ids[:len(dated)] = loan_id.fillna(-1).to_numpy(dtype=np.int64)
+    schedule.insert(0, 'loan_id', ids)
+    return schedule[SCHEDULE_COLUMNS]
+
+
+def summarize_loans(receipts, schedule):
+    """One row per loan with what has been repaid against it"""
+    paid = schedule[schedule['loan_id'] >= 0].groupby('loan_id').agg(
+        repaid=('amount', 'sum'),
+        repayment_count=('amount', 'size'),
+        last_repayment=('date', 'max'),
+    )
+    loans = receipts.join(paid, on='loan_id')
+    loans['repaid'] = loans['repaid'].fillna(0.0)
+    loans['repayment_count'] = loans['repayment_count'].fillna(0).astype(np.int64)
+    loans['outstanding'] = (loans['amount'] - loans['repaid']).clip(lower=0)
+    loans['repayment_percentage'] = loans['repaid'] / loans['amount'] * 100
+    return loans[LOAN_COLUMNS]
+
+
+_default_detector = None
+
+
+def get_loan_flow_detector():
+    """Process-wide detector with the default keywords"""
+    global _default_detector
+    if _default_detector is None:
+        _default_detector = LoanFlowDetector()
+    return _default_detector
+
+
+def detect_loan_flows(df, detector=None):
+    """``LoanFlowDetector.detect`` with the default keywords"""
+    return (detector or get_loan_flow_detector()).detect(df)
@@ -0,0 +1,159 @@
+"""
+Sorted-interval index over loan products.
+
+    index = LoanIndex(loan_database)
+    profile = customer_profile(transactions_df)
+    for match in index.match(profile, max_interest=15.0):
+        match['category'], match['loan'], match['eligible'], match['upgrade']
+
+Each loan is kept in sorted keys on ``interest_rate``, ``min_amount``,
+``max_amount``, the eligibility income threshold and
+``upgrade_criteria.min_credit_score``. Every filter is a ``bisect`` into
+one of those keys. The smallest candidate range is scanned and the other
+predicates are checked on it, so a query costs O(log n + k) rather than a
+pass over every product.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from .eligibility import (
+    ELIGIBILITY_MIN_CREDIT_SCORE,
+    income_threshold,
+    upgrade_eligibility,
+)
+
+
+class _SortedKey:
+    """Loan positions ordered by one numeric attribute"""
+
+    def __init__(self, values):
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self.keys = [values[i] for i in order]
+        self.positions = order
+
+    def below(self, bound, inclusive=True):
+        """Positions whose key is <= bound (or < bound)"""
+        end = bisect_right(self.keys, bound) if inclusive else bisect_left(self.keys, bound)
+        return self.positions[:end]
+
+    def above(self, bound, inclusive=True):
+        """Positions whose key is >= bound (or > bound)"""
+        start = bisect_left(self.keys, bound) if inclusive else bisect_right(self.keys, bound)
+        return self.positions[start:]
+
+    def count_below(self, bound, inclusive=True):
+        return bisect_right(self.keys, bound) if inclusive else bisect_left(self.keys, bound)
+
+    def count_above(self, bound, inclusive=True):
+        start = bisect_left(self.keys, bound) if inclusive else bisect_right(self.keys, bound)
+        return len(self.keys) - start
+
+
+class LoanIndex:
+    """Immutable index over a ``{category: [loan, ...]}`` loan database"""
+
+    def __init__(self, loan_database):
+        self.categories = list(loan_database)
+        self.entries = [
+            (category, loan)
+            for category, loans in loan_database.items()
+            for loan in loans
+        ]
+        loans = [loan for _, loan in self.entries]
+
+        # Per-position columns, also used to re-check candidates from the narrowest range
+        self._rates = [float(loan['interest_rate']) for loan in loans]
+        self._min_amounts = [float(loan['min_amount']) for loan in loans]
+        self._max_amounts = [float(loan['max_amount']) for loan in loans]
+        self._thresholds = [income_threshold(loan) for loan in loans]
+        self._upgrade_scores = [float(loan['upgrade_criteria']['min_credit_score']) for loan in loans]
+
+        self.interest_rate = _SortedKey(self._rates)
+        self.min_amount = _SortedKey(self._min_amounts)
+        self.max_amount = _SortedKey(self._max_amounts)
+        self.income_threshold = _SortedKey(self._thresholds)
+        self.upgrade_score = _SortedKey(self._upgrade_scores)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _candidates(self, max_interest=None, amount=None, eligible_income=None, upgrade_score=None):
+        """Positions satisfying every given bound, scanning only the narrowest range"""
+        ranges = []
+        if max_interest is not None:
+            ranges.append((self.interest_rate.count_below(max_interest),
+                           lambda: self.interest_rate.below(max_interest)))
+        if amount is not None:
+            ranges.append((self.min_amount.count_below(amount),
+                           lambda: self.min_amount.below(amount)))
+            ranges.append((self.max_amount.count_above(amount),
+                           lambda: self.max_amount.above(amount)))
+        if eligible_income is not None:
+            ranges.append((self.income_threshold.count_below(eligible_income, inclusive=False),
+                           lambda: self.income_threshold.below(eligible_income, inclusive=False)))
+        if upgrade_score is not None:
+            ranges.append((self.upgrade_score.count_below(upgrade_score),
+                           lambda: self.upgrade_score.below(upgrade_score)))
+
+        if not ranges:
+            return list(range(len(self.entries)))
+        ranges.sort(key=lambda r: r[0])
+        candidates = ranges[0][1]()
+        if len(ranges) == 1:
+            return sorted(candidates)
+
+        def keep(p):
+            return (
+                (max_interest is None or self._rates[p] <= max_interest) and
+                (amount is None or self._min_amounts[p] <= amount <= self._max_amounts[p]) and
+                (eligible_income is None or eligible_income > self._thresholds[p]) and
+                (upgrade_score is None or self._upgrade_scores[p] <= upgrade_score)
+            )
+        return sorted(p for p in candidates if keep(p))
+
+    def _filter_positions(self, category=None, max_interest=None, amount=None):
+        positions = self._candidates(max_interest=max_interest, amount=amount)
+        if category in (None, 'All'):
+            return positions
+        return [p for p in positions if self.entries[p][0] == category]
+
+    def _eligible_positions(self, profile, max_interest=None, amount=None):
+        if not profile['credit_score'] >= ELIGIBILITY_MIN_CREDIT_SCORE:
+            return []
+        return self._candidates(max_interest=max_interest, amount=amount,
+                                eligible_income=profile['monthly_income'])
+
+    def filter(self, category=None, max_interest=None, amount=None):
+        """``(category, loan)`` pairs matching the filters, in catalogue order"""
+        return [self.entries[p] for p in self._filter_positions(category, max_interest, amount)]
+
+    def eligible(self, profile, max_interest=None, amount=None):
+        """Loans the customer qualifies for, in catalogue order"""
+        return [self.entries[p] for p in self._eligible_positions(profile, max_interest, amount)]
+
+    def upgradeable(self, profile, max_interest=None):
+        """Loans whose upgrade criteria the customer already meets"""
+        positions = self._candidates(max_interest=max_interest,
+                                     eligible_income=profile['monthly_income'],
+                                     upgrade_score=profile['credit_score'])
+        return [self.entries[p] for p in positions]
+
+    def match(self, profile, category=None, max_interest=None, amount=None):
+        """
+        Every loan passing the filters with its eligibility and upgrade terms
+
+        Upgrade terms are only worked out for eligible loans, the same as the
+        marketplace, which only shows upgrades on loans the customer qualifies for.
+        """
+        eligible = set(self._eligible_positions(profile, max_interest, amount))
+        matches = []
+        for p in self._filter_positions(category, max_interest, amount):
+            loan_category, loan = self.entries[p]
+            is_eligible = p in eligible
+            matches.append({
+                'category': loan_category,
+                'loan': loan,
+                'eligible': is_eligible,
+                'upgrade': upgrade_eligibility(profile, loan) if is_eligible else None,
+            })
+        return matches
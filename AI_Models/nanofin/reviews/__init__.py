@@ -0,0 +1,37 @@
+"""
+Business review scraping for the Business Review Insights platform.
+
+    from nanofin.reviews import scrape_many
+
+Requires BeautifulSoup and TextBlob; the concurrent scraper also needs aiohttp.
+"""
+
+from .cache import ReviewCache, conditional_headers, get_review_cache
+from .parsing import extract_review_texts, find_review_link, search_url
+from .scraper import AsyncReviewScraper, FetchError, scrape_many
+from .sentiment import (
+    ascore_reviews,
+    get_scoring_executor,
+    polarity_label,
+    score_reviews,
+    score_texts,
+    sentiment_labels,
+)
+
+__all__ = [
+    'search_url',
+    'find_review_link',
+    'extract_review_texts',
+    'AsyncReviewScraper',
+    'FetchError',
+    'scrape_many',
+    'ReviewCache',
+    'get_review_cache',
+    'conditional_headers',
+    'score_texts',
+    'score_reviews',
+    'ascore_reviews',
+    'get_scoring_executor',
+    'sentiment_labels',
+    'polarity_label',
+]
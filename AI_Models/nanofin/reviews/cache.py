@@ -0,0 +1,184 @@
+"""
+Persistent SQLite cache for review lookups.
+
+    cache = get_review_cache()
+    cache.get_search("Ravi Tailors")          # review page URL, if fresh
+    cache.get_reviews(url)                    # scored reviews, if fresh
+
+Three tables, all timestamped:
+
+* ``searches``: business query -> review page URL;
+* ``pages``: URL -> HTML with its ``ETag``/``Last-Modified`` validators;
+* ``reviews``: (URL, scorer) -> extracted reviews with sentiment scores.
+
+An entry younger than ``ttl`` is served without any network traffic. An
+older page is revalidated with a conditional GET; a 304 refreshes its
+timestamp and reuses the stored HTML. Rows older than ``max_age`` are
+deleted by ``evict_expired``, which runs once when the cache is opened.
+
+The database lives at ``~/.cache/nanofin/reviews.sqlite3`` unless
+``NANOFIN_REVIEW_CACHE`` names another file. If it cannot be opened (read-only
+home, locked or corrupt file), ``get_review_cache`` returns None and reviews
+are fetched uncached.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+CACHE_ENV_VAR = 'NANOFIN_REVIEW_CACHE'
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'nanofin' / 'reviews.sqlite3'
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+# Part of the reviews key; bump it when scoring or extraction changes
+DEFAULT_SCORER = 'textblob:all-reviews'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    query TEXT PRIMARY KEY,
+    url TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reviews (
+    url TEXT NOT NULL,
+    scorer TEXT NOT NULL,
+    reviews TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (url, scorer)
+);
+"""
+
+
+def _query_key(query):
+    return ' '.join(query.split()).lower()
+
+
+class ReviewCache:
+    """TTL cache of searches, pages and scored reviews in one SQLite file"""
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_age=DEFAULT_MAX_AGE):
+        self.path = Path(path or os.environ.get(CACHE_ENV_VAR) or DEFAULT_CACHE_PATH)
+        self.ttl = ttl
+        self.max_age = max_age
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+        self.evict_expired()
+
+    def _connect(self):
+        # A short-lived connection per call keeps the cache safe to share
+        # between Streamlit sessions and the scraper's threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _execute(self, sql, params=()):
+        with closing(self._connect()) as conn, conn:
+            return conn.execute(sql, params).fetchall()
+
+    def is_fresh(self, fetched_at, now=None):
+        return (time.time() if now is None else now) - fetched_at <= self.ttl
+
+    def get_search(self, query):
+        """``(hit, url)``; ``url`` may be None when the search found nothing"""
+        rows = self._execute('SELECT url, fetched_at FROM searches WHERE query = ?', (_query_key(query),))
+        if rows and self.is_fresh(rows[0][1]):
+            return True, rows[0][0]
+        return False, None
+
+    def put_search(self, query, url):
+        self._execute('INSERT OR REPLACE INTO searches VALUES (?, ?, ?)',
+                      (_query_key(query), url, time.time()))
+
+    def get_page(self, url):
+        """Stored page as a dict with ``fresh`` set, or None"""
+        rows = self._execute(
+            'SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ?', (url,)
+        )
+        if not rows:
+            return None
+        body, etag, last_modified, fetched_at = rows[0]
+        return {
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+            'fresh': self.is_fresh(fetched_at),
+        }
+
+    def put_page(self, url, body, etag=None, last_modified=None):
+        self._execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)',
+                      (url, body, etag, last_modified, time.time()))
+
+    def touch_page(self, url):
+        """Mark a page as revalidated (the server answered 304 Not Modified)"""
+        self._execute('UPDATE pages SET fetched_at = ? WHERE url = ?', (time.time(), url))
+
+    def get_reviews(self, url, scorer=DEFAULT_SCORER):
+        rows = self._execute(
+            'SELECT reviews, fetched_at FROM reviews WHERE url = ? AND scorer = ?', (url, scorer)
+        )
+        if rows and self.is_fresh(rows[0][1]):
+            return json.loads(rows[0][0])
+        return None
+
+    def put_reviews(self, url, reviews, scorer=DEFAULT_SCORER):
+        self._execute('INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?)',
+                      (url, scorer, json.dumps(reviews, ensure_ascii=False), time.time()))
+
+    def evict_expired(self, now=None):
+        """Delete rows older than ``max_age``; returns the number removed"""
+        cutoff = (time.time() if now is None else now) - self.max_age
+        removed = 0
+        with closing(self._connect()) as conn, conn:
+            for table in ('searches', 'pages', 'reviews'):
+                removed += conn.execute(f'DELETE FROM {table} WHERE fetched_at < ?', (cutoff,)).rowcount
+        return removed
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            for table in ('searches', 'pages', 'reviews'):
+                conn.execute(f'DELETE FROM {table}')
+
+
+def conditional_headers(page):
+    """``If-None-Match``/``If-Modified-Since`` headers for revalidating a stored page"""
+    headers = {}
+    if page and page.get('etag'):
+        headers['If-None-Match'] = page['etag']
+    if page and page.get('last_modified'):
+        headers['If-Modified-Since'] = page['last_modified']
+    return headers
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+# Paths that failed to open, so each is only tried (and warned about) once
+_unusable_paths = set()
+
+
+def get_review_cache():
+    """Process-wide cache at ``NANOFIN_REVIEW_CACHE`` (or ~/.cache/nanofin), or None if unusable"""
+    global _default_cache
+    path = Path(os.environ.get(CACHE_ENV_VAR) or DEFAULT_CACHE_PATH)
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.path != path:
+            if path in _unusable_paths:
+                return None
+            try:
+                _default_cache = ReviewCache(path)
+            except (OSError, sqlite3.Error) as e:
+                _unusable_paths.add(path)
+                print(f"[WARNING] Review cache at {path} unavailable, continuing without it: {e}")
+                return None
+        return _default_cache
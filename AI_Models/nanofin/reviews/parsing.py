@@ -0,0 +1,48 @@
+"""
+HTML helpers shared by the sync and async review scrapers.
+"""
+
+import urllib.parse
+
+from bs4 import BeautifulSoup
+
+BING_BASE_URL = 'https://www.bing.com'
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+REQUEST_HEADERS = {"User-Agent": USER_AGENT}
+# Paragraphs shorter than this are navigation, captions and other noise
+MIN_REVIEW_LENGTH = 30
+# No cap by default: every review on the page is scored in one batch
+REVIEW_LIMIT = None
+
+
+def search_url(query, base_url=BING_BASE_URL):
+    """Bing search URL for ``<query> reviews``"""
+    encoded_query = urllib.parse.quote(f"{query} reviews")
+    return f"{base_url}/search?q={encoded_query}"
+
+def find_review_link(html, base_url=BING_BASE_URL):
+    """First link on a results page that looks like a review or rating page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if "review" in href or "rating" in href:
+            # Ensure the URL has a scheme
+            return urllib.parse.urljoin(base_url, href)
+    return None
+
+def extract_review_texts(html, limit=REVIEW_LIMIT):
+    """Text of the page's ``<p>`` elements that are long enough to be reviews"""
+    soup = BeautifulSoup(html, 'html.parser')
+    review_elements = soup.find_all('p')  # Adjust tag based on website structure
+    if limit is not None:
+        review_elements = review_elements[:limit]
+
+    texts = []
+    for element in review_elements:
+        review_text = element.get_text(strip=True)
+        if len(review_text) > MIN_REVIEW_LENGTH:
+            texts.append(review_text)
+    return texts
@@ -0,0 +1,186 @@
+"""
+Concurrent review scraping for many businesses at once.
+
+    results = scrape_many(["Sharma Tea Stall", "Ravi Tailors", ...])
+
+One pooled ``aiohttp`` session is shared by every request. The connector caps
+open connections overall (``total_limit``) and per host (``per_host_limit``),
+so hundreds of businesses can be enriched concurrently without hammering
+Bing or any single review site. Connecting and every socket read have a
+timeout; time spent queued for a pooled connection does not count against
+it. Requests are retried with exponential backoff on connection errors,
+timeouts, 429 and 5xx. A
+slow or failing host only costs its own businesses, which come back with
+``error`` set, whatever went wrong for them.
+
+With a ``ReviewCache``, fresh searches, pages and scored reviews are served
+from disk, and stale pages are revalidated with a conditional GET.
+
+aiohttp is optional; it is only needed for this module.
+"""
+
+import asyncio
+import random
+
+from .cache import DEFAULT_SCORER, conditional_headers
+from .parsing import (
+    BING_BASE_URL,
+    REQUEST_HEADERS,
+    REVIEW_LIMIT,
+    extract_review_texts,
+    find_review_link,
+    search_url,
+)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+PER_HOST_LIMIT = 4
+TOTAL_LIMIT = 64
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class FetchError(Exception):
+    """A URL could not be fetched after every retry"""
+
+
+class AsyncReviewScraper:
+    """Pooled async scraper; use as ``async with AsyncReviewScraper() as scraper``"""
+
+    def __init__(self, search_base=BING_BASE_URL, timeout=DEFAULT_TIMEOUT,
+                 retries=DEFAULT_RETRIES, backoff=RETRY_BACKOFF,
+                 per_host_limit=PER_HOST_LIMIT, total_limit=TOTAL_LIMIT,
+                 review_limit=REVIEW_LIMIT, cache=None, score_reviews=None,
+                 scorer=DEFAULT_SCORER):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for concurrent scraping: pip install aiohttp")
+        self.search_base = search_base
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.per_host_limit = per_host_limit
+        self.total_limit = total_limit
+        self.review_limit = review_limit
+        # Optional ReviewCache, and a callable turning review texts into scored dicts
+        self.cache = cache
+        self.score_reviews = score_reviews
+        self.scorer = scorer
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.total_limit, limit_per_host=self.per_host_limit)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=REQUEST_HEADERS,
+            # No total: it would also count time queued behind per_host_limit
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        self._session = None
+
+    async def _get(self, url, headers=None):
+        """GET ``url`` with retries; returns ``(status, body, etag, last_modified)``"""
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._session.get(url, headers=headers) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.retries:
+                        raise FetchError(f"HTTP {response.status} from {url}")
+                    response.raise_for_status()
+                    # Mis-declared charsets are common on review sites; keep what decodes
+                    body = '' if response.status == 304 else await response.text(errors='replace')
+                    return (response.status, body,
+                            response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            except (aiohttp.ClientError, asyncio.TimeoutError, FetchError) as e:
+                retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status in RETRY_STATUSES
+                if attempt >= self.retries or not retryable:
+                    raise FetchError(f"{url}: {type(e).__name__}: {e}") from e
+            # Exponential backoff with jitter so retries from many tasks don't line up
+            await asyncio.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+
+    async def fetch_text(self, url):
+        """Body of ``url``, served from or revalidated against the cache when there is one"""
+        if self.cache is None:
+            return (await self._get(url))[1]
+
+        page = self.cache.get_page(url)
+        if page and page['fresh']:
+            return page['body']
+        status, body, etag, last_modified = await self._get(url, conditional_headers(page))
+        if status == 304 and page:
+            self.cache.touch_page(url)
+            return page['body']
+        self.cache.put_page(url, body, etag, last_modified)
+        return body
+
+    async def search_business(self, query):
+        """``{'name', 'url'}`` for the first review-looking search result"""
+        if self.cache is not None:
+            hit, url = self.cache.get_search(query)
+            if hit:
+                return {"name": query, "url": url}
+
+        _, html, _, _ = await self._get(search_url(query, self.search_base))
+        url = find_review_link(html, self.search_base)
+        if self.cache is not None:
+            self.cache.put_search(query, url)
+        return {"name": query, "url": url}
+
+    async def scrape_reviews(self, url):
+        """Review texts from a business's review page"""
+        html = await self.fetch_text(url)
+        return extract_review_texts(html, limit=self.review_limit)
+
+    async def review_business(self, query):
+        """Search and scrape one business; failures are reported, not raised"""
+        result = {"name": query, "url": None, "reviews": [], "error": None}
+        try:
+            result.update(await self.search_business(query))
+            url = result['url']
+            if url:
+                cached = None
+                if self.cache is not None and self.score_reviews is not None:
+                    cached = self.cache.get_reviews(url, self.scorer)
+                if cached is not None:
+                    result['reviews'] = cached
+                else:
+                    reviews = await self.scrape_reviews(url)
+                    if self.score_reviews is not None:
+                        # Scoring is CPU-bound; keep it off the event loop
+                        loop = asyncio.get_running_loop()
+                        reviews = await loop.run_in_executor(None, self.score_reviews, reviews)
+                        if self.cache is not None:
+                            self.cache.put_reviews(url, reviews, self.scorer)
+                    result['reviews'] = reviews
+        except FetchError as e:
+            result['error'] = str(e)
+        except Exception as e:
+            # A parse or cache failure on one business must not sink the batch
+            result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    async def review_many(self, queries):
+        """Review every business concurrently, preserving input order"""
+        results = await asyncio.gather(
+            *(self.review_business(query) for query in queries), return_exceptions=True
+        )
+        return [
+            {"name": query, "url": None, "reviews": [], "error": f"{type(result).__name__}: {result}"}
+            if isinstance(result, BaseException) else result
+            for query, result in zip(queries, results)
+        ]
+
+
+def scrape_many(queries, **kwargs):
+    """Blocking entry point: review many businesses from synchronous code"""
+    async def run():
+        async with AsyncReviewScraper(**kwargs) as scraper:
+            return await scraper.review_many(queries)
+    return asyncio.run(run())
@@ -0,0 +1,116 @@
+"""
+Batch sentiment scoring for review texts.
+
+    reviews = score_reviews(texts)   # [{'text', 'sentiment_score', 'sentiment_label'}, ...]
+
+Scores are TextBlob's pattern polarity, exactly as ``TextBlob(text).sentiment``
+reports it, but without building a ``TextBlob`` and a result namedtuple per
+review. Duplicate texts are scored once. Smaller batches are scored inline;
+above ``PARALLEL_THRESHOLD`` unique texts they are split across one shared,
+lazily started process pool, so Streamlit reruns reuse its workers. The labels
+for the whole batch are assigned in one vectorized ``np.select``.
+
+From async code, ``await ascore_reviews(texts)`` runs the scoring off the
+event loop.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+from textblob.en import sentiment as pattern_sentiment
+
+# Bucket edges are the ones the review platform has always used
+SENTIMENT_LABELS = ("Very Positive", "Positive", "Neutral", "Negative", "Very Negative")
+PARALLEL_THRESHOLD = 2000
+CHUNK_SIZE = 500
+
+
+def polarity(text):
+    """Polarity in [-1, 1], identical to ``TextBlob(text).sentiment.polarity``"""
+    return pattern_sentiment(text)[0]
+
+def polarity_label(score):
+    """Sentiment bucket for a single polarity score"""
+    if score > 0.5:
+        return "Very Positive"
+    elif score > 0:
+        return "Positive"
+    elif score == 0:
+        return "Neutral"
+    elif score > -0.5:
+        return "Negative"
+    return "Very Negative"
+
+def sentiment_labels(scores):
+    """Vectorized ``polarity_label`` over an array of scores"""
+    scores = np.asarray(scores, dtype=np.float64)
+    conditions = [scores > 0.5, scores > 0, scores == 0, scores > -0.5]
+    return np.select(conditions, SENTIMENT_LABELS[:4], default=SENTIMENT_LABELS[4])
+
+def _polarities(texts):
+    return [pattern_sentiment(text)[0] for text in texts]
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_scoring_executor(workers=None):
+    """Process-wide pool of ``workers`` processes (default: one per CPU), started on first use"""
+    workers = workers or os.cpu_count() or 1
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = _executors[workers] = ProcessPoolExecutor(max_workers=workers)
+        return executor
+
+def _discard_executor(executor):
+    with _executors_lock:
+        for workers, shared in list(_executors.items()):
+            if shared is executor:
+                del _executors[workers]
+    executor.shutdown(wait=False)
+
+def score_texts(texts, workers=None, parallel_threshold=PARALLEL_THRESHOLD):
+    """
+    Polarity for every text as a float64 array, in input order
+
+    ``workers`` sizes the shared process pool used for large batches (default:
+    one per CPU); ``workers=1`` keeps everything in-process.
+    """
+    codes, unique_texts = pd.factorize(pd.Series(list(texts), dtype=object), use_na_sentinel=False)
+    unique_texts = [str(text) for text in unique_texts]
+
+    workers = workers or os.cpu_count() or 1
+    unique_scores = None
+    if len(unique_texts) >= parallel_threshold and workers > 1:
+        chunks = [unique_texts[i:i + CHUNK_SIZE] for i in range(0, len(unique_texts), CHUNK_SIZE)]
+        executor = get_scoring_executor(workers)
+        try:
+            unique_scores = [score for chunk in executor.map(_polarities, chunks) for score in chunk]
+        except BrokenProcessPool:
+            # A worker died; drop the pool so the next large batch starts a fresh one
+            _discard_executor(executor)
+    if unique_scores is None:
+        unique_scores = _polarities(unique_texts)
+
+    return np.asarray(unique_scores, dtype=np.float64)[codes] if len(codes) else np.empty(0)
+
+def score_reviews(texts, workers=None):
+    """Scored review dicts, the same shape the review platform displays"""
+    texts = list(texts)
+    scores = score_texts(texts, workers=workers)
+    labels = sentiment_labels(scores)
+    return [
+        {"text": text, "sentiment_score": float(score), "sentiment_label": str(label)}
+        for text, score, label in zip(texts, scores, labels)
+    ]
+
+async def ascore_reviews(texts, workers=None):
+    """``score_reviews`` for async callers, run on the loop's default executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, score_reviews, list(texts), workers)
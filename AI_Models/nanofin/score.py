@@ -0,0 +1,117 @@
+"""
+Batch scoring of bank-statement JSON files.
+
+    python -m nanofin.score ../JSON_Files -o scores.csv
+    python -m nanofin.score "statements/2024-*.json" -o scores.parquet --workers 8
+
+Every statement is ingested, run through ``calculate_financial_metrics`` and
+``calculate_nano_entrepreneur_score`` in a process pool, and written out as one
+row per customer. Statements that fail to parse are kept in the output with
+the ``error`` column set so a single bad file never aborts a nightly run.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from nanofin.core import (
+    SCORE_COMPONENTS,
+    calculate_financial_metrics,
+    calculate_nano_entrepreneur_score,
+    read_statement,
+)
+
+
+def collect_statement_paths(inputs):
+    """Expand directories and glob patterns into a sorted list of JSON files"""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.update(str(p) for p in Path(item).rglob('*.json'))
+        elif glob.has_magic(item):
+            paths.update(p for p in glob.glob(item, recursive=True) if p.endswith('.json'))
+        elif os.path.isfile(item):
+            paths.add(item)
+    return sorted(paths)
+
+def score_statement(path):
+    """Score a single statement file and return one flat results row"""
+    row = {'source_file': path, 'customer_id': Path(path).stem, 'error': None}
+    try:
+        bank_data, df = read_statement(path)
+
+        personal_info = bank_data.get('personal_info', {})
+        row['customer_id'] = personal_info.get('customer_id') or row['customer_id']
+
+        metrics = calculate_financial_metrics(df, bank_data.get('summary', {}))
+        nano_score = calculate_nano_entrepreneur_score(metrics)
+
+        row['score'] = float(nano_score['score'])
+        for component, value in nano_score['breakdown'].items():
+            row[SCORE_COMPONENTS[component]] = float(value)
+        for key, value in metrics.items():
+            row[key] = int(value) if key == 'total_transactions' else float(value)
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    return row
+
+def score_statements(paths, workers=None, chunksize=None):
+    """Score many statements across a process pool, preserving input order"""
+    if workers == 1 or len(paths) <= 1:
+        return [score_statement(path) for path in paths]
+
+    workers = workers or os.cpu_count() or 1
+    # Batch small files together so pickling overhead doesn't dominate
+    chunksize = chunksize or max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(score_statement, paths, chunksize=chunksize))
+
+def write_results(rows, output):
+    """Write results to CSV or Parquet depending on the output extension"""
+    results = pd.DataFrame(rows)
+    if output.endswith('.parquet'):
+        results.to_parquet(output, index=False)
+    else:
+        results.to_csv(output, index=False)
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='nanofin-score',
+        description='Score bank-statement JSON files in parallel.'
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help='Statement JSON files, directories or glob patterns')
+    parser.add_argument('-o', '--output', default='nanofin_scores.csv',
+                        help='Output file (.csv or .parquet)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='Statements handed to a worker at a time')
+    args = parser.parse_args(argv)
+
+    paths = collect_statement_paths(args.inputs)
+    if not paths:
+        print("[ERROR] No statement files found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    rows = score_statements(paths, workers=args.workers, chunksize=args.chunksize)
+    results = write_results(rows, args.output)
+    elapsed = time.perf_counter() - start
+
+    failed = int(results['error'].notna().sum())
+    print(f"[SUCCESS] Scored {len(results) - failed}/{len(results)} statements "
+          f"in {elapsed:.1f}s -> {args.output}")
+    if failed:
+        print(f"[WARNING] {failed} statements could not be scored, see the 'error' column")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
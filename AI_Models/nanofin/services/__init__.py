@@ -0,0 +1,12 @@
+"""
+Monitoring for the NanoFin model services.
+
+    from nanofin.services import get_status_probe
+"""
+
+from .status import ServiceStatusProbe, get_status_probe
+
+__all__ = [
+    'ServiceStatusProbe',
+    'get_status_probe',
+]
@@ -0,0 +1,123 @@
+"""
+Live status of the NanoFin model services.
+
+    probe = get_status_probe()
+    probe.statuses([8501, 8502, ...])   # {8501: True, 8502: False, ...}
+
+Every port is probed at once over one pooled ``requests`` session, so a
+status check costs one probe timeout, not one per service. Results are kept
+for ``ttl`` seconds. After that, ``statuses`` returns the last known results
+and starts a background re-probe, so a page render never waits on the
+network once the first probe has finished.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HOST = 'localhost'
+# Streamlit answers this cheaply; any HTTP response means the server is up
+HEALTH_PATH = '/_stcore/health'
+DEFAULT_TIMEOUT = 1.0
+DEFAULT_TTL = 5.0
+
+
+class ServiceStatusProbe:
+    """Concurrent, TTL-cached reachability checks for local services"""
+
+    def __init__(self, host=DEFAULT_HOST, timeout=DEFAULT_TIMEOUT, ttl=DEFAULT_TTL, max_workers=16):
+        self.host = host
+        self.timeout = timeout
+        self.ttl = ttl
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='status-probe')
+        self._results = {}
+        self._checked_at = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def url_for(self, port):
+        return f"http://{self.host}:{port}"
+
+    def probe(self, port):
+        """True when anything answers HTTP on ``port``"""
+        try:
+            self.session.get(self.url_for(port) + HEALTH_PATH, timeout=self.timeout)
+            return True
+        except requests.exceptions.RequestException:
+            return False
+
+    def _probe_and_record(self, port):
+        # Recorded before the future resolves, so waiters always see the result
+        is_running = self.probe(port)
+        with self._lock:
+            self._results[port] = is_running
+            self._checked_at[port] = time.time()
+            self._in_flight.pop(port, None)
+        return is_running
+
+    def _submit(self, port):
+        # Called with the lock held; one probe per port at a time
+        future = self._in_flight.get(port)
+        if future is None:
+            future = self._executor.submit(self._probe_and_record, port)
+            self._in_flight[port] = future
+        return future
+
+    def statuses(self, ports, wait=False):
+        """
+        ``{port: is_running}`` for every port
+
+        Fresh results come from the cache. Stale ports are re-probed in the
+        background and reported with their last known status; ports never
+        checked before are always waited for. ``wait=True`` waits for every
+        re-probe (e.g. behind a refresh button).
+        """
+        now = time.time()
+        pending = {}
+        with self._lock:
+            for port in ports:
+                if now - self._checked_at.get(port, float('-inf')) > self.ttl:
+                    future = self._submit(port)
+                    if wait or port not in self._results:
+                        pending[port] = future
+        probed = {port: future.result() for port, future in pending.items()}
+        with self._lock:
+            # invalidate() may have cleared a result meanwhile: report it down until re-probed
+            return {port: probed[port] if port in probed else self._results.get(port, False)
+                    for port in ports}
+
+    def is_running(self, port):
+        return self.statuses([port])[port]
+
+    def checked_at(self, ports):
+        """Time of the oldest result among ``ports``, or None until every port has one"""
+        with self._lock:
+            times = [self._checked_at.get(port) for port in ports]
+        if not times or None in times:
+            return None
+        return min(times)
+
+    def invalidate(self):
+        """Forget every cached result, so the next ``statuses`` call waits for fresh probes"""
+        with self._lock:
+            self._checked_at.clear()
+            self._results.clear()
+
+
+_default_probe = None
+_default_probe_lock = threading.Lock()
+
+
+def get_status_probe():
+    """Process-wide probe shared by every dashboard session"""
+    global _default_probe
+    with _default_probe_lock:
+        if _default_probe is None:
+            _default_probe = ServiceStatusProbe()
+        return _default_probe
@@ -0,0 +1,64 @@
+"""
+Every NanoFin model as one multipage Streamlit app.
+
+    streamlit run nanofin_app.py
+
+One server and one Python process instead of one per model. This router
+imports nothing but Streamlit: each page is the model's own script, run only
+when the page is opened, so pandas, Plotly, Gemini and friends load on first
+use. Pages share the process, and with it the statement store, result cache,
+loan catalogue and review cache in ``nanofin``.
+"""
+
+import streamlit as st
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+# Where launch_all_models.py serves this app by default
+MULTIPAGE_PORT = 8510
+
+# (script, title, icon), grouped as they appear in the sidebar
+PAGES = {
+    "Credit Analysis": [
+        ("unified_dashboard.py", "Complete AI Analysis", "🏛️"),
+        ("Local_Credit_Analysis.py", "Local Credit Analysis", "🏠"),
+        ("Customer_View.py", "Customer View", "👤"),
+        ("Customer_View_Goolge_Gemini_GoogleBNBMarathon.py", "Customer View (Gemini AI)", "🤖"),
+        ("Nano_Entrepreneur_CreditFlow_Loan_Assessment.py", "Nano Entrepreneur Assessment", "🚀"),
+    ],
+    "Lending": [
+        ("Financial_InstitutionView.py", "Financial Institution View", "🏦"),
+        ("Enhanced_CreditWorthy_Loan_Marketplace.py", "Enhanced Loan Marketplace", "🏪"),
+    ],
+    "Business": [
+        ("Business_Review_Insights_Platform.py", "Business Review Platform", "📊"),
+    ],
+}
+
+
+def page_url_path(script):
+    """Route of a model's page: ``/`` for the first page, the script's stem otherwise"""
+    first_script = next(iter(PAGES.values()))[0][0]
+    return "" if script == first_script else Path(script).stem
+
+def build_navigation():
+    """``st.navigation`` over every model script that exists on disk"""
+    sections = {}
+    for section, pages in PAGES.items():
+        sections[section] = [
+            st.Page(str(APP_DIR / script), title=title, icon=icon,
+                    url_path=page_url_path(script) or None, default=not sections and i == 0)
+            for i, (script, title, icon) in enumerate(pages)
+            if (APP_DIR / script).exists()
+        ]
+    return st.navigation({section: pages for section, pages in sections.items() if pages})
+
+def main():
+    if not hasattr(st, "navigation"):
+        st.error("The multipage NanoFin app needs Streamlit 1.36 or newer: pip install -U streamlit")
+        st.stop()
+    # The pages set their own page config, so nothing else may render first
+    build_navigation().run()
+
+if __name__ == "__main__":
+    main()
@@ -30,7 +30,7 @@ start "Business Review Platform" cmd /k "streamlit run Business_Review_Insights_
 timeout /t 3 /nobreak >nul
 
 echo [6/7] Starting Enhanced Loan Marketplace on port 8506...
-start "Enhanced Loan Marketplace" cmd /k "streamlit run Enhanced_NanoFin_Loan_Marketplace.py --server.port 8506"
+start "Enhanced Loan Marketplace" cmd /k "streamlit run Enhanced_CreditWorthy_Loan_Marketplace.py --server.port 8506"
 timeout /t 3 /nobreak >nul
 
 echo [7/7] Starting Nano Entrepreneur Assessment on port 8507...
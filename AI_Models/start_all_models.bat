@@ -30,7 +30,7 @@ start "Business Review" cmd /k "streamlit run Business_Review_Insights_Platform.
 timeout /t 3 >nul
 
 echo [6/7] Loan Marketplace (Port 8506)
-start "Loan Marketplace" cmd /k "streamlit run Enhanced_NanoFin_Loan_Marketplace.py --server.port 8506 --server.headless true"
+start "Loan Marketplace" cmd /k "streamlit run Enhanced_CreditWorthy_Loan_Marketplace.py --server.port 8506 --server.headless true"
 timeout /t 3 >nul
 
 echo [7/7] Nano Entrepreneur (Port 8507)
@@ -0,0 +1,66 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanofin.core import ResultCache, load_statement, statement_digest
+from nanofin.loans import analyze_loans, assess_loans
+
+STATEMENT = Path(__file__).resolve().parents[2] / 'JSON_Files' / 'InstView2ProfitYesLoan.json'
+
+
+@pytest.fixture
+def no_store(monkeypatch):
+    monkeypatch.setenv('NANOFIN_STATEMENT_STORE', 'off')
+
+
+def upload():
+    """A one-shot stream, like Streamlit's UploadedFile"""
+    return io.BytesIO(STATEMENT.read_bytes())
+
+
+def test_analyze_loans_reuses_the_loaded_frame(no_store):
+    cache = ResultCache()
+    uploaded_file = upload()
+    digest = statement_digest(uploaded_file)
+    bank_data, df = load_statement(uploaded_file, digest=digest)
+
+    assessment = analyze_loans(df=df, digest=digest, cache=cache)
+    assert assessment['loan_count'] == 1
+    assert analyze_loans(df=df, digest=digest, cache=cache) is assessment
+    assert cache.stats()['hits'] == 1
+
+
+def test_analyze_loans_reads_a_source_once(no_store):
+    assessment = analyze_loans(upload(), cache=ResultCache())
+    assert assessment['behaviour']['closed_loans'] == 1
+
+
+def test_analyze_loans_needs_a_digest_for_a_frame():
+    with pytest.raises(ValueError):
+        analyze_loans(df=pd.DataFrame())
+
+
+def test_amortization_of_a_monthly_loan():
+    dates = pd.to_datetime(['2024-01-01', '2024-01-31', '2024-03-01', '2024-04-15'])
+    df = pd.DataFrame({
+        'date': dates,
+        'description': ['Loan from Asha', 'Loan Repayment to Asha', 'Loan Repayment to Asha',
+                        'Loan Repayment to Asha'],
+        'credit': [30000.0, 0, 0, 0],
+        'debit': [0, 10500.0, 10500.0, 10500.0],
+    })
+    loan = assess_loans(df)['amortization'].iloc[0]
+
+    assert loan['cadence_days'] == 30
+    assert loan['installments'] == 3
+    assert loan['tenure_days'] == 105
+    # Third installment was due on day 90 and paid on day 105
+    assert loan['days_past_due'] == 15
+    assert loan['on_time_ratio'] == pytest.approx(2 / 3)
+
+    years = (dates[1:] - dates[0]).days.to_numpy() / 365
+    rate = loan['effective_rate'] / 100
+    assert np.sum(10500 * (1 + rate) ** -years) == pytest.approx(30000)
@@ -0,0 +1,60 @@
+from nanofin.loans import LoanCatalogue, is_eligible, normalize_loan, upgrade_eligibility
+
+
+def generated_loan(**overrides):
+    loan = {
+        'name': 'Equipment Financing Loan',
+        'provider': 'Tech Finance Ltd',
+        'interest_rate': '13.5',
+        'min_amount': '100000',
+        'max_amount': '2000000',
+        'processing_time': '5-7 days',
+        'processing_fee': '1.5%',
+        'required_documents': ['ID Proof'],
+        'features': ['Collateral-free'],
+        'suitable_for': ['Manufacturing'],
+        'upgrade_criteria': {'min_credit_score': '75', 'interest_reduction': '1.5'},
+        'tenure_range': [12, 60],
+    }
+    loan.update(overrides)
+    return loan
+
+
+def test_normalize_loan_coerces_numeric_strings():
+    loan = normalize_loan(generated_loan())
+    assert loan['interest_rate'] == 13.5
+    assert loan['min_amount'] == 100000 and isinstance(loan['min_amount'], int)
+    assert loan['max_amount'] == 2000000
+    assert loan['upgrade_criteria'] == {'min_credit_score': 75, 'interest_reduction': 1.5}
+    assert loan['tenure_range'] == (12, 60)
+
+
+def test_normalize_loan_rejects_unusable_numbers():
+    assert normalize_loan(generated_loan(min_amount='about a lakh')) is None
+    assert normalize_loan(generated_loan(max_amount=None)) is None
+    assert normalize_loan(generated_loan(interest_rate='nan')) is None
+    assert normalize_loan(generated_loan(upgrade_criteria={'min_credit_score': 'high', 'interest_reduction': 1})) is None
+
+
+def test_generated_loans_survive_a_disk_round_trip(tmp_path):
+    path = tmp_path / 'catalogue.json'
+    catalogue = LoanCatalogue({}, fetch_additional=lambda: [generated_loan()], path=path)
+    catalogue.refresh(wait=True)
+
+    reloaded = LoanCatalogue({}, path=path)
+    loan = reloaded.loans()['additional_loans'][0]
+    profile = {'credit_score': 80, 'monthly_income': 50000}
+    assert is_eligible(profile, loan)
+    assert upgrade_eligibility(profile, loan)['new_interest_rate'] == 12.0
+
+
+def test_failed_save_does_not_fail_the_refresh(tmp_path):
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    catalogue = LoanCatalogue({}, fetch_additional=lambda: [generated_loan()], path=blocker / 'catalogue.json')
+
+    assert catalogue.refresh(wait=True)
+    status = catalogue.status()
+    assert status['last_error'] is None and status['source'] == 'remote'
+    assert status['save_error']
+    assert catalogue.loans()['additional_loans'][0]['interest_rate'] == 13.5
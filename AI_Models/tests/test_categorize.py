@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pandas as pd
+
+from nanofin.core.categorize import DEFAULT_RULEBOOK, categorize_descriptions, get_categorizer, load_rulebook
+from nanofin.core.matcher import KeywordCategorizer
+from nanofin.core.reader import read_statement
+
+STATEMENTS = sorted((Path(__file__).resolve().parents[2] / 'JSON_Files').glob('*.json'))
+
+
+def first_match(categories, description, default='OTHERS'):
+    """The per-description loop the compiled matcher replaced"""
+    description = str(description).upper()
+    for category, keywords in categories.items():
+        if any(keyword in description for keyword in keywords):
+            return category
+    return default
+
+
+def test_compiled_categorizer_matches_keyword_loop():
+    rulebook = load_rulebook(DEFAULT_RULEBOOK)
+    categories = {c['name']: c.get('keywords', []) for c in rulebook['categories']}
+    descriptions = pd.concat(
+        [read_statement(path)[1]['description'] for path in STATEMENTS]
+        + [pd.Series(['STORETURNS', 'coffee refund', 'LOAN CREDIT', 'BILLRENT', '', None, 42])],
+        ignore_index=True,
+    )
+
+    labels = categorize_descriptions(descriptions, get_categorizer(DEFAULT_RULEBOOK))
+    assert labels.tolist() == [first_match(categories, d) for d in descriptions]
+
+
+def test_overlapping_keywords_keep_table_precedence():
+    categories = {'A': ['TURN'], 'B': ['RETURNS', 'STORE'], 'C': ['STORETURNS']}
+    categorizer = KeywordCategorizer(categories)
+    descriptions = pd.Series(['STORETURNS', 'RETURNS', 'STORE', 'XSTORETURNX', 'NOTHING'])
+
+    assert categorizer.categorize_series(descriptions).tolist() == [
+        first_match(categories, d) for d in descriptions
+    ]
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from nanofin.core.incremental import MetricsAccumulator
+from nanofin.core.metrics import calculate_financial_metrics
+from nanofin.core.reader import read_statement
+
+STATEMENTS = sorted((Path(__file__).resolve().parents[2] / 'JSON_Files').glob('*.json'))
+
+
+def assert_same_metrics(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if np.isnan(value):
+            assert np.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-6), key
+
+
+@pytest.mark.parametrize('chunk', [1, 7, 1000])
+def test_folding_chunks_matches_batch_metrics(chunk):
+    for path in STATEMENTS:
+        bank_data, df = read_statement(path)
+        summary = bank_data.get('summary', {})
+
+        acc = MetricsAccumulator(summary.get('opening_balance', 0), summary.get('closing_balance', 0))
+        for start in range(0, len(df), chunk):
+            acc.add_transactions(df.iloc[start:start + chunk])
+        assert_same_metrics(acc.metrics(), calculate_financial_metrics(df, summary))
+
+        restored = MetricsAccumulator.from_state(acc.to_state())
+        assert restored.score() == acc.score()
+
+
+def test_summary_without_closing_balance_matches_batch():
+    _, df = read_statement(STATEMENTS[0])
+    summary = {'opening_balance': 100.0}
+    acc = MetricsAccumulator.from_transactions(df, summary)
+    assert_same_metrics(acc.metrics(), calculate_financial_metrics(df, summary))
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from nanofin.insights.service import InsightService
+
+
+class StubGenerator:
+    """``generate(model, prompt)`` that counts calls and can block or fail"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, model, prompt):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        return f"{model}: {prompt.upper()}"
+
+
+def test_concurrent_requests_are_coalesced():
+    generate = StubGenerator()
+    generate.release.clear()
+    service = InsightService(generate)
+
+    futures = [service.submit("tips", model='stub') for _ in range(5)]
+    assert all(future is futures[0] for future in futures)
+    generate.release.set()
+
+    assert [future.result(timeout=5) for future in futures] == ["stub: TIPS"] * 5
+    assert generate.calls == 1
+    assert service.stats()['coalesced'] == 4
+
+
+def test_responses_are_cached_per_model_and_prompt():
+    generate = StubGenerator()
+    service = InsightService(generate)
+
+    assert service.cached("tips", model='stub') is None
+    assert service.get("tips", model='stub') == "stub: TIPS"
+    assert service.cached("tips", model='stub') == "stub: TIPS"
+
+    hit = service.submit("tips", model='stub')
+    assert hit.done() and hit.result() == "stub: TIPS"
+    service.get("tips", model='other')
+    assert generate.calls == 2
+
+
+def test_cached_responses_expire_and_evict():
+    generate = StubGenerator()
+    service = InsightService(generate, ttl=0.05, max_entries=2)
+
+    service.get("a", model='stub')
+    time.sleep(0.1)
+    assert service.cached("a", model='stub') is None
+
+    for prompt in ("a", "b", "c"):
+        service.get(prompt, model='stub')
+    assert service.cached("a", model='stub') is None
+    assert service.stats()['entries'] == 2
+
+
+def test_failures_are_raised_and_not_retried_until_retry_after():
+    generate = StubGenerator(fail=True)
+    service = InsightService(generate, retry_after=0.1)
+
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        service.get("tips", model='stub')
+    assert service.cached("tips", model='stub') is None
+    assert service.stats()['in_flight'] == 0
+
+    # Reruns inside the window get the same error without calling the model
+    generate.fail = False
+    failed = service.submit("tips", model='stub')
+    assert failed.done() and isinstance(failed.exception(), RuntimeError)
+    assert generate.calls == 1
+
+    time.sleep(0.15)
+    assert service.get("tips", model='stub') == "stub: TIPS"
+    assert generate.calls == 2
+    assert service.stats()['failures'] == 0
@@ -0,0 +1,61 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nanofin.core.metrics import calculate_financial_metrics, metrics_kernel
+from nanofin.core.reader import read_statement
+
+STATEMENTS = sorted((Path(__file__).resolve().parents[2] / 'JSON_Files').glob('*.json'))
+
+
+def pandas_metrics(df, summary_data):
+    """The pandas implementation the NumPy kernel replaced"""
+    credit_txns = len(df[df['credit'] > 0])
+    return {
+        'total_transactions': len(df),
+        'total_credits': df['credit'].sum(),
+        'total_debits': df['debit'].sum(),
+        'net_cashflow': df['credit'].sum() - df['debit'].sum(),
+        'opening_balance': float(summary_data.get('opening_balance', 0)),
+        'closing_balance': float(summary_data.get('closing_balance', 0)),
+        'avg_balance': df['balance'].mean(),
+        'balance_volatility': df['balance'].std(),
+        'avg_transaction_size': df['debit'][df['debit'] > 0].mean(),
+        'transaction_frequency': len(df) / 30,
+        'credit_frequency': credit_txns / max(len(df), 1),
+        'avg_credit_amount': df[df['credit'] > 0]['credit'].mean() if credit_txns > 0 else 0,
+    }
+
+
+def assert_same_metrics(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float) and math.isnan(value):
+            assert math.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-12, abs=1e-9), key
+
+
+def test_kernel_matches_pandas_on_sample_statements():
+    for path in STATEMENTS:
+        bank_data, df = read_statement(path)
+        summary = bank_data.get('summary', {})
+        assert_same_metrics(calculate_financial_metrics(df, summary), pandas_metrics(df, summary))
+
+
+def test_kernel_matches_pandas_on_edge_cases():
+    frames = [
+        pd.DataFrame({'credit': [], 'debit': [], 'balance': []}, dtype=np.float64),
+        pd.DataFrame({'credit': [5.0], 'debit': [0.0], 'balance': [5.0]}),
+        pd.DataFrame({'credit': [0.0, 0.0], 'debit': [3.0, 0.0], 'balance': [-3.0, -3.0]}),
+    ]
+    for df in frames:
+        summary = {'opening_balance': '10', 'closing_balance': 2}
+        assert_same_metrics(calculate_financial_metrics(df, summary), pandas_metrics(df, summary))
+        assert_same_metrics(
+            metrics_kernel(df['credit'].to_numpy(), df['debit'].to_numpy(), df['balance'].to_numpy(), '10', 2),
+            pandas_metrics(df, summary),
+        )
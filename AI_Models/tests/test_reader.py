@@ -0,0 +1,51 @@
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+
+from nanofin.core.ingest import prepare_transaction_data
+from nanofin.core.reader import read_statement
+
+STATEMENTS = sorted((Path(__file__).resolve().parents[2] / 'JSON_Files').glob('*.json'))
+
+
+def statement_bytes(transactions, **sections):
+    return json.dumps({**sections, 'transactions': transactions}).encode()
+
+
+def test_column_missing_from_one_chunk_matches_baseline():
+    transactions = [
+        {'date': '01-01-23', 'description': 'a', 'credit': 10.0, 'balance': 10.0},
+        {'date': '02-01-23', 'description': 'b', 'credit': 5.0, 'balance': 15.0},
+        {'date': '03-01-23', 'description': 'c', 'debit': 2.5, 'credit': 0.0, 'balance': 12.5},
+    ]
+    _, df = read_statement(io.BytesIO(statement_bytes(transactions)), chunk_size=2)
+    expected = prepare_transaction_data(transactions)
+
+    assert df['debit'].dtype == np.float64
+    assert df['debit'].tolist() == expected['debit'].tolist() == [0.0, 0.0, 2.5]
+    assert df['date'].tolist() == expected['date'].tolist()
+
+
+def test_small_read_sizes_split_numbers_cleanly():
+    raw = statement_bytes(
+        [{'date': '01-01-23', 'description': 'x', 'credit': 12.5, 'debit': 0.0, 'balance': 1234.75}],
+        summary={'opening_balance': 1222.25, 'closing_balance': 1234.75},
+        version=12.5,
+        flag=True,
+    )
+    expected_data, expected_df = read_statement(io.BytesIO(raw))
+    for read_size in range(1, 24):
+        bank_data, df = read_statement(io.BytesIO(raw), read_size=read_size)
+        assert bank_data == expected_data, read_size
+        assert df.equals(expected_df), read_size
+
+
+def test_sample_statements_at_small_read_sizes():
+    for path in STATEMENTS:
+        expected_data, expected_df = read_statement(path)
+        for read_size in (1, 3, 7, 9, 64):
+            bank_data, df = read_statement(path, read_size=read_size, chunk_size=5)
+            assert bank_data == expected_data, (path.name, read_size)
+            assert df.equals(expected_df), (path.name, read_size)
@@ -0,0 +1,34 @@
+from nanofin.reviews import cache as cache_module
+from nanofin.reviews.cache import CACHE_ENV_VAR, ReviewCache, get_review_cache
+
+
+def fresh_registry(monkeypatch, path):
+    monkeypatch.setenv(CACHE_ENV_VAR, str(path))
+    monkeypatch.setattr(cache_module, '_default_cache', None)
+    monkeypatch.setattr(cache_module, '_unusable_paths', set())
+
+
+def test_review_cache_round_trip(tmp_path, monkeypatch):
+    fresh_registry(monkeypatch, tmp_path / 'reviews.sqlite3')
+    cache = get_review_cache()
+    assert isinstance(cache, ReviewCache) and get_review_cache() is cache
+
+    cache.put_search("Ravi  Tailors", "https://example.com/ravi")
+    assert cache.get_search("ravi tailors") == (True, "https://example.com/ravi")
+
+
+def test_unwritable_cache_directory_falls_back_to_no_cache(tmp_path, monkeypatch, capsys):
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    fresh_registry(monkeypatch, blocker / 'reviews.sqlite3')
+
+    assert get_review_cache() is None
+    assert get_review_cache() is None
+    assert capsys.readouterr().out.count('[WARNING]') == 1
+
+
+def test_corrupt_cache_file_falls_back_to_no_cache(tmp_path, monkeypatch):
+    path = tmp_path / 'reviews.sqlite3'
+    path.write_bytes(b'definitely not sqlite' * 100)
+    fresh_registry(monkeypatch, path)
+    assert get_review_cache() is None
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nanofin.core.metrics import calculate_financial_metrics
+from nanofin.core.reader import read_statement
+from nanofin.core.scoring import SCORE_COMPONENTS, calculate_nano_entrepreneur_score, score_batch
+
+STATEMENTS = sorted((Path(__file__).resolve().parents[2] / 'JSON_Files').glob('*.json'))
+
+
+def sample_metrics():
+    metrics = []
+    for path in STATEMENTS:
+        bank_data, df = read_statement(path)
+        metrics.append(calculate_financial_metrics(df, bank_data.get('summary', {})))
+    return metrics
+
+
+def random_metrics(count, seed=7):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(count):
+        row = {
+            'total_transactions': int(rng.integers(0, 200)),
+            'credit_frequency': rng.uniform(0, 3),
+            'avg_credit_amount': rng.choice([0.0, 9999.0, 10000.0, 10001.0, rng.uniform(0, 50000)]),
+            'net_cashflow': rng.normal(0, 1000),
+            'avg_balance': rng.normal(5000, 5000),
+            'balance_volatility': rng.choice([np.nan, rng.uniform(0, 5000)]),
+            'transaction_frequency': rng.choice([0.5, rng.uniform(0, 2)]),
+            'avg_transaction_size': rng.choice([np.nan, rng.uniform(0, 20000)]),
+            'opening_balance': rng.normal(5000, 1000),
+            'closing_balance': rng.normal(5000, 1000),
+            'total_credits': rng.uniform(0, 1e5),
+            'total_debits': rng.uniform(0, 1e5),
+        }
+        rows.append(row)
+    return rows
+
+
+def test_score_batch_matches_scalar_scoring():
+    metrics = sample_metrics() + random_metrics(500)
+    batch = score_batch(pd.DataFrame(metrics))
+
+    for i, row in enumerate(metrics):
+        expected = calculate_nano_entrepreneur_score(row)
+        assert batch['score'].iloc[i] == expected['score'], i
+        for label, column in SCORE_COMPONENTS.items():
+            assert batch[column].iloc[i] == expected['breakdown'][label], (i, label)
+
+
+def test_score_batch_keeps_the_frame_index():
+    frame = pd.DataFrame(sample_metrics(), index=[p.stem for p in STATEMENTS])
+    assert score_batch(frame).index.tolist() == frame.index.tolist()
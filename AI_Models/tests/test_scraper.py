@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from nanofin.reviews import scraper as scraper_module
+from nanofin.reviews.scraper import AsyncReviewScraper
+
+REVIEW = "Great service and friendly staff, would definitely come back again."
+
+
+def review_site(state):
+    """Stand-in for Bing plus review pages; ``state`` records concurrency"""
+
+    async def search(request):
+        name = request.query['q'].rsplit(' ', 1)[0].replace(' ', '-')
+        return web.Response(text=f'<a href="/reviews/{name}">Reviews</a>', content_type='text/html')
+
+    async def reviews(request):
+        name = request.match_info['name']
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        try:
+            if name.startswith('slow'):
+                await asyncio.sleep(2)
+            else:
+                await asyncio.sleep(0.05)
+        finally:
+            state['in_flight'] -= 1
+        if name.startswith('down'):
+            return web.Response(status=404)
+        if name.startswith('garbled'):
+            return web.Response(body=b'<p>' + b'\xff\xfe' * 40 + b'</p>',
+                                headers={'Content-Type': 'text/html; charset=utf-8'})
+        return web.Response(text=f'<p>{name}: {REVIEW}</p>', content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/search', search)
+    app.router.add_get('/reviews/{name}', reviews)
+    return app
+
+
+def scrape(queries, **kwargs):
+    """Run the scraper against a local review site; returns ``(results, state, seconds)``"""
+    state = {'in_flight': 0, 'max_in_flight': 0}
+
+    async def run():
+        server = TestServer(review_site(state))
+        await server.start_server()
+        try:
+            base = str(server.make_url('')).rstrip('/')
+            kwargs.setdefault('backoff', 0.01)
+            async with AsyncReviewScraper(search_base=base, **kwargs) as scraper:
+                started = time.monotonic()
+                results = await scraper.review_many(queries)
+                return results, time.monotonic() - started
+        finally:
+            await server.close()
+
+    results, seconds = asyncio.run(run())
+    return results, state, seconds
+
+
+def test_results_keep_input_order():
+    queries = [f"shop {i}" for i in range(5)]
+    results, _, _ = scrape(queries)
+    assert [result['name'] for result in results] == queries
+    assert all(result['error'] is None for result in results)
+    assert results[3]['reviews'] == [f"shop-3: {REVIEW}"]
+
+
+def test_reviews_are_scored_off_the_event_loop():
+    from nanofin.reviews.sentiment import score_reviews
+
+    results, _, _ = scrape(["shop 1"], score_reviews=score_reviews)
+    assert results[0]['reviews'] == score_reviews([f"shop-1: {REVIEW}"])
+
+
+def test_per_host_limit_caps_concurrent_requests():
+    results, state, _ = scrape([f"shop {i}" for i in range(8)], per_host_limit=2)
+    assert all(result['error'] is None for result in results)
+    assert state['max_in_flight'] == 2
+
+
+def test_timeout_only_fails_the_slow_business():
+    results, _, seconds = scrape(["slow shop", "shop 1", "shop 2"], timeout=0.3, retries=0)
+    assert "TimeoutError" in results[0]['error']
+    assert [result['error'] for result in results[1:]] == [None, None]
+    assert seconds < 1.5
+
+
+def test_waiting_for_a_pooled_connection_is_not_timed():
+    # 30 pages at 50 ms through 2 connections queue far longer than the timeout
+    results, state, seconds = scrape([f"shop {i}" for i in range(30)], per_host_limit=2, timeout=0.3, retries=0)
+    assert [result['error'] for result in results] == [None] * 30
+    assert state['max_in_flight'] == 2
+    assert seconds > 0.3
+
+
+def test_bad_hosts_do_not_abort_the_batch(monkeypatch):
+    extract = scraper_module.extract_review_texts
+
+    def fragile_extract(html, limit=None):
+        if 'broken' in html:
+            raise ValueError("unexpected page layout")
+        return extract(html, limit=limit)
+
+    monkeypatch.setattr(scraper_module, 'extract_review_texts', fragile_extract)
+    results, _, _ = scrape(["down shop", "garbled shop", "broken shop", "shop 1"], retries=0)
+
+    down, garbled, broken, good = results
+    assert "404" in down['error']
+    assert garbled['error'] is None and garbled['reviews']
+    assert broken['error'] == "ValueError: unexpected page layout"
+    assert good['error'] is None and good['reviews'] == [f"shop-1: {REVIEW}"]
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('textblob')
+from textblob import TextBlob
+
+from nanofin.reviews import sentiment as sentiment_module
+from nanofin.reviews.sentiment import ascore_reviews, get_scoring_executor, score_reviews, score_texts
+
+TEXTS = ["Great service!", "Terrible, slow and rude.", "It was okay.", "Great service!", ""]
+
+
+def test_scores_match_textblob():
+    assert score_texts(TEXTS).tolist() == [TextBlob(text).sentiment.polarity for text in TEXTS]
+
+
+def test_large_batches_reuse_one_shared_pool():
+    texts = [f"{i} {text}" for i in range(40) for text in TEXTS]
+    expected = score_texts(texts, workers=1)
+
+    assert score_texts(texts, workers=2, parallel_threshold=10).tolist() == expected.tolist()
+    executor = get_scoring_executor(2)
+    assert score_texts(texts, workers=2, parallel_threshold=10).tolist() == expected.tolist()
+    assert get_scoring_executor(2) is executor
+
+
+def test_small_batches_never_start_a_pool(monkeypatch):
+    monkeypatch.setattr(sentiment_module, 'get_scoring_executor', None)
+    assert len(score_texts(TEXTS, workers=4)) == len(TEXTS)
+
+
+def test_async_scoring_matches_sync():
+    assert asyncio.run(ascore_reviews(TEXTS)) == score_reviews(TEXTS)
@@ -0,0 +1,57 @@
+import time
+
+from nanofin.services.status import ServiceStatusProbe
+
+
+class StubProbe(ServiceStatusProbe):
+    """Probe whose answers come from a dict instead of the network"""
+
+    def __init__(self, running, **kwargs):
+        super().__init__(**kwargs)
+        self.running = running
+        self.calls = 0
+
+    def probe(self, port):
+        self.calls += 1
+        time.sleep(0.05)
+        return self.running.get(port, False)
+
+
+def test_unprobed_ports_have_no_check_time():
+    probe = StubProbe({8501: True})
+    assert probe.checked_at([8501, 8502]) is None
+    probe.statuses([8501])
+    assert probe.checked_at([8501, 8502]) is None
+    probe.statuses([8501, 8502])
+    assert time.time() - probe.checked_at([8501, 8502]) < 5
+
+
+def test_results_are_cached_within_ttl():
+    probe = StubProbe({8501: True}, ttl=60)
+    assert probe.statuses([8501, 8502]) == {8501: True, 8502: False}
+    assert probe.statuses([8501, 8502]) == {8501: True, 8502: False}
+    assert probe.calls == 2
+
+
+def test_refresh_waits_for_fresh_results():
+    running = {8501: True}
+    probe = StubProbe(running, ttl=60)
+    assert probe.statuses([8501]) == {8501: True}
+
+    running[8501] = False
+    probe.invalidate()
+    assert probe.checked_at([8501]) is None
+    assert probe.statuses([8501], wait=True) == {8501: False}
+
+
+def test_invalidate_during_a_probe_does_not_lose_cached_ports():
+    class InvalidatingProbe(StubProbe):
+        def probe(self, port):
+            if port == 8502:
+                self.invalidate()  # e.g. a refresh click in another session
+            return super().probe(port)
+
+    probe = InvalidatingProbe({8501: True, 8502: True}, ttl=60)
+    assert probe.statuses([8501]) == {8501: True}
+    assert probe.statuses([8501, 8502]) == {8501: False, 8502: True}
+    assert probe.statuses([8501], wait=True) == {8501: True}
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from nanofin.core import store as store_module
+from nanofin.core.store import StatementStore, get_statement_store, statement_digest
+
+STATEMENTS = sorted((Path(__file__).resolve().parents[2] / 'JSON_Files').glob('*.json'))
+
+
+def test_store_round_trip(tmp_path):
+    store = StatementStore(tmp_path)
+    bank_data, df = store.load(STATEMENTS[0])
+    digest = statement_digest(STATEMENTS[0])
+    assert digest in store
+
+    cached_data, cached_df = store.get(digest)
+    assert cached_data == bank_data
+    assert cached_df['description'].tolist() == df['description'].tolist()
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = StatementStore(tmp_path)
+    digests = []
+    for i, path in enumerate(STATEMENTS):
+        store.load(path)
+        digest = statement_digest(path)
+        os.utime(store.path_for(digest), (1000 + i, 1000 + i))
+        digests.append(digest)
+
+    sizes = {digest: store.path_for(digest).stat().st_size for digest in digests}
+    store.max_bytes = sum(sizes.values()) - 1
+    store.evict()
+    assert digests[0] not in store
+    assert all(digest in store for digest in digests[1:])
+
+
+def test_store_write_failure_is_a_miss(tmp_path, monkeypatch):
+    store = StatementStore(tmp_path)
+
+    def refuse(src, dst):
+        raise PermissionError("file is mapped by another process")
+
+    monkeypatch.setattr(store_module.os, 'replace', refuse)
+    bank_data, df = store.load(STATEMENTS[0])
+    assert len(df)
+    assert statement_digest(STATEMENTS[0]) not in store
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_store_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv('NANOFIN_STATEMENT_STORE', 'off')
+    assert not get_statement_store().enabled
+
+    monkeypatch.setenv('NANOFIN_STATEMENT_STORE', str(tmp_path))
+    store = get_statement_store()
+    assert store.enabled and store.root == tmp_path
+
+    store = StatementStore(tmp_path, disabled=True)
+    bank_data, df = store.load(STATEMENTS[0])
+    assert len(df)
+    assert not list(tmp_path.glob('*.arrow'))
+
+
+def test_analyze_statement_uses_an_empty_cache_it_is_given(tmp_path, monkeypatch):
+    from nanofin.core import ResultCache, analyze_statement
+
+    monkeypatch.setenv('NANOFIN_STATEMENT_STORE', str(tmp_path))
+    cache = ResultCache()
+    analysis = analyze_statement(STATEMENTS[0], cache=cache)
+    assert len(cache) == 1
+    assert analyze_statement(STATEMENTS[0], cache=cache) is analysis
@@ -0,0 +1,59 @@
+import time
+
+from nanofin.insights.service import InsightService
+from nanofin.insights.tips import RETRY_AFTER, TipBundleStore, bundle_keys, tips_prompt
+
+
+class CountingGenerator:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    def __call__(self, model, prompt):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("Gemini unavailable")
+        return f"tips for {prompt[-20:]}"
+
+
+def test_lazily_stored_bundles_are_not_stale(tmp_path):
+    store = TipBundleStore(tmp_path / 'tips.json')
+    store.put('English', 'good', "Pay on time")
+    store.save()
+    assert not store.is_stale()
+    assert not TipBundleStore(tmp_path / 'tips.json').is_stale()
+
+
+def test_built_store_goes_stale_after_max_age(tmp_path):
+    store = TipBundleStore(tmp_path / 'tips.json', max_age=60)
+    generate = CountingGenerator()
+    assert store.build(generate) == len(bundle_keys())
+
+    assert not store.is_stale()
+    assert store.is_stale(now=time.time() + RETRY_AFTER + 61)
+    assert TipBundleStore(tmp_path / 'tips.json', max_age=60).is_stale(now=time.time() + 61)
+
+
+def test_failed_refresh_backs_off(tmp_path):
+    TipBundleStore(tmp_path / 'tips.json').build(CountingGenerator())
+    store = TipBundleStore(tmp_path / 'tips.json', max_age=60)
+    later = time.time() + 61
+    assert store.is_stale(now=later)
+
+    failing = CountingGenerator(fail=True)
+    assert store.refresh(failing) == 0
+    assert failing.calls == len(bundle_keys())
+    assert store.last_error
+    assert not store.is_stale(now=later)
+    assert store.is_stale(now=later + RETRY_AFTER)
+
+
+def test_refresh_through_insight_service_shares_its_cache(tmp_path):
+    generate = CountingGenerator()
+    service = InsightService(generate)
+    service.get(tips_prompt('Hindi', 'good'), model='stub')
+
+    store = TipBundleStore(tmp_path / 'tips.json')
+    assert store.refresh(service.generator(), model='stub') == len(bundle_keys())
+    assert generate.calls == len(bundle_keys())
+    assert service.stats()['hits'] == 1
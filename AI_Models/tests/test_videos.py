@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+
+from nanofin.insights import videos as videos_module
+from nanofin.insights.videos import VideoRecommendations
+
+
+def result(video_id):
+    return {'id': video_id, 'title': f"Video {video_id}", 'channel': "NanoFin",
+            'thumbnails': [f"https://img/{video_id}.jpg"]}
+
+
+class StubSearch:
+    """``search(query, max_results)`` that counts calls and can block or fail"""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, query, max_results):
+        self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise ConnectionError("YouTube unreachable")
+        return [result(f"{self.calls}-{i}") for i in range(max_results)]
+
+
+def wait_idle(recommendations):
+    deadline = time.time() + 5
+    while recommendations._in_flight and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_concurrent_requests_share_one_search():
+    search = StubSearch()
+    search.release.clear()
+    recommendations = VideoRecommendations(search=search, max_results=2)
+
+    futures = [recommendations.submit("credit", 'Hindi') for _ in range(5)]
+    assert recommendations.get("credit", 'Hindi') is None
+    search.release.set()
+
+    results = [future.result(timeout=5) for future in futures]
+    assert search.calls == 1
+    assert all(videos == results[0] for videos in results)
+    assert results[0][0]['link'] == "https://youtube.com/watch?v=1-0"
+
+
+def test_cached_results_are_served_until_ttl_expires():
+    search = StubSearch()
+    recommendations = VideoRecommendations(search=search, ttl=0.2, max_results=1)
+
+    first = recommendations.submit("credit").result(timeout=5)
+    cached = recommendations.submit("credit")
+    assert cached.done() and cached.result() == first
+    assert search.calls == 1
+
+    time.sleep(0.3)
+    # Stale entries are served while the refresh runs in the background
+    assert recommendations.get("credit") == first
+    wait_idle(recommendations)
+    assert search.calls == 2
+    assert recommendations.get("credit") != first
+
+
+def test_failed_search_keeps_old_results_and_backs_off(monkeypatch):
+    monkeypatch.setattr(videos_module, 'RETRY_AFTER', 0.2)
+    search = StubSearch()
+    recommendations = VideoRecommendations(search=search, ttl=0.1, max_results=1)
+    first = recommendations.submit("credit").result(timeout=5)
+
+    search.fail = True
+    time.sleep(0.15)
+    assert recommendations.get("credit") == first
+    wait_idle(recommendations)
+    assert search.calls == 2
+    assert "YouTube unreachable" in recommendations.last_error
+
+    # Within RETRY_AFTER the old results are served without searching again
+    assert recommendations.submit("credit").result(timeout=5) == first
+    wait_idle(recommendations)
+    assert search.calls == 2
+
+    search.fail = False
+    time.sleep(0.25)
+    recommendations.get("credit")
+    wait_idle(recommendations)
+    assert search.calls == 3
+    assert recommendations.get("credit") != first
+
+
+def test_failed_first_search_raises():
+    search = StubSearch()
+    search.fail = True
+    recommendations = VideoRecommendations(search=search)
+    with pytest.raises(ConnectionError):
+        recommendations.submit("credit").result(timeout=5)
@@ -1,11 +1,11 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import json
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import re
+
+from nanofin.core import analyze_statement
 
 # Page configuration
 st.set_page_config(
@@ -15,97 +15,6 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# ============= UTILITY FUNCTIONS =============
-
-def clean_date(date_str):
-    """Clean date string by removing INB suffix if present"""
-    return re.sub(r'INB$', '', date_str)
-
-def prepare_transaction_data(transactions):
-    df = pd.DataFrame(transactions)
-    df['date'] = df['date'].apply(clean_date)
-    df['date'] = pd.to_datetime(df['date'], format='%d-%m-%y')
-    df['month'] = df['date'].dt.month
-    df['day_of_week'] = df['date'].dt.dayofweek
-    
-    df['credit'] = pd.to_numeric(df['credit'], errors='coerce').fillna(0)
-    df['debit'] = pd.to_numeric(df['debit'], errors='coerce').fillna(0)
-    df['balance'] = pd.to_numeric(df['balance'], errors='coerce').fillna(0)
-    
-    return df
-
-def categorize_transactions(description):
-    """Enhanced transaction categorization"""
-    categories = {
-        'BUSINESS_INCOME': ['SALARY', 'INVESTMENT', 'BONUS', 'RETURNS', 'CREDIT'],
-        'BUSINESS_EXPENSE': ['UTILITY', 'BILL', 'SHOPPING', 'STORE'],
-        'PERSONAL_EXPENSE': ['COFFEE', 'FOOD', 'BEVERAGES'],
-        'TRANSFER': ['RENT', 'TRANSFER', 'REFUND'],
-        'OTHERS': []
-    }
-    
-    description = str(description).upper()
-    for category, keywords in categories.items():
-        if any(keyword in description for keyword in keywords):
-            return category
-    return 'OTHERS'
-
-def calculate_financial_metrics(df, summary_data):
-    metrics = {}
-    
-    metrics['total_transactions'] = len(df)
-    metrics['total_credits'] = df['credit'].sum()
-    metrics['total_debits'] = df['debit'].sum()
-    metrics['net_cashflow'] = metrics['total_credits'] - metrics['total_debits']
-    
-    metrics['opening_balance'] = float(summary_data.get('opening_balance', 0))
-    metrics['closing_balance'] = float(summary_data.get('closing_balance', 0))
-    metrics['avg_balance'] = df['balance'].mean()
-    metrics['balance_volatility'] = df['balance'].std()
-    
-    metrics['avg_transaction_size'] = df['debit'][df['debit'] > 0].mean()
-    metrics['transaction_frequency'] = len(df) / 30
-    
-    credit_txns = len(df[df['credit'] > 0])
-    metrics['credit_frequency'] = credit_txns / max(len(df), 1)
-    metrics['avg_credit_amount'] = df[df['credit'] > 0]['credit'].mean() if credit_txns > 0 else 0
-    
-    return metrics
-
-def calculate_nano_entrepreneur_score(metrics):
-    """Custom scoring for nano-entrepreneurs"""
-    income_stability = min(
-        metrics['credit_frequency'] * 20 +
-        (metrics['avg_credit_amount'] > 10000) * 20
-    , 40)
-    
-    business_resilience = min(
-        (metrics['net_cashflow'] > 0) * 20 +
-        (metrics['balance_volatility'] < metrics['avg_balance'] * 0.3) * 10
-    , 30)
-    
-    transaction_discipline = min(
-        (metrics['transaction_frequency'] > 0.5) * 10 +
-        (metrics['avg_transaction_size'] < metrics['avg_credit_amount'] * 0.5) * 10
-    , 20)
-    
-    growth_potential = min(
-        (metrics['closing_balance'] > metrics['opening_balance']) * 5 +
-        (metrics['total_credits'] > metrics['total_debits']) * 5
-    , 10)
-    
-    nano_score = income_stability + business_resilience + transaction_discipline + growth_potential
-    
-    return {
-        'score': min(max(nano_score, 0), 100),
-        'breakdown': {
-            'Income Stability': income_stability,
-            'Business Resilience': business_resilience,
-            'Transaction Discipline': transaction_discipline,
-            'Growth Potential': growth_potential
-        }
-    }
-
 # ============= PAGE HEADER =============
 
 st.markdown("""
@@ -147,17 +56,15 @@ with st.sidebar:
 
 if uploaded_file is not None:
     try:
-        data = json.load(uploaded_file)
+        # Reruns for the same statement reuse the cached frame, metrics and score
+        analysis = analyze_statement(uploaded_file)
+        data = analysis['bank_data']
+        df = analysis['df']
+        metrics = analysis['metrics']
+        nano_score = analysis['nano_score']
         
         personal_info = data.get('personal_info', {})
         account_info = data.get('account_info', {})
-        transactions = data.get('transactions', [])
-        summary_data = data.get('summary', {})
-        
-        # Prepare data
-        df = prepare_transaction_data(transactions)
-        metrics = calculate_financial_metrics(df, summary_data)
-        nano_score = calculate_nano_entrepreneur_score(metrics)
         
         # Create tabs
         tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -262,7 +169,6 @@ if uploaded_file is not None:
             
             with col1:
                 st.subheader("💳 Transaction Categories")
-                df['category'] = df['description'].apply(categorize_transactions)
                 category_counts = df['category'].value_counts()
                 fig = px.pie(values=category_counts.values, names=category_counts.index,
                             title='Transaction Distribution')